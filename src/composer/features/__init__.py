@@ -1,3 +1,6 @@
-from composer.features.compute import compute_feature_snapshot
+from composer.features.compute import (
+    compute_feature_snapshot,
+    compute_feature_snapshot_from_columns,
+)
 
-__all__ = ["compute_feature_snapshot"]
+__all__ = ["compute_feature_snapshot", "compute_feature_snapshot_from_columns"]
@@ -11,6 +11,7 @@ from composer.contracts.feature_snapshot import (
     FeatureSnapshot,
 )
 from composer.contracts.ordering import ordered_feature_items
+from market_data.columnar import MISSING_TS, SIDE_BUY, SIDE_SELL, ColumnarEventStore
 from market_data.contracts import RawMarketEvent
 
 WINDOW_3M_MS = 180_000
@@ -259,6 +260,135 @@ def compute_feature_snapshot(
     atr_z_50 = _atr_z_50(true_ranges)
     open_interest_latest = _open_interest_latest(events, symbol=symbol)
 
+    return _feature_snapshot(
+        symbol=symbol,
+        engine_timestamp_ms=engine_timestamp_ms,
+        price_last=price_last,
+        vwap_3m=vwap_3m,
+        atr_14=atr_14,
+        atr_z_50=atr_z_50,
+        cvd_3m=cvd_3m,
+        aggressive_ratio=aggressive_ratio,
+        open_interest_latest=open_interest_latest,
+    )
+
+
+def compute_feature_snapshot_from_columns(
+    store: ColumnarEventStore,
+    *,
+    symbol: str,
+    engine_timestamp_ms: int,
+    start_seq: int,
+    end_seq: int,
+) -> FeatureSnapshot:
+    """Same features as `compute_feature_snapshot` over the seq range's columns."""
+    trades = store.range_by_seq("TradeTick", symbol=symbol, start_seq=start_seq, end_seq=end_seq)
+    ts = trades["ts"]
+    prices = trades["price"]
+    quantities = trades["quantity"]
+    sides = trades["side"]
+
+    price_last = None
+    for index in range(len(ts) - 1, -1, -1):
+        trade_ts = ts[index]
+        price = prices[index]
+        if trade_ts != MISSING_TS and trade_ts <= engine_timestamp_ms and price == price:
+            price_last = price
+            break
+
+    start_ms = engine_timestamp_ms - WINDOW_3M_MS
+    total_qty = total_notional = 0.0
+    buy_qty = sell_qty = 0.0
+    cvd_total = 0.0
+    cvd_eligible = 0
+    for trade_ts, price, qty, side in zip(ts, prices, quantities, sides, strict=True):
+        if trade_ts < start_ms or trade_ts > engine_timestamp_ms:
+            continue
+        # NaN fails every comparison, so missing quantities are skipped here.
+        if not qty > 0.0:
+            continue
+        if price == price:
+            total_qty += qty
+            total_notional += price * qty
+        if side == SIDE_BUY:
+            cvd_eligible += 1
+            cvd_total += qty
+            buy_qty += qty
+        elif side == SIDE_SELL:
+            cvd_eligible += 1
+            cvd_total -= qty
+            sell_qty += qty
+    vwap_3m = total_notional / total_qty if total_qty > 0.0 else None
+    cvd_3m = cvd_total if cvd_eligible else None
+    aggressive_total = buy_qty + sell_qty
+    aggressive_ratio = buy_qty / aggressive_total if aggressive_total > 0.0 else None
+
+    candle_columns = store.range_by_seq(
+        "Candle", symbol=symbol, start_seq=start_seq, end_seq=end_seq
+    )
+    candles = [
+        (candle_ts, seq, high, low, close)
+        for candle_ts, seq, high, low, close, interval_ms, is_final in zip(
+            candle_columns["ts"],
+            candle_columns["seq"],
+            candle_columns["high"],
+            candle_columns["low"],
+            candle_columns["close"],
+            candle_columns["interval_ms"],
+            candle_columns["is_final"],
+            strict=True,
+        )
+        if candle_ts != MISSING_TS
+        and candle_ts <= engine_timestamp_ms
+        and interval_ms == WINDOW_3M_MS
+        and is_final
+        and high == high
+        and low == low
+        and close == close
+    ]
+    candles.sort(key=lambda item: (item[0], item[1]))
+    atr_14, true_ranges = _atr_14(candles)
+
+    open_interest = store.range_by_seq(
+        "OpenInterest", symbol=symbol, start_seq=start_seq, end_seq=end_seq
+    )
+    best_value: float | None = None
+    best_ts: int | None = None
+    fallback_value: float | None = None
+    for oi_ts, value in zip(open_interest["ts"], open_interest["open_interest"], strict=True):
+        if value != value:
+            continue
+        if oi_ts == MISSING_TS:
+            fallback_value = value
+        elif best_ts is None or oi_ts >= best_ts:
+            best_ts = oi_ts
+            best_value = value
+
+    return _feature_snapshot(
+        symbol=symbol,
+        engine_timestamp_ms=engine_timestamp_ms,
+        price_last=price_last,
+        vwap_3m=vwap_3m,
+        atr_14=atr_14,
+        atr_z_50=_atr_z_50(true_ranges),
+        cvd_3m=cvd_3m,
+        aggressive_ratio=aggressive_ratio,
+        open_interest_latest=best_value if best_ts is not None else fallback_value,
+    )
+
+
+def _feature_snapshot(
+    *,
+    symbol: str,
+    engine_timestamp_ms: int,
+    price_last: float | None,
+    vwap_3m: float | None,
+    atr_14: float | None,
+    atr_z_50: float | None,
+    cvd_3m: float | None,
+    aggressive_ratio: float | None,
+    open_interest_latest: float | None,
+) -> FeatureSnapshot:
     features: Mapping[str, float | None] = {
         "price_last": price_last,
         "vwap_3m": vwap_3m,
@@ -1,3 +1,3 @@
-from composer.legacy_snapshot.builder import build_legacy_snapshot
+from composer.legacy_snapshot.builder import SNAPSHOT_EVENT_TYPE, build_legacy_snapshot
 
-__all__ = ["build_legacy_snapshot"]
+__all__ = ["SNAPSHOT_EVENT_TYPE", "build_legacy_snapshot"]
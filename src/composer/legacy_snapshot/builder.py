@@ -17,6 +17,9 @@ from regime_engine.contracts.snapshots import (
 )
 from regime_engine.state.evidence import EvidenceSnapshot
 
+# The only raw event type `build_legacy_snapshot` reads.
+SNAPSHOT_EVENT_TYPE = "SnapshotInputs"
+
 
 def build_legacy_snapshot(
     raw_events: Iterable[RawMarketEvent],
@@ -55,7 +58,7 @@ def _select_snapshot_event(
 ) -> RawMarketEvent | None:
     selected: RawMarketEvent | None = None
     for event in raw_events:
-        if event.event_type != "SnapshotInputs":
+        if event.event_type != SNAPSHOT_EVENT_TYPE:
             continue
         if event.symbol != symbol:
             continue
@@ -4,10 +4,12 @@ from market_data.adapter import (
     Adapter,
     AdapterState,
     AdapterSupervisor,
+    AsyncAdapter,
     StreamKey,
 )
 from market_data.config import (
     BackpressureConfig,
+    DecodeFailureCoalescingConfig,
     MarketDataConfig,
     OperationalLimits,
     RetryPolicy,
@@ -23,16 +25,25 @@ from market_data.contracts import (
     RawMarketEvent,
 )
 from market_data.decoder import decode_and_ingest
+from market_data.journal import JournalReader, RawEventJournal
 from market_data.observability import NullLogger, NullMetrics, Observability, StdlibLogger
-from market_data.pipeline import IngestionPipeline
+from market_data.pipeline import IngestionPipeline, IngestItem
+from market_data.queue_sink import QueueRawEventSink
 from market_data.serialization import deserialize_event, serialize_event
-from market_data.sink import BackpressureError, RawEventSink
+from market_data.sink import (
+    BackpressureError,
+    BatchRawEventSink,
+    BoundedRawEventSink,
+    RawEventSink,
+)
 
 __all__ = [
     "BackpressureConfig",
+    "DecodeFailureCoalescingConfig",
     "Adapter",
     "AdapterState",
     "AdapterSupervisor",
+    "AsyncAdapter",
     "StreamKey",
     "MarketDataConfig",
     "OperationalLimits",
@@ -40,6 +51,7 @@ __all__ = [
     "SourceConfig",
     "validate_config",
     "IngestionPipeline",
+    "IngestItem",
     "decode_and_ingest",
     "NullLogger",
     "NullMetrics",
@@ -55,4 +67,9 @@ __all__ = [
     "RawMarketEvent",
     "BackpressureError",
     "RawEventSink",
+    "BoundedRawEventSink",
+    "BatchRawEventSink",
+    "QueueRawEventSink",
+    "JournalReader",
+    "RawEventJournal",
 ]
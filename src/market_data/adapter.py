@@ -31,6 +31,10 @@ class Adapter(Protocol):
     def stop(self) -> None: ...
 
 
+class AsyncAdapter(Adapter, Protocol):
+    async def run_async(self) -> None: ...
+
+
 @dataclass
 class AdapterStatus:
     state: AdapterState = AdapterState.CREATED
@@ -1,42 +1,46 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import threading
 import time
-import urllib.request
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 
 import websockets
 
 from market_data.adapter import AdapterSupervisor, StreamKey
 from market_data.config import RetryPolicy
 from market_data.contracts import RawMarketEvent
+from market_data.decode_pool import DecodeWorkerPool
+from market_data.http_client import HttpStatusError, PooledHttpClient
+from market_data.json_backend import get_json_backend
 from market_data.observability import NullLogger, NullMetrics, Observability
-from market_data.pipeline import IngestionPipeline
+from market_data.pipeline import IngestionPipeline, IngestItem
+from market_data.sharding import assign_shards, required_shard_count
 from market_data.sink import BackpressureError
 
+from .compiled import (
+    CompiledDecoder,
+    decode_agg_trade_fast,
+    decode_book_ticker_fast,
+    decode_depth_fast,
+    decode_force_order_fast,
+    decode_kline_fast,
+    decode_mark_price_fast,
+    decode_open_interest_fast,
+)
 from .config import (
     BinanceAggTradeConfig,
     BinanceBookTickerConfig,
+    BinanceCombinedStreamConfig,
     BinanceDepthConfig,
     BinanceForceOrderConfig,
     BinanceKlineConfig,
     BinanceMarkPriceConfig,
     BinanceOpenInterestConfig,
 )
-from .decoder import (
-    DecodedEvent,
-    DecodedEvents,
-    DecodeError,
-    decode_agg_trade,
-    decode_book_ticker,
-    decode_depth,
-    decode_force_order,
-    decode_kline,
-    decode_mark_price,
-    decode_open_interest,
-)
+from .decoder import DecodeError
 
 
 @dataclass(frozen=True)
@@ -53,6 +57,7 @@ class _AdapterConfig:
 
 class _BinanceWsAdapter:
     stream_key: StreamKey
+    _decoder: CompiledDecoder
 
     def __init__(
         self,
@@ -73,86 +78,134 @@ class _BinanceWsAdapter:
         )
         self._supervisor = AdapterSupervisor(self.stream_key, config.retry)
         self._running = False
+        self._json_loads = get_json_backend().loads
+        self._decode_pool: DecodeWorkerPool | None = None
+        self._decode_worker = 0
+        self._worker_error: Exception | None = None
+        self._frame_observer: Callable[[int], None] | None = None
+
+    @property
+    def stream(self) -> str:
+        return self._config.stream
 
     def start(self) -> None:
         self._running = True
 
+    def attach_decode_pool(self, pool: DecodeWorkerPool) -> None:
+        """Hand frames to `pool` instead of decoding them on the receive loop."""
+        self._decode_pool = pool
+        self._decode_worker = pool.register()
+
+    def attach_frame_observer(self, observer: Callable[[int], None]) -> None:
+        """Call `observer` with `time.perf_counter_ns()` as each frame is received,
+        before it is decoded; used to measure receive-to-delivery latency."""
+        self._frame_observer = observer
+
     def run(self) -> None:
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
         self._supervisor.record_start()
         while self._running:
             try:
-                asyncio.run(self._consume_stream())
+                await self._consume_stream()
+            except asyncio.CancelledError:
+                self._supervisor.record_stop()
+                raise
             except BackpressureError as exc:
                 self._supervisor.record_failure(exc)
-                self._observability.log_transport_state(
-                    stream_key=self.stream_key,
-                    state="backpressure",
-                    reconnect_count=self._supervisor.status.failure_count,
-                    error=str(exc),
-                )
+                self._log_transport_state("backpressure", error=str(exc))
                 self.stop()
                 return
             except Exception as exc:
                 self._supervisor.record_failure(exc)
-                self._observability.log_transport_state(
-                    stream_key=self.stream_key,
-                    state="failed",
-                    reconnect_count=self._supervisor.status.failure_count,
-                    error=str(exc),
-                )
+                self._log_transport_state("failed", error=str(exc))
                 delay_ms = self._supervisor.next_retry_delay_ms()
                 if delay_ms is None:
                     self.stop()
                     return
-                time.sleep(delay_ms / 1000)
+                await asyncio.sleep(delay_ms / 1000)
         self._supervisor.record_stop()
 
     def stop(self) -> None:
         self._running = False
 
     async def _consume_stream(self) -> None:
-        url = f"{self._config.ws_url}/{self._config.stream}"
-        self._observability.log_transport_state(
-            stream_key=self.stream_key,
-            state="connecting",
-            reconnect_count=self._supervisor.status.failure_count,
-        )
+        self._log_transport_state("connecting")
         async with websockets.connect(
-            url,
+            self._url(),
             open_timeout=self._config.connect_timeout_ms / 1000,
             ping_interval=None,
             close_timeout=1,
         ) as websocket:
-            self._observability.log_transport_state(
-                stream_key=self.stream_key,
-                state="connected",
-                reconnect_count=self._supervisor.status.failure_count,
-            )
-            self._observability.record_connection_state(
-                stream_key=self.stream_key,
-                state="connected",
-                reconnect_count=self._supervisor.status.failure_count,
-            )
-            while self._running:
+            self._log_transport_state("connected")
+            self._record_connection_state("connected")
+            while self._running and not self._routes_stale():
                 try:
                     message = await asyncio.wait_for(
                         websocket.recv(), timeout=self._config.read_timeout_ms / 1000
                     )
                 except asyncio.TimeoutError as exc:
                     raise RuntimeError("read timeout") from exc
-                self._handle_message(message)
+                observer = self._frame_observer
+                if observer is not None:
+                    observer(time.perf_counter_ns())
+                pool = self._decode_pool
+                if pool is None:
+                    self._handle_message(message)
+                else:
+                    await pool.submit(
+                        self._decode_worker,
+                        handler=self._handle_message,
+                        on_error=self._record_worker_error,
+                        recv_ts_ms=self._pipeline.clock_ms(),
+                        frame=message,
+                        timeout_ms=self._config.read_timeout_ms,
+                    )
+                error = self._worker_error
+                if error is not None:
+                    self._worker_error = None
+                    raise error
+
+    def _record_worker_error(self, exc: Exception) -> None:
+        self._worker_error = exc
+
+    def _url(self) -> str:
+        return f"{self._config.ws_url}/{self._config.stream}"
+
+    def _routes_stale(self) -> bool:
+        return False
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        raise NotImplementedError
+    def _transport_stream_keys(self) -> tuple[StreamKey, ...]:
+        return (self.stream_key,)
 
-    def _handle_message(self, message: str | bytes) -> None:
+    def _log_transport_state(self, state: str, *, error: str | None = None) -> None:
+        for stream_key in self._transport_stream_keys():
+            self._observability.log_transport_state(
+                stream_key=stream_key,
+                state=state,
+                reconnect_count=self._supervisor.status.failure_count,
+                error=error,
+            )
+
+    def _record_connection_state(self, state: str) -> None:
+        for stream_key in self._transport_stream_keys():
+            self._observability.record_connection_state(
+                stream_key=stream_key,
+                state=state,
+                reconnect_count=self._supervisor.status.failure_count,
+            )
+
+    def _handle_message(self, message: str | bytes, recv_ts_ms: int | None = None) -> None:
         raw_payload: str | bytes = message
         try:
-            text = message if isinstance(message, str) else bytes(message).decode("utf-8")
-            data = json.loads(text)
+            if not isinstance(message, (str, bytes)):
+                message = bytes(message)
+            data = self._json_loads(message)
         except Exception as exc:
             self._emit_decode_failure(
                 raw_payload=raw_payload,
+                recv_ts_ms=recv_ts_ms,
                 error_kind="decode_error",
                 error_detail=str(exc),
             )
@@ -160,41 +213,74 @@ class _BinanceWsAdapter:
         if not isinstance(data, Mapping):
             self._emit_decode_failure(
                 raw_payload=raw_payload,
+                recv_ts_ms=recv_ts_ms,
                 error_kind="schema_mismatch",
                 error_detail="payload is not a mapping",
             )
             return
+        self._handle_payload(data, raw_payload=raw_payload, recv_ts_ms=recv_ts_ms)
+
+    def _handle_payload(
+        self,
+        data: Mapping[str, object],
+        *,
+        raw_payload: str | bytes,
+        recv_ts_ms: int | None = None,
+    ) -> None:
         try:
-            decoded = self._decode(data)
+            events, errors = self._decoder(data)
         except DecodeError as exc:
             self._emit_decode_failure(
                 raw_payload=raw_payload,
+                recv_ts_ms=recv_ts_ms,
                 error_kind=exc.error_kind,
                 error_detail=exc.error_detail,
             )
             return
 
-        for error in decoded.errors:
-            self._emit_decode_failure(
+        config = self._config
+        if len(events) == 1 and not errors:
+            event_type, exchange_ts_ms, normalized, source_event_id, source_seq = events[0]
+            self._pipeline.ingest(
+                event_type=event_type,
+                source_id=config.source_id,
+                symbol=config.symbol,
+                exchange_ts_ms=exchange_ts_ms,
                 raw_payload=raw_payload,
-                error_kind=error.error_kind,
-                error_detail=error.error_detail,
+                normalized=normalized,
+                source_event_id=source_event_id,
+                source_seq=source_seq,
+                channel=config.channel,
+                recv_ts_ms=recv_ts_ms,
             )
-        for event in decoded.events:
-            self._emit_event(raw_payload=raw_payload, event=event)
-
-    def _emit_event(self, *, raw_payload: str | bytes, event: DecodedEvent) -> None:
-        self._pipeline.ingest(
-            event_type=event.event_type,
-            source_id=self._config.source_id,
-            symbol=self._config.symbol,
-            exchange_ts_ms=event.exchange_ts_ms,
-            raw_payload=raw_payload,
-            normalized=event.normalized,
-            source_event_id=event.source_event_id,
-            source_seq=event.source_seq,
-            channel=self._config.channel,
+            return
+        items = [
+            IngestItem(
+                event_type="DecodeFailure",
+                source_id=config.source_id,
+                symbol=config.symbol,
+                exchange_ts_ms=None,
+                raw_payload=raw_payload,
+                normalized={"error_kind": error.error_kind, "error_detail": error.error_detail},
+                channel=config.channel,
+            )
+            for error in errors
+        ]
+        items.extend(
+            IngestItem(
+                event_type=event_type,
+                source_id=config.source_id,
+                symbol=config.symbol,
+                exchange_ts_ms=exchange_ts_ms,
+                raw_payload=raw_payload,
+                normalized=normalized,
+                source_event_id=source_event_id,
+                source_seq=source_seq,
+                channel=config.channel,
+            )
+            for event_type, exchange_ts_ms, normalized, source_event_id, source_seq in events
         )
+        self._pipeline.ingest_batch(items, recv_ts_ms=recv_ts_ms)
 
     def _emit_decode_failure(
         self,
@@ -202,6 +288,7 @@ class _BinanceWsAdapter:
         raw_payload: str | bytes,
         error_kind: str,
         error_detail: str,
+        recv_ts_ms: int | None = None,
     ) -> RawMarketEvent:
         return self._pipeline.ingest(
             event_type="DecodeFailure",
@@ -211,10 +298,13 @@ class _BinanceWsAdapter:
             raw_payload=raw_payload,
             normalized={"error_kind": error_kind, "error_detail": error_detail},
             channel=self._config.channel,
+            recv_ts_ms=recv_ts_ms,
         )
 
 
 class BinanceAggTradeAdapter(_BinanceWsAdapter):
+    _decoder = staticmethod(decode_agg_trade_fast)
+
     def __init__(
         self,
         *,
@@ -237,11 +327,10 @@ class BinanceAggTradeAdapter(_BinanceWsAdapter):
             observability=observability,
         )
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        return DecodedEvents(events=(decode_agg_trade(payload),), errors=())
-
 
 class BinanceKlineAdapter(_BinanceWsAdapter):
+    _decoder = staticmethod(decode_kline_fast)
+
     def __init__(
         self,
         *,
@@ -264,11 +353,10 @@ class BinanceKlineAdapter(_BinanceWsAdapter):
             observability=observability,
         )
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        return DecodedEvents(events=(decode_kline(payload),), errors=())
-
 
 class BinanceBookTickerAdapter(_BinanceWsAdapter):
+    _decoder = staticmethod(decode_book_ticker_fast)
+
     def __init__(
         self,
         *,
@@ -291,11 +379,10 @@ class BinanceBookTickerAdapter(_BinanceWsAdapter):
             observability=observability,
         )
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        return DecodedEvents(events=(decode_book_ticker(payload),), errors=())
-
 
 class BinanceDepthAdapter(_BinanceWsAdapter):
+    _decoder = staticmethod(decode_depth_fast)
+
     def __init__(
         self,
         *,
@@ -318,11 +405,10 @@ class BinanceDepthAdapter(_BinanceWsAdapter):
             observability=observability,
         )
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        return DecodedEvents(events=(decode_depth(payload),), errors=())
-
 
 class BinanceMarkPriceAdapter(_BinanceWsAdapter):
+    _decoder = staticmethod(decode_mark_price_fast)
+
     def __init__(
         self,
         *,
@@ -345,11 +431,10 @@ class BinanceMarkPriceAdapter(_BinanceWsAdapter):
             observability=observability,
         )
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        return decode_mark_price(payload)
-
 
 class BinanceForceOrderAdapter(_BinanceWsAdapter):
+    _decoder = staticmethod(decode_force_order_fast)
+
     def __init__(
         self,
         *,
@@ -372,11 +457,234 @@ class BinanceForceOrderAdapter(_BinanceWsAdapter):
             observability=observability,
         )
 
-    def _decode(self, payload: Mapping[str, object]) -> DecodedEvents:
-        return DecodedEvents(events=(decode_force_order(payload),), errors=())
+
+class BinanceStreamShards:
+    """Packs per-symbol channel adapters onto a fixed set of combined connections.
+
+    Each symbol's channels stay on one shard and no shard exceeds
+    `max_streams_per_connection`. `set_symbols` replans the assignment; every
+    connection drops its socket after the next frame and reconnects with its
+    new stream set.
+
+    The number of connections is fixed at construction: `set_symbols` can
+    only use the capacity of the existing `shard_count` shards and rejects a
+    symbol set that needs more. Pass a larger `shard_count` up front to leave
+    headroom for growth.
+    """
+
+    def __init__(
+        self,
+        *,
+        symbols: Iterable[str],
+        channels_for_symbol: Callable[[str], Sequence[object]],
+        max_streams_per_connection: int,
+        shard_count: int | None = None,
+    ) -> None:
+        self._channels_for_symbol = channels_for_symbol
+        self._max_streams = max_streams_per_connection
+        self._channels: dict[str, tuple[_BinanceWsAdapter, ...]] = {}
+        self._lock = threading.Lock()
+        self._version = 0
+        symbol_list = _unique(symbols)
+        counts = self._stream_counts(symbol_list)
+        required = required_shard_count(counts, max_streams_per_shard=self._max_streams)
+        self._shard_count = max(required, shard_count or 0)
+        self._assignment = assign_shards(
+            counts, shard_count=self._shard_count, max_streams_per_shard=self._max_streams
+        )
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    def set_symbols(self, symbols: Iterable[str]) -> None:
+        counts = self._stream_counts(_unique(symbols))
+        required = required_shard_count(counts, max_streams_per_shard=self._max_streams)
+        if required > self._shard_count:
+            raise ValueError(
+                f"{len(counts)} symbols need {required} connections of "
+                f"{self._max_streams} streams but only {self._shard_count} are open; "
+                "construct BinanceStreamShards with a larger shard_count to grow"
+            )
+        assignment = assign_shards(
+            counts, shard_count=self._shard_count, max_streams_per_shard=self._max_streams
+        )
+        with self._lock:
+            self._assignment = assignment
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def symbols_for(self, shard_index: int) -> tuple[str, ...]:
+        with self._lock:
+            return self._assignment[shard_index]
+
+    def channels_for(self, shard_index: int) -> tuple[_BinanceWsAdapter, ...]:
+        channels: list[_BinanceWsAdapter] = []
+        for symbol in self.symbols_for(shard_index):
+            channels.extend(self._channels[symbol])
+        return tuple(channels)
+
+    def _stream_counts(self, symbols: Sequence[str]) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for symbol in symbols:
+            channels = self._channels.get(symbol)
+            if channels is None:
+                channels = tuple(
+                    _require_ws_adapter(channel) for channel in self._channels_for_symbol(symbol)
+                )
+                self._channels[symbol] = channels
+            counts[symbol] = len(channels)
+        return counts
+
+
+class BinanceCombinedStreamAdapter(_BinanceWsAdapter):
+    """Multiplexes channel adapters over one `/stream?streams=a/b/c` connection.
+
+    Combined frames arrive as `{"stream": ..., "data": ...}` and are routed by
+    `stream` to the channel adapter that owns it, so emitted events keep that
+    channel's `channel` and transport state is reported per channel `StreamKey`.
+    `raw_payload` is the full combined frame as received. Frames that cannot be
+    routed are emitted as DecodeFailure against the first channel's symbol.
+    When built from `BinanceStreamShards`, the routed channels are refreshed
+    from the shard plan before every connection attempt.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: BinanceCombinedStreamConfig,
+        channels: Sequence[object] = (),
+        pipeline: IngestionPipeline,
+        observability: Observability | None = None,
+        shards: BinanceStreamShards | None = None,
+        shard_index: int = 0,
+    ) -> None:
+        self._shards = shards
+        self._shard_index = shard_index
+        self._routes_version = shards.version if shards is not None else 0
+        if shards is not None:
+            channels = shards.channels_for(shard_index)
+        routes = _build_routes(channels)
+        first = next(iter(routes.values()), None)
+        super().__init__(
+            config=_AdapterConfig(
+                source_id=config.source_id,
+                symbol=first._config.symbol if first is not None else "",
+                stream="/".join(routes),
+                channel=config.channel,
+                ws_url=config.ws_url,
+                retry=config.retry,
+                connect_timeout_ms=config.connect_timeout_ms,
+                read_timeout_ms=config.read_timeout_ms,
+            ),
+            pipeline=pipeline,
+            observability=observability,
+        )
+        if shards is None and not routes:
+            raise ValueError("combined stream requires at least one channel")
+        if shards is not None:
+            self.stream_key = StreamKey(
+                source_id=config.source_id,
+                channel=f"{config.channel}-{shard_index}",
+            )
+        self._routes = routes
+
+    @property
+    def channels(self) -> tuple[StreamKey, ...]:
+        return self._transport_stream_keys()
+
+    async def _consume_stream(self) -> None:
+        self._refresh_routes()
+        if not self._routes:
+            await asyncio.sleep(self._config.read_timeout_ms / 1000)
+            return
+        await super()._consume_stream()
+
+    def _routes_stale(self) -> bool:
+        return self._shards is not None and self._shards.version != self._routes_version
+
+    def _refresh_routes(self) -> None:
+        if self._shards is None:
+            return
+        self._routes_version = self._shards.version
+        routes = _build_routes(self._shards.channels_for(self._shard_index))
+        if list(routes) == list(self._routes):
+            return
+        first = next(iter(routes.values()), None)
+        self._routes = routes
+        self._config = replace(
+            self._config,
+            symbol=first._config.symbol if first is not None else "",
+            stream="/".join(routes),
+        )
+
+    def _url(self) -> str:
+        return f"{self._config.ws_url}?streams={self._config.stream}"
+
+    def _transport_stream_keys(self) -> tuple[StreamKey, ...]:
+        return tuple(route.stream_key for route in self._routes.values())
+
+    def _handle_payload(
+        self,
+        data: Mapping[str, object],
+        *,
+        raw_payload: str | bytes,
+        recv_ts_ms: int | None = None,
+    ) -> None:
+        stream = data.get("stream")
+        payload = data.get("data")
+        if not isinstance(stream, str) or not isinstance(payload, Mapping):
+            self._emit_decode_failure(
+                raw_payload=raw_payload,
+                recv_ts_ms=recv_ts_ms,
+                error_kind="schema_mismatch",
+                error_detail="missing combined stream envelope",
+            )
+            return
+        route = self._routes.get(stream)
+        if route is None:
+            self._emit_decode_failure(
+                raw_payload=raw_payload,
+                recv_ts_ms=recv_ts_ms,
+                error_kind="schema_mismatch",
+                error_detail=f"unknown stream: {stream}",
+            )
+            return
+        route._handle_payload(payload, raw_payload=raw_payload, recv_ts_ms=recv_ts_ms)
+
+
+def _require_ws_adapter(channel: object) -> _BinanceWsAdapter:
+    if not isinstance(channel, _BinanceWsAdapter):
+        raise TypeError("combined stream channels must be websocket adapters")
+    return channel
+
+
+def _build_routes(channels: Iterable[object]) -> dict[str, _BinanceWsAdapter]:
+    routes: dict[str, _BinanceWsAdapter] = {}
+    for channel in channels:
+        adapter = _require_ws_adapter(channel)
+        if adapter.stream in routes:
+            raise ValueError(f"duplicate stream: {adapter.stream}")
+        routes[adapter.stream] = adapter
+    return routes
+
+
+def _unique(symbols: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(symbols))
 
 
 class BinanceOpenInterestPoller:
+    """Polls open interest for one or more symbols over a keep-alive pool.
+
+    Each cycle requests every symbol, up to `max_connections_per_host` at a
+    time, reusing connections across cycles. A cycle fails (and backs off)
+    only when every symbol failed; individual failures are logged against
+    that symbol's stream key.
+    """
+
     stream_key: StreamKey
 
     def __init__(
@@ -385,19 +693,35 @@ class BinanceOpenInterestPoller:
         config: BinanceOpenInterestConfig,
         pipeline: IngestionPipeline,
         observability: Observability | None = None,
+        symbols: Sequence[str] | None = None,
+        client: PooledHttpClient | None = None,
     ) -> None:
         self._config = config
         self._pipeline = pipeline
         self._observability = observability or Observability(
             logger=NullLogger(), metrics=NullMetrics()
         )
+        self._symbols = tuple(_unique(symbols)) if symbols is not None else (config.symbol,)
+        if not self._symbols:
+            raise ValueError("open interest poller requires at least one symbol")
         self.stream_key = StreamKey(
             source_id=config.source_id,
             channel=config.channel,
-            symbol=config.symbol,
+            symbol=self._symbols[0] if len(self._symbols) == 1 else None,
         )
         self._supervisor = AdapterSupervisor(self.stream_key, config.retry)
         self._running = False
+        self._json_loads = get_json_backend().loads
+        self._client = client or PooledHttpClient(
+            config.rest_url,
+            max_connections=config.max_connections_per_host,
+            timeout_ms=config.request_timeout_ms,
+        )
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def symbols(self) -> tuple[str, ...]:
+        return self._symbols
 
     def start(self) -> None:
         self._running = True
@@ -405,53 +729,146 @@ class BinanceOpenInterestPoller:
     def run(self) -> None:
         self._supervisor.record_start()
         next_poll = time.monotonic()
-        while self._running:
-            now = time.monotonic()
-            if now < next_poll:
-                time.sleep(next_poll - now)
-            try:
-                self._poll_once()
-            except BackpressureError as exc:
-                self._supervisor.record_failure(exc)
-                self._observability.log_transport_state(
-                    stream_key=self.stream_key,
-                    state="backpressure",
-                    reconnect_count=self._supervisor.status.failure_count,
-                    error=str(exc),
-                )
-                self.stop()
-                return
-            except Exception as exc:
-                self._supervisor.record_failure(exc)
-                self._observability.log_transport_state(
-                    stream_key=self.stream_key,
-                    state="failed",
-                    reconnect_count=self._supervisor.status.failure_count,
-                    error=str(exc),
-                )
-                delay_ms = self._supervisor.next_retry_delay_ms()
-                if delay_ms is None:
-                    self.stop()
-                    return
-                time.sleep(delay_ms / 1000)
-            else:
-                next_poll += self._config.poll_interval_ms / 1000
-        self._supervisor.record_stop()
+        try:
+            while self._running:
+                now = time.monotonic()
+                if now < next_poll:
+                    time.sleep(next_poll - now)
+                try:
+                    self._poll_once()
+                except Exception as exc:
+                    delay_ms = self._handle_poll_failure(exc)
+                    if delay_ms is None:
+                        return
+                    time.sleep(delay_ms / 1000)
+                else:
+                    next_poll += self._config.poll_interval_ms / 1000
+            self._supervisor.record_stop()
+        finally:
+            self._close()
+
+    async def run_async(self) -> None:
+        self._supervisor.record_start()
+        next_poll = time.monotonic()
+        try:
+            while self._running:
+                now = time.monotonic()
+                if now < next_poll:
+                    await asyncio.sleep(next_poll - now)
+                try:
+                    await self._poll_in_thread()
+                except asyncio.CancelledError:
+                    self._supervisor.record_stop()
+                    raise
+                except Exception as exc:
+                    delay_ms = self._handle_poll_failure(exc)
+                    if delay_ms is None:
+                        return
+                    await asyncio.sleep(delay_ms / 1000)
+                else:
+                    next_poll += self._config.poll_interval_ms / 1000
+            self._supervisor.record_stop()
+        finally:
+            self._close()
+
+    async def _poll_in_thread(self) -> None:
+        # Cancelling the await cannot stop the worker thread, so on
+        # cancellation wait for the poll to finish before re-raising;
+        # otherwise `_close` would run while it is still using the executor
+        # and the client.
+        poll = asyncio.ensure_future(asyncio.to_thread(self._poll_once))
+        try:
+            await asyncio.shield(poll)
+        except asyncio.CancelledError:
+            self.stop()
+            while not poll.done():
+                try:
+                    await asyncio.wait({poll})
+                except asyncio.CancelledError:
+                    continue
+            raise
+
+    def _handle_poll_failure(self, exc: Exception) -> int | None:
+        self._supervisor.record_failure(exc)
+        if isinstance(exc, BackpressureError):
+            self._observability.log_transport_state(
+                stream_key=self.stream_key,
+                state="backpressure",
+                reconnect_count=self._supervisor.status.failure_count,
+                error=str(exc),
+            )
+            self.stop()
+            return None
+        self._observability.log_transport_state(
+            stream_key=self.stream_key,
+            state="failed",
+            reconnect_count=self._supervisor.status.failure_count,
+            error=str(exc),
+        )
+        delay_ms = self._supervisor.next_retry_delay_ms()
+        if delay_ms is None:
+            self.stop()
+        return delay_ms
 
     def stop(self) -> None:
         self._running = False
 
+    def _close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._client.close()
+
     def _poll_once(self) -> None:
-        url = f"{self._config.rest_url}/fapi/v1/openInterest?symbol={self._config.symbol}"
-        request = urllib.request.Request(url, method="GET")
-        with urllib.request.urlopen(
-            request, timeout=self._config.request_timeout_ms / 1000
-        ) as response:
-            raw_payload = response.read()
+        symbols = self._symbols
+        if len(symbols) == 1:
+            self._poll_symbol(symbols[0])
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(len(symbols), self._config.max_connections_per_host),
+                thread_name_prefix=f"binance-{self._config.channel}",
+            )
+        results = self._executor.map(self._try_poll_symbol, symbols)
+        failures = [
+            (symbol, exc) for symbol, exc in zip(symbols, results, strict=True) if exc is not None
+        ]
+        for _, exc in failures:
+            if isinstance(exc, BackpressureError):
+                raise exc
+        if failures and len(failures) == len(symbols):
+            raise failures[0][1]
+        for symbol, exc in failures:
+            self._observability.log_transport_state(
+                stream_key=StreamKey(
+                    source_id=self._config.source_id,
+                    channel=self._config.channel,
+                    symbol=symbol,
+                ),
+                state="failed",
+                error=str(exc),
+            )
+
+    def _try_poll_symbol(self, symbol: str) -> Exception | None:
+        try:
+            self._poll_symbol(symbol)
+        except Exception as exc:
+            return exc
+        return None
+
+    def _poll_symbol(self, symbol: str) -> None:
+        try:
+            response = self._client.get(f"/fapi/v1/openInterest?symbol={symbol}")
+        except HttpStatusError as exc:
+            self._record_request(exc.status, exc.latency_ms)
+            raise
+        self._record_request(response.status, response.latency_ms)
+        raw_payload = response.body
         try:
-            payload = json.loads(raw_payload.decode("utf-8"))
+            payload = self._json_loads(raw_payload)
         except Exception as exc:
             self._emit_decode_failure(
+                symbol=symbol,
                 raw_payload=raw_payload,
                 error_kind="decode_error",
                 error_detail=str(exc),
@@ -459,33 +876,45 @@ class BinanceOpenInterestPoller:
             return
         if not isinstance(payload, Mapping):
             self._emit_decode_failure(
+                symbol=symbol,
                 raw_payload=raw_payload,
                 error_kind="schema_mismatch",
                 error_detail="payload is not a mapping",
             )
             return
         try:
-            decoded = decode_open_interest(payload)
+            events, _ = decode_open_interest_fast(payload)
         except DecodeError as exc:
             self._emit_decode_failure(
+                symbol=symbol,
                 raw_payload=raw_payload,
                 error_kind=exc.error_kind,
                 error_detail=exc.error_detail,
             )
             return
-        self._pipeline.ingest(
-            event_type=decoded.event_type,
+        for event_type, exchange_ts_ms, normalized, _, _ in events:
+            self._pipeline.ingest(
+                event_type=event_type,
+                source_id=self._config.source_id,
+                symbol=symbol,
+                exchange_ts_ms=exchange_ts_ms,
+                raw_payload=raw_payload,
+                normalized=normalized,
+                channel=self._config.channel,
+            )
+
+    def _record_request(self, status: int, latency_ms: float) -> None:
+        self._observability.record_http_request(
             source_id=self._config.source_id,
-            symbol=self._config.symbol,
-            exchange_ts_ms=decoded.exchange_ts_ms,
-            raw_payload=raw_payload,
-            normalized=decoded.normalized,
-            channel=self._config.channel,
+            host=self._client.host,
+            status=status,
+            latency_ms=latency_ms,
         )
 
     def _emit_decode_failure(
         self,
         *,
+        symbol: str,
         raw_payload: bytes | str,
         error_kind: str,
         error_detail: str,
@@ -493,7 +922,7 @@ class BinanceOpenInterestPoller:
         return self._pipeline.ingest(
             event_type="DecodeFailure",
             source_id=self._config.source_id,
-            symbol=self._config.symbol,
+            symbol=symbol,
             exchange_ts_ms=None,
             raw_payload=raw_payload,
             normalized={"error_kind": error_kind, "error_detail": error_detail},
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from .decoder import (
+    DecodeError,
+    _as_bool_optional,
+    _as_float,
+    _as_int,
+    _as_price_levels,
+    _as_str,
+    _as_str_optional,
+    _require_mapping,
+    _side_from_maker,
+    _side_from_order,
+)
+
+# (event_type, exchange_ts_ms, normalized, source_event_id, source_seq)
+IngestArgs = tuple[str, "int | None", "dict[str, object]", "str | None", "int | None"]
+CompiledDecoder = Callable[
+    [Mapping[str, object]], tuple[tuple[IngestArgs, ...], tuple[DecodeError, ...]]
+]
+
+ENVELOPE_TARGETS = frozenset({"exchange_ts_ms", "source_event_id", "source_seq"})
+FIELD_KINDS = frozenset(
+    {"float", "int", "str", "str_optional", "bool", "side_maker", "side_order", "levels", "const"}
+)
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """One payload field and where its parsed value lands.
+
+    `key` is the payload key, dotted for nested objects (`k.o`). `target` is a
+    normalized key or one of the envelope targets. `fallback` names a required
+    key read when an optional field is absent. `event_type` turns the field into
+    its own event (mark price style fan-out); its errors are collected instead
+    of failing the frame.
+    """
+
+    key: str
+    kind: str
+    target: str
+    optional: bool = False
+    fallback: str | None = None
+    event_type: str | None = None
+    value: object = None
+
+
+@dataclass(frozen=True)
+class ValueCheck:
+    key: str
+    expected: str
+    label: str
+
+
+@dataclass(frozen=True)
+class StreamSpec:
+    name: str
+    event_type: str | None
+    fields: tuple[FieldSpec, ...]
+    checks: tuple[ValueCheck, ...] = ()
+
+
+_HELPERS: dict[str, object] = {
+    "DecodeError": DecodeError,
+    "_as_bool_optional": _as_bool_optional,
+    "_as_float": _as_float,
+    "_as_int": _as_int,
+    "_as_price_levels": _as_price_levels,
+    "_as_str": _as_str,
+    "_as_str_optional": _as_str_optional,
+    "_require_mapping": _require_mapping,
+    "_side_from_maker": _side_from_maker,
+    "_side_from_order": _side_from_order,
+    "_float": float,
+    "_dict": dict,
+    "_str": str,
+    "_int": int,
+    "_bool": bool,
+    "_NO_ERRORS": (),
+}
+
+
+def compile_stream(spec: StreamSpec) -> CompiledDecoder:
+    """Generate a straight-line decoder for one stream spec.
+
+    Exact-type fast paths cover the shapes Binance actually sends; anything
+    else falls through to the generic `_as_*` helpers, so error kinds and
+    details match `decoder.decode_*` exactly.
+    """
+    _validate_spec(spec)
+    lines: list[str] = []
+    parents: dict[str, str] = {}
+    for field in spec.fields:
+        for key in (field.key, field.fallback):
+            if key and "." in key:
+                parent = key.split(".", 1)[0]
+                if parent not in parents:
+                    parents[parent] = f"_m{len(parents)}"
+    for parent, var in parents.items():
+        lines.append(f"{var} = payload.get({parent!r})")
+        lines.append(f"if {var}.__class__ is not _dict:")
+        lines.append(f"    {var} = _require_mapping(payload, {parent!r})")
+    for check in spec.checks:
+        source = _source_expr(check.key, parents)
+        lines.append(f"_c = {source}")
+        lines.append("if _c.__class__ is not _str:")
+        lines.append(f"    _c = _as_str(_c, key={check.key!r})")
+        lines.append(f"if _c != {check.expected!r}:")
+        lines.append(
+            f"    raise DecodeError('schema_mismatch', f'unexpected {check.label}: {{_c}}')"
+        )
+
+    fan_out = [field for field in spec.fields if field.event_type is not None]
+    plain = [field for field in spec.fields if field.event_type is None]
+    names: dict[str, str] = {}
+    for index, field in enumerate(plain):
+        var = f"_v{index}"
+        names[field.target] = var
+        lines.extend(_field_lines(field, var, parents))
+
+    envelope = ", ".join(
+        names.get(target, "None") for target in ("exchange_ts_ms", "source_event_id", "source_seq")
+    )
+    if not fan_out:
+        normalized = ", ".join(
+            f"{field.target!r}: {names[field.target]}"
+            for field in plain
+            if field.target not in ENVELOPE_TARGETS
+        )
+        lines.append(
+            f"return (({spec.event_type!r}, "
+            + _envelope_args(envelope, normalized)
+            + "),), _NO_ERRORS"
+        )
+    else:
+        lines.append("_events = []")
+        lines.append("_errors = []")
+        for index, field in enumerate(fan_out):
+            var = f"_f{index}"
+            lines.append("try:")
+            lines.extend("    " + line for line in _field_lines(field, var, parents))
+            lines.append("except DecodeError as _exc:")
+            lines.append("    _errors.append(_exc)")
+            lines.append("else:")
+            lines.append(
+                f"    _events.append(({field.event_type!r}, "
+                + _envelope_args(envelope, f"{field.target!r}: {var}")
+                + "))"
+            )
+        lines.append("return tuple(_events), tuple(_errors)")
+
+    function_name = f"decode_{spec.name}"
+    source = f"def {function_name}(payload):\n" + "\n".join("    " + line for line in lines)
+    namespace: dict[str, object] = dict(_HELPERS)
+    exec(compile(source, f"<compiled {spec.name}>", "exec"), namespace)
+    return namespace[function_name]  # type: ignore[return-value]
+
+
+def _envelope_args(envelope: str, normalized: str) -> str:
+    exchange_ts_ms, source_event_id, source_seq = envelope.split(", ")
+    return f"{exchange_ts_ms}, {{{normalized}}}, {source_event_id}, {source_seq}"
+
+
+def _source_expr(key: str, parents: Mapping[str, str]) -> str:
+    if "." in key:
+        parent, child = key.split(".", 1)
+        return f"{parents[parent]}.get({child!r})"
+    return f"payload.get({key!r})"
+
+
+def _field_lines(field: FieldSpec, var: str, parents: Mapping[str, str]) -> list[str]:
+    if field.kind == "const":
+        return [f"{var} = {field.value!r}"]
+    source = _source_expr(field.key, parents)
+    key = field.key
+    lines = [f"{var} = {source}"]
+    if field.kind == "float":
+        lines += [
+            f"if {var}.__class__ is _str:",
+            "    try:",
+            f"        {var} = _float({var})",
+            "    except ValueError:",
+            f"        {var} = _as_float({var}, key={key!r})",
+            f"elif {var}.__class__ is _float:",
+            "    pass",
+            "else:",
+            f"    {var} = _as_float({var}, key={key!r})",
+        ]
+    elif field.kind == "int":
+        lines += [
+            f"if {var}.__class__ is not _int:",
+            f"    {var} = _as_int({var}, key={key!r})",
+        ]
+    elif field.kind == "str":
+        lines += [
+            f"if {var}.__class__ is not _str:",
+            f"    {var} = _as_str({var}, key={key!r})",
+        ]
+    elif field.kind == "str_optional":
+        lines += [
+            f"if {var}.__class__ is _int:",
+            f"    {var} = _str({var})",
+            f"elif {var} is not None and {var}.__class__ is not _str:",
+            f"    {var} = _as_str_optional({var})",
+        ]
+    elif field.kind == "bool":
+        lines += [
+            f"if {var} is not None and {var}.__class__ is not _bool:",
+            f"    {var} = _as_bool_optional({var}, key={key!r})",
+        ]
+    elif field.kind == "side_maker":
+        lines += [
+            f"if {var} is True:",
+            f"    {var} = 'sell'",
+            f"elif {var} is False:",
+            f"    {var} = 'buy'",
+            "else:",
+            f"    {var} = _side_from_maker({var})",
+        ]
+    elif field.kind == "side_order":
+        lines += [f"{var} = _side_from_order({var})"]
+    elif field.kind == "levels":
+        lines += [f"{var} = _as_price_levels({var}, key={key!r})"]
+    if field.optional and field.kind in {"float", "int", "str", "levels"}:
+        guarded = [lines[0], f"if {var} is not None:"] + ["    " + line for line in lines[1:]]
+        lines = guarded
+        if field.fallback is not None:
+            fallback = FieldSpec(key=field.fallback, kind=field.kind, target=field.target)
+            lines.append(f"if {var} is None:")
+            lines.extend("    " + line for line in _field_lines(fallback, var, parents))
+    return lines
+
+
+def _validate_spec(spec: StreamSpec) -> None:
+    targets: set[str] = set()
+    for field in spec.fields:
+        if field.kind not in FIELD_KINDS:
+            raise ValueError(f"unsupported field kind: {field.kind}")
+        if field.event_type is None and field.target in targets:
+            raise ValueError(f"duplicate target: {field.target}")
+        targets.add(field.target)
+        if field.fallback is not None and not field.optional:
+            raise ValueError(f"fallback requires optional field: {field.key}")
+        if field.event_type is not None and field.target in ENVELOPE_TARGETS:
+            raise ValueError(f"fan-out field cannot target the envelope: {field.key}")
+    has_fan_out = any(field.event_type is not None for field in spec.fields)
+    if has_fan_out == (spec.event_type is not None):
+        raise ValueError(f"{spec.name}: set event_type or fan-out fields, not both")
+
+
+AGG_TRADE = StreamSpec(
+    name="agg_trade",
+    event_type="TradeTick",
+    fields=(
+        FieldSpec("T", "int", "exchange_ts_ms"),
+        FieldSpec("p", "float", "price"),
+        FieldSpec("q", "float", "quantity"),
+        FieldSpec("a", "str_optional", "source_event_id"),
+        FieldSpec("m", "side_maker", "side"),
+    ),
+)
+
+KLINE = StreamSpec(
+    name="kline",
+    event_type="Candle",
+    checks=(ValueCheck("k.i", "3m", "interval"),),
+    fields=(
+        FieldSpec("k.T", "int", "exchange_ts_ms", optional=True, fallback="E"),
+        FieldSpec("k.o", "float", "open"),
+        FieldSpec("k.h", "float", "high"),
+        FieldSpec("k.l", "float", "low"),
+        FieldSpec("k.c", "float", "close"),
+        FieldSpec("k.v", "float", "volume"),
+        FieldSpec("", "const", "interval_ms", value=180000),
+        FieldSpec("k.x", "bool", "is_final", optional=True),
+    ),
+)
+
+BOOK_TICKER = StreamSpec(
+    name="book_ticker",
+    event_type="BookTop",
+    fields=(
+        FieldSpec("b", "float", "best_bid_price"),
+        FieldSpec("B", "float", "best_bid_quantity"),
+        FieldSpec("a", "float", "best_ask_price"),
+        FieldSpec("A", "float", "best_ask_quantity"),
+        FieldSpec("E", "int", "exchange_ts_ms", optional=True),
+    ),
+)
+
+DEPTH = StreamSpec(
+    name="depth",
+    event_type="BookDelta",
+    fields=(
+        FieldSpec("b", "levels", "bids"),
+        FieldSpec("a", "levels", "asks"),
+        FieldSpec("E", "int", "exchange_ts_ms", optional=True),
+        FieldSpec("u", "int", "source_seq", optional=True),
+        FieldSpec("U", "int", "first_seq", optional=True),
+        FieldSpec("pu", "int", "prev_seq", optional=True),
+    ),
+)
+
+MARK_PRICE = StreamSpec(
+    name="mark_price",
+    event_type=None,
+    fields=(
+        FieldSpec("E", "int", "exchange_ts_ms", optional=True),
+        FieldSpec("p", "float", "mark_price", event_type="MarkPrice"),
+        FieldSpec("i", "float", "index_price", event_type="IndexPrice"),
+        FieldSpec("r", "float", "funding_rate", event_type="FundingRate"),
+    ),
+)
+
+FORCE_ORDER = StreamSpec(
+    name="force_order",
+    event_type="LiquidationPrint",
+    fields=(
+        FieldSpec("o.T", "int", "exchange_ts_ms", optional=True),
+        FieldSpec("o.p", "float", "price"),
+        FieldSpec("o.q", "float", "quantity"),
+        FieldSpec("o.S", "side_order", "side"),
+    ),
+)
+
+OPEN_INTEREST = StreamSpec(
+    name="open_interest",
+    event_type="OpenInterest",
+    fields=(
+        FieldSpec("openInterest", "float", "open_interest"),
+        FieldSpec("time", "int", "exchange_ts_ms", optional=True),
+    ),
+)
+
+decode_agg_trade_fast = compile_stream(AGG_TRADE)
+decode_kline_fast = compile_stream(KLINE)
+decode_book_ticker_fast = compile_stream(BOOK_TICKER)
+decode_depth_fast = compile_stream(DEPTH)
+decode_mark_price_fast = compile_stream(MARK_PRICE)
+decode_force_order_fast = compile_stream(FORCE_ORDER)
+decode_open_interest_fast = compile_stream(OPEN_INTEREST)
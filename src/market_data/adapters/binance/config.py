@@ -194,6 +194,7 @@ class BinanceOpenInterestConfig:
     retry: RetryPolicy
     request_timeout_ms: int
     poll_interval_ms: int
+    max_connections_per_host: int = 4
 
     @classmethod
     def default(cls, *, symbol: str = "BTCUSDT") -> BinanceOpenInterestConfig:
@@ -210,3 +211,28 @@ class BinanceOpenInterestConfig:
             request_timeout_ms=10_000,
             poll_interval_ms=10_000,
         )
+
+
+@dataclass(frozen=True)
+class BinanceCombinedStreamConfig:
+    source_id: str
+    channel: str
+    ws_url: str
+    retry: RetryPolicy
+    connect_timeout_ms: int
+    read_timeout_ms: int
+
+    @classmethod
+    def default(cls) -> BinanceCombinedStreamConfig:
+        return cls(
+            source_id="binance",
+            channel="combined",
+            ws_url="wss://fstream.binance.com/stream",
+            retry=RetryPolicy(
+                min_delay_ms=250,
+                max_delay_ms=5_000,
+                max_attempts=5,
+            ),
+            connect_timeout_ms=10_000,
+            read_timeout_ms=30_000,
+        )
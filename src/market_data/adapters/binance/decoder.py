@@ -92,10 +92,12 @@ def decode_depth(payload: Mapping[str, object]) -> DecodedEvent:
     asks = _as_price_levels(payload.get("a"), key="a")
     exchange_ts_ms = _as_int_optional(payload.get("E"), key="E")
     source_seq = _as_int_optional(payload.get("u"), key="u")
+    first_seq = _as_int_optional(payload.get("U"), key="U")
+    prev_seq = _as_int_optional(payload.get("pu"), key="pu")
     return DecodedEvent(
         event_type="BookDelta",
         exchange_ts_ms=exchange_ts_ms,
-        normalized={"bids": bids, "asks": asks},
+        normalized={"bids": bids, "asks": asks, "first_seq": first_seq, "prev_seq": prev_seq},
         source_seq=source_seq,
     )
 
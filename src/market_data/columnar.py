@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from array import array
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from market_data.contracts import RawMarketEvent
+
+# `ts` holds exchange_ts_ms; events without one get MISSING_TS, which sorts
+# before every real timestamp. Float columns hold NaN where the normalized
+# value is missing or not a finite number.
+MISSING_TS = -(2**63)
+SIDE_BUY = 1
+SIDE_SELL = -1
+SIDE_UNKNOWN = 0
+
+_Extractor = Callable[[Mapping[str, object]], float | int]
+
+
+def _float(key: str) -> _Extractor:
+    def extract(normalized: Mapping[str, object]) -> float:
+        value = normalized.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return math.nan
+        if not math.isfinite(value):
+            return math.nan
+        return float(value)
+
+    return extract
+
+
+def _side(normalized: Mapping[str, object]) -> int:
+    side = normalized.get("side")
+    if side == "buy":
+        return SIDE_BUY
+    if side == "sell":
+        return SIDE_SELL
+    return SIDE_UNKNOWN
+
+
+def _flag(key: str) -> _Extractor:
+    def extract(normalized: Mapping[str, object]) -> int:
+        return 1 if normalized.get(key) is True else 0
+
+    return extract
+
+
+# (column, array typecode, extractor) per event type.
+COLUMN_SPECS: Mapping[str, tuple[tuple[str, str, _Extractor], ...]] = {
+    "TradeTick": (
+        ("price", "d", _float("price")),
+        ("quantity", "d", _float("quantity")),
+        ("side", "b", _side),
+    ),
+    "Candle": (
+        ("open", "d", _float("open")),
+        ("high", "d", _float("high")),
+        ("low", "d", _float("low")),
+        ("close", "d", _float("close")),
+        ("volume", "d", _float("volume")),
+        ("interval_ms", "d", _float("interval_ms")),
+        ("is_final", "b", _flag("is_final")),
+    ),
+    "OpenInterest": (("open_interest", "d", _float("open_interest")),),
+    "MarkPrice": (("mark_price", "d", _float("mark_price")),),
+    "FundingRate": (("funding_rate", "d", _float("funding_rate")),),
+}
+
+
+@dataclass(frozen=True)
+class ColumnSlice:
+    """Copies of a contiguous run of rows; `seq` and `ts` are always present."""
+
+    event_type: str
+    symbol: str
+    columns: Mapping[str, array]
+
+    def __len__(self) -> int:
+        return len(self.columns["seq"])
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+
+class EventColumns:
+    """Append-only typed columns for one event type and symbol, in seq order."""
+
+    def __init__(self, event_type: str, symbol: str) -> None:
+        self.event_type = event_type
+        self.symbol = symbol
+        self._spec = COLUMN_SPECS[event_type]
+        self.seq = array("q")
+        self.recv_ts = array("q")
+        self.ts = array("q")
+        self.values = {name: array(typecode) for name, typecode, _ in self._spec}
+        self._ts_sorted = True
+
+    def __len__(self) -> int:
+        return len(self.seq)
+
+    def append(self, seq: int, event: RawMarketEvent) -> None:
+        if self.seq and seq <= self.seq[-1]:
+            raise ValueError("seq must be increasing")
+        ts = event.exchange_ts_ms if event.exchange_ts_ms is not None else MISSING_TS
+        if self.ts and ts < self.ts[-1]:
+            self._ts_sorted = False
+        normalized = event.normalized
+        values = self.values
+        for name, _, extract in self._spec:
+            values[name].append(extract(normalized))
+        self.seq.append(seq)
+        self.recv_ts.append(event.recv_ts_ms)
+        self.ts.append(ts)
+
+    def evict_through(self, seq: int) -> None:
+        """Drop rows up to and including `seq`."""
+        count = bisect.bisect_right(self.seq, seq)
+        if not count:
+            return
+        for column in self._columns().values():
+            del column[:count]
+        if not self._ts_sorted:
+            ts = self.ts
+            self._ts_sorted = all(ts[index - 1] <= ts[index] for index in range(1, len(ts)))
+
+    def range_by_seq(self, start_seq: int, end_seq: int) -> ColumnSlice:
+        """Rows with `start_seq <= seq <= end_seq`."""
+        low = bisect.bisect_left(self.seq, start_seq)
+        high = bisect.bisect_right(self.seq, end_seq)
+        return self._slice(low, high)
+
+    def range_by_time(self, start_ms: int, end_ms: int) -> ColumnSlice:
+        """Rows with `start_ms <= ts <= end_ms`, in seq order."""
+        if self._ts_sorted:
+            low = bisect.bisect_left(self.ts, start_ms)
+            high = bisect.bisect_right(self.ts, end_ms)
+            return self._slice(low, high)
+        rows = [index for index, ts in enumerate(self.ts) if start_ms <= ts <= end_ms]
+        return ColumnSlice(
+            event_type=self.event_type,
+            symbol=self.symbol,
+            columns={
+                name: array(column.typecode, [column[index] for index in rows])
+                for name, column in self._columns().items()
+            },
+        )
+
+    def _slice(self, low: int, high: int) -> ColumnSlice:
+        return ColumnSlice(
+            event_type=self.event_type,
+            symbol=self.symbol,
+            columns={name: column[low:high] for name, column in self._columns().items()},
+        )
+
+    def _columns(self) -> dict[str, array]:
+        return {"seq": self.seq, "recv_ts": self.recv_ts, "ts": self.ts, **self.values}
+
+
+class ColumnarEventStore:
+    """Struct-of-arrays view of raw events, keyed by event type and symbol.
+
+    Event types in COLUMN_SPECS get typed value columns; every other type
+    only has its seqs recorded, enough for `counts_by_event_type` and `seqs`.
+    Queries return copied slices, so callers can hold them while appends
+    continue.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._columns: dict[tuple[str, str], EventColumns] = {}
+        self._other_seqs: dict[tuple[str, str], array] = {}
+
+    def append(self, seq: int, event: RawMarketEvent) -> None:
+        key = (event.event_type, event.symbol)
+        if event.event_type not in COLUMN_SPECS:
+            with self._lock:
+                seqs = self._other_seqs.get(key)
+                if seqs is None:
+                    seqs = self._other_seqs[key] = array("q")
+                if seqs and seq <= seqs[-1]:
+                    raise ValueError("seq must be increasing")
+                seqs.append(seq)
+            return
+        with self._lock:
+            columns = self._columns.get(key)
+            if columns is None:
+                columns = self._columns[key] = EventColumns(event.event_type, event.symbol)
+            columns.append(seq, event)
+
+    def evict_through(self, seq: int) -> None:
+        """Drop rows up to and including `seq`; emptied columns are forgotten."""
+        with self._lock:
+            for key, columns in list(self._columns.items()):
+                columns.evict_through(seq)
+                if not columns:
+                    del self._columns[key]
+            for key, seqs in list(self._other_seqs.items()):
+                del seqs[: bisect.bisect_right(seqs, seq)]
+                if not seqs:
+                    del self._other_seqs[key]
+
+    def counts_by_event_type(self, *, symbol: str, start_seq: int, end_seq: int) -> dict[str, int]:
+        """Rows per event type with `start_seq <= seq <= end_seq`, in order of
+        each type's first row."""
+        counted: list[tuple[int, str, int]] = []
+        with self._lock:
+            for (event_type, key_symbol), seqs in self._seq_columns():
+                if key_symbol != symbol:
+                    continue
+                low = bisect.bisect_left(seqs, start_seq)
+                high = bisect.bisect_right(seqs, end_seq)
+                if high > low:
+                    counted.append((seqs[low], event_type, high - low))
+        return {event_type: count for _, event_type, count in sorted(counted)}
+
+    def seqs(self, event_type: str, *, symbol: str, start_seq: int, end_seq: int) -> array:
+        """Seqs of `event_type` rows with `start_seq <= seq <= end_seq`; any event type."""
+        if start_seq > end_seq:
+            raise ValueError("start_seq must be <= end_seq")
+        with self._lock:
+            key = (event_type, symbol)
+            columns = self._columns.get(key)
+            seqs = columns.seq if columns is not None else self._other_seqs.get(key)
+            if seqs is None:
+                return array("q")
+            return seqs[bisect.bisect_left(seqs, start_seq) : bisect.bisect_right(seqs, end_seq)]
+
+    def range_by_seq(
+        self, event_type: str, *, symbol: str, start_seq: int, end_seq: int
+    ) -> ColumnSlice:
+        if start_seq > end_seq:
+            raise ValueError("start_seq must be <= end_seq")
+        with self._lock:
+            columns = self._columns_for(event_type, symbol)
+            return columns.range_by_seq(start_seq, end_seq)
+
+    def range_by_time(
+        self, event_type: str, *, symbol: str, start_ms: int, end_ms: int
+    ) -> ColumnSlice:
+        if start_ms > end_ms:
+            raise ValueError("start_ms must be <= end_ms")
+        with self._lock:
+            columns = self._columns_for(event_type, symbol)
+            return columns.range_by_time(start_ms, end_ms)
+
+    def _seq_columns(self) -> list[tuple[tuple[str, str], array]]:
+        pairs = [(key, columns.seq) for key, columns in self._columns.items()]
+        pairs.extend(self._other_seqs.items())
+        return pairs
+
+    def _columns_for(self, event_type: str, symbol: str) -> EventColumns:
+        if event_type not in COLUMN_SPECS:
+            raise ValueError(f"event_type has no columnar layout: {event_type}")
+        columns = self._columns.get((event_type, symbol))
+        return columns if columns is not None else EventColumns(event_type, symbol)
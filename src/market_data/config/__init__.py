@@ -12,6 +12,9 @@ class RetryPolicy:
     max_elapsed_ms: int | None = None
 
 
+BACKPRESSURE_POLICIES = frozenset({"block", "fail", "drop_oldest"})
+
+
 @dataclass(frozen=True)
 class BackpressureConfig:
     policy: str
@@ -19,6 +22,13 @@ class BackpressureConfig:
     max_block_ms: int | None = None
 
 
+@dataclass(frozen=True)
+class DecodeFailureCoalescingConfig:
+    window_ms: int = 1_000
+    max_per_window: int = 20
+    max_samples: int = 3
+
+
 @dataclass(frozen=True)
 class OperationalLimits:
     connect_timeout_ms: int
@@ -86,9 +96,16 @@ def _validate_retry(retry: RetryPolicy) -> None:
 
 
 def _validate_backpressure(backpressure: BackpressureConfig) -> None:
-    if backpressure.policy not in {"block", "fail"}:
-        raise ValueError("backpressure.policy must be 'block' or 'fail'")
+    if backpressure.policy not in BACKPRESSURE_POLICIES:
+        raise ValueError("backpressure.policy must be 'block', 'fail' or 'drop_oldest'")
     if backpressure.max_pending <= 0:
         raise ValueError("backpressure.max_pending must be > 0")
     if backpressure.max_block_ms is not None:
         _require_positive(backpressure.max_block_ms, "backpressure.max_block_ms")
+
+
+def _validate_decode_failure_coalescing(config: DecodeFailureCoalescingConfig) -> None:
+    _require_positive(config.window_ms, "decode_failure_coalescing.window_ms")
+    _require_positive(config.max_per_window, "decode_failure_coalescing.max_per_window")
+    if config.max_samples < 0:
+        raise ValueError("decode_failure_coalescing.max_samples must be >= 0")
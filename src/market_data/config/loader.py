@@ -4,8 +4,22 @@ import json
 from collections.abc import Mapping
 from importlib import resources
 
-from market_data.config import BackpressureConfig
-from market_data.runtime_config import AdapterType, MarketDataRuntimeConfig
+from market_data.config import (
+    BackpressureConfig,
+    DecodeFailureCoalescingConfig,
+    _validate_backpressure,
+)
+from market_data.json_backend import JSON_BACKENDS
+from market_data.runtime_config import (
+    DEFAULT_DECODE_QUEUE_SIZE,
+    DEFAULT_MAX_STREAMS_PER_CONNECTION,
+    DEFAULT_SHM_RING_BYTES,
+    AdapterType,
+    DeploymentMode,
+    MarketDataRuntimeConfig,
+    RuntimeMode,
+    TransportMode,
+)
 
 _ADAPTER_KEY_MAP: Mapping[str, AdapterType] = {
     "agg_trade": AdapterType.AGG_TRADE,
@@ -36,18 +50,122 @@ def _load_default_payload() -> Mapping[str, object]:
 
 
 def _parse_runtime_config(payload: Mapping[str, object]) -> MarketDataRuntimeConfig:
-    symbol = payload.get("symbol")
-    if not isinstance(symbol, str) or not symbol:
-        raise ValueError("market_data config requires non-empty symbol")
+    symbols = _parse_symbols(payload)
     backpressure = _parse_backpressure(payload.get("backpressure"))
     enabled_adapters = _parse_enabled_adapters(payload.get("adapters"))
+    runtime_mode = _parse_runtime_mode(payload.get("runtime_mode"))
+    transport = _parse_transport(payload.get("transport"))
+    max_streams = payload.get("max_streams_per_connection", DEFAULT_MAX_STREAMS_PER_CONNECTION)
+    if not isinstance(max_streams, int) or isinstance(max_streams, bool):
+        raise ValueError("max_streams_per_connection must be an int")
+    decode_workers = payload.get("decode_workers", 0)
+    if not isinstance(decode_workers, int) or isinstance(decode_workers, bool):
+        raise ValueError("decode_workers must be an int")
+    decode_queue_size = payload.get("decode_queue_size", DEFAULT_DECODE_QUEUE_SIZE)
+    if not isinstance(decode_queue_size, int) or isinstance(decode_queue_size, bool):
+        raise ValueError("decode_queue_size must be an int")
+    shm_ring_bytes = payload.get("shm_ring_bytes", DEFAULT_SHM_RING_BYTES)
+    if not isinstance(shm_ring_bytes, int) or isinstance(shm_ring_bytes, bool):
+        raise ValueError("shm_ring_bytes must be an int")
     return MarketDataRuntimeConfig(
-        symbol=symbol,
+        symbols=symbols,
         enabled_adapters=frozenset(enabled_adapters),
         backpressure=backpressure,
+        runtime_mode=runtime_mode,
+        transport=transport,
+        max_streams_per_connection=max_streams,
+        json_backend=_parse_json_backend(payload.get("json_backend")),
+        decode_workers=decode_workers,
+        decode_queue_size=decode_queue_size,
+        decode_failure_coalescing=_parse_decode_failure_coalescing(
+            payload.get("decode_failure_coalescing", {})
+        ),
+        deployment=_parse_deployment(payload.get("deployment")),
+        shm_ring_bytes=shm_ring_bytes,
     )
 
 
+def _parse_decode_failure_coalescing(data: object) -> DecodeFailureCoalescingConfig | None:
+    if data is None:
+        return None
+    if not isinstance(data, Mapping):
+        raise ValueError("decode_failure_coalescing must be a mapping or null")
+    defaults = DecodeFailureCoalescingConfig()
+    values: dict[str, int] = {}
+    for key in ("window_ms", "max_per_window", "max_samples"):
+        value = data.get(key, getattr(defaults, key))
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"decode_failure_coalescing.{key} must be an int")
+        values[key] = value
+    unknown = set(data.keys()) - set(values)
+    if unknown:
+        unknown_list = ", ".join(sorted(str(item) for item in unknown))
+        raise ValueError(f"unknown decode_failure_coalescing keys: {unknown_list}")
+    return DecodeFailureCoalescingConfig(**values)
+
+
+def _parse_json_backend(data: object) -> str:
+    if data is None:
+        return "auto"
+    allowed = ("auto", *JSON_BACKENDS)
+    if not isinstance(data, str) or data not in allowed:
+        raise ValueError(f"json_backend must be one of: {', '.join(allowed)}")
+    return data
+
+
+def _parse_symbols(payload: Mapping[str, object]) -> tuple[str, ...]:
+    if "symbols" not in payload:
+        symbol = payload.get("symbol")
+        if not isinstance(symbol, str) or not symbol:
+            raise ValueError("market_data config requires non-empty symbols")
+        return (symbol,)
+    if "symbol" in payload:
+        raise ValueError("market_data config accepts symbol or symbols, not both")
+    data = payload["symbols"]
+    if not isinstance(data, list) or not data:
+        raise ValueError("market_data config requires non-empty symbols")
+    for symbol in data:
+        if not isinstance(symbol, str) or not symbol:
+            raise ValueError("symbols must be non-empty strings")
+    return tuple(data)
+
+
+def _parse_runtime_mode(data: object) -> RuntimeMode:
+    if data is None:
+        return RuntimeMode.THREADED
+    if not isinstance(data, str):
+        raise ValueError("runtime_mode must be a string")
+    try:
+        return RuntimeMode(data)
+    except ValueError as exc:
+        allowed = ", ".join(mode.value for mode in RuntimeMode)
+        raise ValueError(f"runtime_mode must be one of: {allowed}") from exc
+
+
+def _parse_deployment(data: object) -> DeploymentMode:
+    if data is None:
+        return DeploymentMode.IN_PROCESS
+    if not isinstance(data, str):
+        raise ValueError("deployment must be a string")
+    try:
+        return DeploymentMode(data)
+    except ValueError as exc:
+        allowed = ", ".join(mode.value for mode in DeploymentMode)
+        raise ValueError(f"deployment must be one of: {allowed}") from exc
+
+
+def _parse_transport(data: object) -> TransportMode:
+    if data is None:
+        return TransportMode.PER_STREAM
+    if not isinstance(data, str):
+        raise ValueError("transport must be a string")
+    try:
+        return TransportMode(data)
+    except ValueError as exc:
+        allowed = ", ".join(mode.value for mode in TransportMode)
+        raise ValueError(f"transport must be one of: {allowed}") from exc
+
+
 def _parse_backpressure(data: object) -> BackpressureConfig:
     if not isinstance(data, Mapping):
         raise ValueError("market_data config requires backpressure mapping")
@@ -60,11 +178,13 @@ def _parse_backpressure(data: object) -> BackpressureConfig:
         raise ValueError("backpressure.max_pending must be an int")
     if max_block_ms is not None and not isinstance(max_block_ms, int):
         raise ValueError("backpressure.max_block_ms must be an int")
-    return BackpressureConfig(
+    backpressure = BackpressureConfig(
         policy=policy,
         max_pending=max_pending,
         max_block_ms=max_block_ms,
     )
+    _validate_backpressure(backpressure)
+    return backpressure
 
 
 def _parse_enabled_adapters(data: object) -> frozenset[AdapterType]:
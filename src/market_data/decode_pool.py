@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Protocol, runtime_checkable
+
+from market_data.observability import Observability, get_observability
+
+FrameHandler = Callable[[str | bytes, int], None]
+ErrorHandler = Callable[[Exception], None]
+
+_STOP = object()
+
+
+@runtime_checkable
+class DecodePoolClient(Protocol):
+    def attach_decode_pool(self, pool: DecodeWorkerPool) -> None: ...
+
+
+class DecodeWorkerPool:
+    """Runs frame decoding off the websocket receive loop.
+
+    Each stream registers once and is pinned to one worker, so frames from a
+    stream are handled in receive order while different streams decode in
+    parallel. Every worker has its own bounded queue of
+    `(recv_ts_ms, frame)` items; queue lag and depth are reported per worker.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        queue_size: int,
+        observability: Observability | None = None,
+        name: str = "market-data-decode",
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be > 0")
+        if queue_size <= 0:
+            raise ValueError("queue_size must be > 0")
+        self._observability = observability
+        self._queues: list[queue.Queue[object]] = [
+            queue.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        self._threads = [
+            threading.Thread(
+                target=self._work, args=(index,), name=f"{name}-{index}", daemon=True
+            )
+            for index in range(workers)
+        ]
+        self._registered = 0
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def workers(self) -> int:
+        return len(self._queues)
+
+    def register(self) -> int:
+        """Return the worker index a new stream should submit to."""
+        with self._lock:
+            index = self._registered % len(self._queues)
+            self._registered += 1
+            return index
+
+    def depth(self, worker: int) -> int:
+        return self._queues[worker].qsize()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout_s: float = 1.0) -> None:
+        for work_queue in self._queues:
+            try:
+                work_queue.put(_STOP, timeout=timeout_s)
+            except queue.Full:
+                continue
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join(timeout=timeout_s)
+
+    async def submit(
+        self,
+        worker: int,
+        *,
+        handler: FrameHandler,
+        on_error: ErrorHandler,
+        recv_ts_ms: int,
+        frame: str | bytes,
+        timeout_ms: int,
+    ) -> None:
+        """Queue a frame; waits off-loop while the worker queue is full."""
+        item = (time.monotonic(), recv_ts_ms, frame, handler, on_error)
+        work_queue = self._queues[worker]
+        try:
+            work_queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        try:
+            await asyncio.to_thread(work_queue.put, item, True, timeout_ms / 1000)
+        except queue.Full as exc:
+            raise RuntimeError(f"decode queue {worker} full") from exc
+
+    def _work(self, index: int) -> None:
+        work_queue = self._queues[index]
+        worker_tag = str(index)
+        while True:
+            item = work_queue.get()
+            if item is _STOP:
+                return
+            enqueued_at, recv_ts_ms, frame, handler, on_error = item  # type: ignore[misc]
+            observability = self._observability or get_observability()
+            observability.record_decode_queue(
+                worker=worker_tag,
+                lag_ms=(time.monotonic() - enqueued_at) * 1000,
+                depth=work_queue.qsize(),
+            )
+            try:
+                handler(frame, recv_ts_ms)
+            except Exception as exc:
+                observability.logger.log(
+                    logging.ERROR,
+                    "market_data.decode_worker_failed",
+                    {"worker": index, "error_detail": str(exc)},
+                )
+                on_error(exc)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 from market_data.contracts import RawMarketEvent
+from market_data.json_backend import JsonDecodeError, get_json_backend
 from market_data.pipeline import IngestionPipeline
 
 
@@ -75,12 +75,8 @@ def _decode_payload(raw_payload: bytes | str, payload_content_type: str | None)
         raise DecodeError(DecodeFailureDetail("decode_error", "unsupported content type"))
 
     try:
-        if isinstance(raw_payload, bytes):
-            text = raw_payload.decode("utf-8")
-        else:
-            text = raw_payload
-        return json.loads(text)
-    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        return get_json_backend().loads(raw_payload)
+    except JsonDecodeError as exc:
         raise DecodeError(DecodeFailureDetail("decode_error", str(exc))) from exc
 
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+from market_data.config import DecodeFailureCoalescingConfig, _validate_decode_failure_coalescing
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+
+_FailureKey = tuple[str, str, str | None, str, str]
+
+
+@dataclass
+class _FailureWindow:
+    admitted: int = 0
+    suppressed: int = 0
+    first: RawMarketEvent | None = None
+    samples: list[bytes | str] = field(default_factory=list)
+
+
+class DecodeFailureCoalescer:
+    """Caps identical DecodeFailure events per window.
+
+    Failures are keyed by `(source_id, symbol, channel, error_kind,
+    error_detail)`, so each summary is attributed to the symbol it covers.
+    The first `max_per_window` of a key in each window pass through; the rest
+    are counted, and once the window closes a single summary DecodeFailure
+    carries the count and up to `max_samples` of the suppressed payloads.
+
+    Windows only close in `drain`; the pipeline drains on every ingest and
+    the market data runtime also drains on a timer and, forced, on stop.
+    """
+
+    def __init__(self, config: DecodeFailureCoalescingConfig) -> None:
+        _validate_decode_failure_coalescing(config)
+        self._config = config
+        self._lock = threading.Lock()
+        self._windows: dict[_FailureKey, _FailureWindow] = {}
+        self._window_start_ms: int | None = None
+        self._window_end_ms: int | None = None
+
+    def admit(self, event: RawMarketEvent) -> bool:
+        """Return False if `event` was folded into the current window's summary."""
+        key = (
+            event.source_id,
+            event.symbol,
+            event.channel,
+            str(event.normalized.get("error_kind")),
+            str(event.normalized.get("error_detail")),
+        )
+        with self._lock:
+            if self._window_end_ms is None:
+                self._window_start_ms = event.recv_ts_ms
+                self._window_end_ms = event.recv_ts_ms + self._config.window_ms
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = _FailureWindow()
+            if window.admitted < self._config.max_per_window:
+                window.admitted += 1
+                return True
+            window.suppressed += 1
+            if window.first is None:
+                window.first = event
+            if len(window.samples) < self._config.max_samples:
+                window.samples.append(event.raw_payload)
+            return False
+
+    def drain(self, now_ms: int, *, force: bool = False) -> list[RawMarketEvent]:
+        """Close the window if it has ended, or `force`d, and return its summaries.
+
+        A forced close before the window's end reports `now_ms` as its end.
+        """
+        window_end_ms = self._window_end_ms
+        if window_end_ms is None or (now_ms < window_end_ms and not force):
+            return []
+        with self._lock:
+            window_end_ms = self._window_end_ms
+            if window_end_ms is None or (now_ms < window_end_ms and not force):
+                return []
+            window_end_ms = min(window_end_ms, now_ms)
+            window_start_ms = self._window_start_ms
+            windows, self._windows = self._windows, {}
+            self._window_start_ms = None
+            self._window_end_ms = None
+        return [
+            _summary_event(
+                window.first,
+                window,
+                window_start_ms=window_start_ms or 0,
+                window_end_ms=window_end_ms,
+                recv_ts_ms=now_ms,
+            )
+            for window in windows.values()
+            if window.first is not None
+        ]
+
+
+def _summary_event(
+    first: RawMarketEvent,
+    window: _FailureWindow,
+    *,
+    window_start_ms: int,
+    window_end_ms: int,
+    recv_ts_ms: int,
+) -> RawMarketEvent:
+    samples = [
+        sample if isinstance(sample, str) else sample.decode("utf-8", "replace")
+        for sample in window.samples
+    ]
+    return RawMarketEvent(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type="DecodeFailure",
+        source_id=first.source_id,
+        symbol=first.symbol,
+        exchange_ts_ms=None,
+        recv_ts_ms=recv_ts_ms,
+        raw_payload=first.raw_payload,
+        normalized={
+            "error_kind": first.normalized.get("error_kind"),
+            "error_detail": first.normalized.get("error_detail"),
+            "coalesced_count": window.suppressed,
+            "window_start_ms": window_start_ms,
+            "window_end_ms": window_end_ms,
+            "sample_payloads": samples,
+        },
+        channel=first.channel,
+        payload_content_type=first.payload_content_type,
+    )
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import marshal
+import struct
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+from market_data.contracts import RawMarketEvent
+
+# Binary event framing shared by the journal, the shared-memory ring and the
+# orchestrator's spill segments. A stream is a run of
+# `<length:u32><kind:u8><body>` frames: string frames intern a value under an
+# id, event frames refer to those ids. File-backed streams start with
+# `segment_header()`, which records the normalized encoding of its frames.
+FORMAT_VERSION = 2
+
+# Normalized mappings are encoded either with the tagged format below, which
+# is stable across interpreter versions and is what durable files use, or
+# with `marshal`, which is several times faster but only readable by the same
+# interpreter; it is reserved for streams that never outlive the process
+# tree that wrote them (the shared-memory ring, spill segments).
+NORMALIZED_TAGGED = 1
+NORMALIZED_MARSHAL = 2
+_MARSHAL_VERSION = 4
+
+_SEGMENT_MAGIC = b"RMEJ"
+SEGMENT_HEADER = struct.Struct("<4sHH")
+_FRAME_HEADER = struct.Struct("<IB")
+_STRING_ID = struct.Struct("<I")
+# recv_ts_ms, exchange_ts_ms, source_seq, flags, seven interned string ids
+# (schema, schema_version, source_id, symbol, event_type, channel,
+# payload_content_type), then byte lengths of source_event_id, payload_hash,
+# normalized and raw_payload.
+_EVENT_HEADER = struct.Struct("<qqqB7I4I")
+
+_KIND_STRING = 1
+_KIND_EVENT = 2
+
+_FLAG_EXCHANGE_TS = 1
+_FLAG_SOURCE_SEQ = 2
+_FLAG_TEXT_PAYLOAD = 4
+_FLAG_SOURCE_EVENT_ID = 8
+_FLAG_PAYLOAD_HASH = 16
+
+# Normalized values use a tagged encoding that does not depend on the
+# interpreter version: one tag byte, then a fixed-width value or a u32
+# length/count followed by the contents.
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3
+_TAG_BIG_INT = 4
+_TAG_FLOAT = 5
+_TAG_STR = 6
+_TAG_BYTES = 7
+_TAG_LIST = 8
+_TAG_TUPLE = 9
+_TAG_MAP = 10
+
+_TAGGED_INT = struct.Struct("<Bq")
+_TAGGED_FLOAT = struct.Struct("<Bd")
+_TAGGED_LENGTH = struct.Struct("<BI")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+_INT_MIN = -(2**63)
+_INT_MAX = 2**63 - 1
+
+
+class JournalFormatError(ValueError):
+    """Raised when a segment or index file is not a valid journal file."""
+
+
+@dataclass(frozen=True)
+class JournalFrame:
+    """One framed event as views into the buffer it was read from.
+
+    `raw_payload` and `normalized_bytes` are slices of that buffer; call
+    `to_event` to materialize a `RawMarketEvent`.
+    """
+
+    schema: str
+    schema_version: str
+    event_type: str
+    source_id: str
+    symbol: str
+    exchange_ts_ms: int | None
+    recv_ts_ms: int
+    raw_payload: memoryview
+    payload_is_text: bool
+    normalized_bytes: memoryview
+    source_event_id: str | None
+    source_seq: int | None
+    channel: str | None
+    payload_content_type: str | None
+    payload_hash: str | None
+    normalized_encoding: int = NORMALIZED_TAGGED
+
+    def to_event(self) -> RawMarketEvent:
+        raw_payload: bytes | str
+        if self.payload_is_text:
+            raw_payload = str(self.raw_payload, "utf-8")
+        else:
+            raw_payload = self.raw_payload.tobytes()
+        return RawMarketEvent(
+            schema=self.schema,
+            schema_version=self.schema_version,
+            event_type=self.event_type,
+            source_id=self.source_id,
+            symbol=self.symbol,
+            exchange_ts_ms=self.exchange_ts_ms,
+            recv_ts_ms=self.recv_ts_ms,
+            raw_payload=raw_payload,
+            normalized=_decode_normalized(self.normalized_encoding, self.normalized_bytes),
+            source_event_id=self.source_event_id,
+            source_seq=self.source_seq,
+            channel=self.channel,
+            payload_content_type=self.payload_content_type,
+            payload_hash=self.payload_hash,
+        )
+
+
+def segment_header(normalized_encoding: int = NORMALIZED_TAGGED) -> bytes:
+    return SEGMENT_HEADER.pack(_SEGMENT_MAGIC, FORMAT_VERSION, normalized_encoding)
+
+
+def check_segment_header(
+    view: memoryview, path: str, *, normalized_encoding: int = NORMALIZED_TAGGED
+) -> None:
+    magic, version, encoding = SEGMENT_HEADER.unpack_from(view)
+    if magic != _SEGMENT_MAGIC or version != FORMAT_VERSION:
+        raise JournalFormatError(f"unsupported segment file: {path}")
+    if encoding != normalized_encoding:
+        raise JournalFormatError(f"unsupported normalized encoding: {path}")
+
+
+def header_strings(event: RawMarketEvent) -> tuple[str | None, ...]:
+    """The header strings `event_frame` expects interned ids for, in order."""
+    return (
+        event.schema,
+        event.schema_version,
+        event.source_id,
+        event.symbol,
+        event.event_type,
+        event.channel,
+        event.payload_content_type,
+    )
+
+
+def string_frame(string_id: int, value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return (
+        _FRAME_HEADER.pack(_STRING_ID.size + len(encoded), _KIND_STRING)
+        + _STRING_ID.pack(string_id)
+        + encoded
+    )
+
+
+def event_frame(
+    event: RawMarketEvent,
+    ids: tuple[int, ...],
+    *,
+    normalized_encoding: int = NORMALIZED_TAGGED,
+) -> tuple[bytes, ...]:
+    """Parts of one event frame; `ids` are the interned `header_strings` in order."""
+    flags = 0
+    exchange_ts_ms = event.exchange_ts_ms
+    if exchange_ts_ms is not None:
+        flags |= _FLAG_EXCHANGE_TS
+    source_seq = event.source_seq
+    if source_seq is not None:
+        flags |= _FLAG_SOURCE_SEQ
+    raw_payload = event.raw_payload
+    if isinstance(raw_payload, str):
+        flags |= _FLAG_TEXT_PAYLOAD
+        raw_payload = raw_payload.encode("utf-8")
+    source_event_id = b""
+    if event.source_event_id is not None:
+        flags |= _FLAG_SOURCE_EVENT_ID
+        source_event_id = event.source_event_id.encode("utf-8")
+    payload_hash = b""
+    if event.payload_hash is not None:
+        flags |= _FLAG_PAYLOAD_HASH
+        payload_hash = event.payload_hash.encode("utf-8")
+    if normalized_encoding == NORMALIZED_MARSHAL:
+        normalized = marshal.dumps(dict(event.normalized), _MARSHAL_VERSION)
+    else:
+        normalized = encode_normalized(event.normalized)
+    header = _EVENT_HEADER.pack(
+        event.recv_ts_ms,
+        exchange_ts_ms or 0,
+        source_seq or 0,
+        flags,
+        *ids,
+        len(source_event_id),
+        len(payload_hash),
+        len(normalized),
+        len(raw_payload),
+    )
+    body_length = (
+        len(header) + len(source_event_id) + len(payload_hash) + len(normalized)
+        + len(raw_payload)
+    )
+    return (
+        _FRAME_HEADER.pack(body_length, _KIND_EVENT),
+        header,
+        source_event_id,
+        payload_hash,
+        normalized,
+        raw_payload,
+    )
+
+
+def iter_frames(
+    view: memoryview,
+    offset: int,
+    strings: dict[int, str],
+    *,
+    start_recv_ts_ms: int | None,
+    end_recv_ts_ms: int | None,
+    normalized_encoding: int = NORMALIZED_TAGGED,
+) -> Iterator[JournalFrame]:
+    """Yield event frames from `offset`, updating `strings` as string frames pass.
+
+    A torn final frame ends the iteration quietly.
+    """
+    end = len(view)
+    frame_header_size = _FRAME_HEADER.size
+    event_header_size = _EVENT_HEADER.size
+    unpack_frame = _FRAME_HEADER.unpack_from
+    unpack_event = _EVENT_HEADER.unpack_from
+    while offset + frame_header_size <= end:
+        body_length, kind = unpack_frame(view, offset)
+        body = offset + frame_header_size
+        next_offset = body + body_length
+        if next_offset > end:
+            # Torn final frame from an unclean shutdown.
+            return
+        offset = next_offset
+        if kind == _KIND_STRING:
+            (string_id,) = _STRING_ID.unpack_from(view, body)
+            strings[string_id] = str(view[body + _STRING_ID.size : next_offset], "utf-8")
+            continue
+        if kind != _KIND_EVENT:
+            raise JournalFormatError(f"unknown frame kind: {kind}")
+        (
+            recv_ts_ms,
+            exchange_ts_ms,
+            source_seq,
+            flags,
+            schema_id,
+            schema_version_id,
+            source_id_id,
+            symbol_id,
+            event_type_id,
+            channel_id,
+            content_type_id,
+            event_id_length,
+            hash_length,
+            normalized_length,
+            payload_length,
+        ) = unpack_event(view, body)
+        if start_recv_ts_ms is not None and recv_ts_ms < start_recv_ts_ms:
+            continue
+        if end_recv_ts_ms is not None and recv_ts_ms >= end_recv_ts_ms:
+            continue
+        cursor = body + event_header_size
+        source_event_id = None
+        if flags & _FLAG_SOURCE_EVENT_ID:
+            source_event_id = str(view[cursor : cursor + event_id_length], "utf-8")
+            cursor += event_id_length
+        payload_hash = None
+        if flags & _FLAG_PAYLOAD_HASH:
+            payload_hash = str(view[cursor : cursor + hash_length], "utf-8")
+            cursor += hash_length
+        normalized_bytes = view[cursor : cursor + normalized_length]
+        cursor += normalized_length
+        yield JournalFrame(
+            schema=strings[schema_id],
+            schema_version=strings[schema_version_id],
+            event_type=strings[event_type_id],
+            source_id=strings[source_id_id],
+            symbol=strings[symbol_id],
+            exchange_ts_ms=exchange_ts_ms if flags & _FLAG_EXCHANGE_TS else None,
+            recv_ts_ms=recv_ts_ms,
+            raw_payload=view[cursor : cursor + payload_length],
+            payload_is_text=bool(flags & _FLAG_TEXT_PAYLOAD),
+            normalized_bytes=normalized_bytes,
+            source_event_id=source_event_id,
+            source_seq=source_seq if flags & _FLAG_SOURCE_SEQ else None,
+            channel=strings[channel_id] if channel_id else None,
+            payload_content_type=strings[content_type_id] if content_type_id else None,
+            payload_hash=payload_hash,
+            normalized_encoding=normalized_encoding,
+        )
+
+
+def encode_normalized(normalized: Mapping[str, object]) -> bytes:
+    """Encode a normalized mapping; supports None, bool, int, float, str, bytes,
+    lists, tuples and mappings, nested."""
+    out = bytearray()
+    _encode_value(normalized, out)
+    return bytes(out)
+
+
+def decode_normalized(data: bytes | memoryview) -> dict[str, object]:
+    value, offset = _decode_value(memoryview(data), 0)
+    if not isinstance(value, dict):
+        raise JournalFormatError("normalized value is not a mapping")
+    if offset != len(data):
+        raise JournalFormatError("trailing bytes after normalized value")
+    return value
+
+
+def _decode_normalized(encoding: int, data: memoryview) -> dict[str, object]:
+    if encoding == NORMALIZED_MARSHAL:
+        return marshal.loads(data)  # type: ignore[no-any-return]
+    return decode_normalized(data)
+
+
+def _encode_value(value: object, out: bytearray) -> None:
+    if isinstance(value, float):
+        out += _TAGGED_FLOAT.pack(_TAG_FLOAT, value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        out += _TAGGED_LENGTH.pack(_TAG_STR, len(encoded))
+        out += encoded
+    elif value is None:
+        out.append(_TAG_NONE)
+    elif isinstance(value, bool):
+        out.append(_TAG_TRUE if value else _TAG_FALSE)
+    elif isinstance(value, int):
+        if _INT_MIN <= value <= _INT_MAX:
+            out += _TAGGED_INT.pack(_TAG_INT, value)
+        else:
+            encoded = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+            out += _TAGGED_LENGTH.pack(_TAG_BIG_INT, len(encoded))
+            out += encoded
+    elif isinstance(value, (list, tuple)):
+        out += _TAGGED_LENGTH.pack(
+            _TAG_TUPLE if isinstance(value, tuple) else _TAG_LIST, len(value)
+        )
+        for item in value:
+            _encode_value(item, out)
+    elif isinstance(value, Mapping):
+        out += _TAGGED_LENGTH.pack(_TAG_MAP, len(value))
+        for key, item in value.items():
+            _encode_value(key, out)
+            _encode_value(item, out)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        encoded = bytes(value)
+        out += _TAGGED_LENGTH.pack(_TAG_BYTES, len(encoded))
+        out += encoded
+    else:
+        raise TypeError(f"cannot encode normalized value of type {type(value).__name__}")
+
+
+def _decode_value(view: memoryview, offset: int) -> tuple[object, int]:
+    tag = view[offset]
+    offset += 1
+    if tag == _TAG_FLOAT:
+        return _FLOAT.unpack_from(view, offset)[0], offset + 8
+    if tag == _TAG_STR:
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += 4
+        return str(view[offset : offset + length], "utf-8"), offset + length
+    if tag == _TAG_INT:
+        return _INT.unpack_from(view, offset)[0], offset + 8
+    if tag == _TAG_NONE:
+        return None, offset
+    if tag == _TAG_TRUE:
+        return True, offset
+    if tag == _TAG_FALSE:
+        return False, offset
+    if tag in (_TAG_LIST, _TAG_TUPLE):
+        (count,) = _LENGTH.unpack_from(view, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _decode_value(view, offset)
+            items.append(item)
+        return (tuple(items) if tag == _TAG_TUPLE else items), offset
+    if tag == _TAG_MAP:
+        (count,) = _LENGTH.unpack_from(view, offset)
+        offset += 4
+        mapping: dict[object, object] = {}
+        for _ in range(count):
+            key, offset = _decode_value(view, offset)
+            mapping[key], offset = _decode_value(view, offset)
+        return mapping, offset
+    if tag == _TAG_BYTES:
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += 4
+        return view[offset : offset + length].tobytes(), offset + length
+    if tag == _TAG_BIG_INT:
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += 4
+        return int.from_bytes(view[offset : offset + length], "little", signed=True), (
+            offset + length
+        )
+    raise JournalFormatError(f"unknown normalized tag: {tag}")
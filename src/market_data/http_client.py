@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import http.client
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+
+# Errors that mean a reused keep-alive connection was closed by the server
+# between requests; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class HttpStatusError(RuntimeError):
+    def __init__(self, status: int, body: bytes, *, latency_ms: float) -> None:
+        super().__init__(f"http status {status}")
+        self.status = status
+        self.body = body
+        self.latency_ms = latency_ms
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    body: bytes
+    latency_ms: float
+
+
+class PooledHttpClient:
+    """Keep-alive HTTP/1.1 client for a single host.
+
+    At most `max_connections` requests are in flight at once; callers past
+    the cap wait for a connection to be returned. Idle connections are
+    reused most-recently-used first. After `close`, `get` raises and
+    connections returned by requests still in flight are closed rather than
+    pooled.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_connections: int = 4,
+        timeout_ms: int = 10_000,
+    ) -> None:
+        if max_connections <= 0:
+            raise ValueError("max_connections must be > 0")
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError(f"unsupported base_url: {base_url}")
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._base_path = parsed.path.rstrip("/")
+        self._timeout_s = timeout_ms / 1000
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._closed = False
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def connections_opened(self) -> int:
+        return self._opened
+
+    def get(self, path: str) -> HttpResponse:
+        """GET `path`; raises HttpStatusError for non-2xx responses."""
+        target = f"{self._base_path}{path}"
+        with self._slots:
+            connection, reused = self._checkout()
+            start = time.perf_counter()
+            try:
+                try:
+                    status, body, keep = self._request(connection, target)
+                except _STALE_CONNECTION_ERRORS:
+                    connection.close()
+                    if not reused:
+                        raise
+                    connection, reused = self._connect(), False
+                    start = time.perf_counter()
+                    status, body, keep = self._request(connection, target)
+            except BaseException:
+                connection.close()
+                raise
+            latency_ms = (time.perf_counter() - start) * 1000
+            self._checkin(connection, keep=keep)
+        if not 200 <= status < 300:
+            raise HttpStatusError(status, body, latency_ms=latency_ms)
+        return HttpResponse(status=status, body=body, latency_ms=latency_ms)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("http client is closed")
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def _checkin(self, connection: http.client.HTTPConnection, *, keep: bool) -> None:
+        with self._lock:
+            if keep and not self._closed:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        connection_type = (
+            http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        )
+        with self._lock:
+            self._opened += 1
+        return connection_type(self._host, self._port, timeout=self._timeout_s)
+
+    @staticmethod
+    def _request(
+        connection: http.client.HTTPConnection, target: str
+    ) -> tuple[int, bytes, bool]:
+        connection.request("GET", target, headers={"Accept": "application/json"})
+        response = connection.getresponse()
+        body = response.read()
+        return response.status, body, not response.will_close
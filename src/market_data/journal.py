@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from market_data.contracts import RawMarketEvent
+from market_data.framing import (
+    FORMAT_VERSION,
+    SEGMENT_HEADER,
+    JournalFormatError,
+    JournalFrame,
+    check_segment_header,
+    event_frame,
+    header_strings,
+    iter_frames,
+    segment_header,
+    string_frame,
+)
+
+__all__ = [
+    "JournalFormatError",
+    "JournalFrame",
+    "JournalReader",
+    "RawEventJournal",
+    "segment_paths",
+]
+
+# Segment files hold `framing` frames after `segment_header()`; sealing a
+# segment writes a sparse `recv_ts_ms` index next to it.
+SEGMENT_SUFFIX = ".journal"
+INDEX_SUFFIX = ".index"
+DEFAULT_MAX_SEGMENT_BYTES = 256 * 1024 * 1024
+DEFAULT_INDEX_INTERVAL = 1024
+
+_INDEX_MAGIC = b"RMEI"
+_STRING_ID = struct.Struct("<I")
+_INDEX_HEADER = struct.Struct("<4sHqqQII")
+_INDEX_ENTRY = struct.Struct("<qQ")
+
+
+class _SegmentWriter:
+    def __init__(self, path: str, *, index_interval: int) -> None:
+        self.path = path
+        self._index_interval = index_interval
+        self._handle: BinaryIO = open(path, "xb")
+        self._handle.write(segment_header())
+        self.size = SEGMENT_HEADER.size
+        self._strings: dict[str, int] = {}
+        self._event_count = 0
+        self._min_recv_ts_ms: int | None = None
+        self._max_recv_ts_ms: int | None = None
+        self._index: list[tuple[int, int]] = []
+
+    def append(self, event: RawMarketEvent) -> None:
+        ids = tuple(self._intern(value) for value in header_strings(event))
+        if self._event_count % self._index_interval == 0:
+            max_before = self._max_recv_ts_ms if self._max_recv_ts_ms is not None else -(2**63)
+            self._index.append((max_before, self.size))
+
+        frame = event_frame(event, ids)
+        write = self._handle.write
+        for part in frame:
+            write(part)
+        self.size += sum(len(part) for part in frame)
+
+        self._event_count += 1
+        recv_ts_ms = event.recv_ts_ms
+        if self._min_recv_ts_ms is None or recv_ts_ms < self._min_recv_ts_ms:
+            self._min_recv_ts_ms = recv_ts_ms
+        if self._max_recv_ts_ms is None or recv_ts_ms > self._max_recv_ts_ms:
+            self._max_recv_ts_ms = recv_ts_ms
+
+    def flush(self, *, fsync: bool) -> None:
+        self._handle.flush()
+        if fsync:
+            os.fsync(self._handle.fileno())
+
+    def seal(self, *, fsync: bool) -> None:
+        self.flush(fsync=fsync)
+        self._handle.close()
+        _write_index(
+            _index_path(self.path),
+            min_recv_ts_ms=self._min_recv_ts_ms or 0,
+            max_recv_ts_ms=self._max_recv_ts_ms or 0,
+            event_count=self._event_count,
+            entries=self._index,
+            strings=self._strings,
+        )
+
+    def _intern(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        string_id = self._strings.get(value)
+        if string_id is not None:
+            return string_id
+        string_id = len(self._strings) + 1
+        self._strings[value] = string_id
+        frame = string_frame(string_id, value)
+        self._handle.write(frame)
+        self.size += len(frame)
+        return string_id
+
+
+class RawEventJournal:
+    """Append-only segment journal for `RawMarketEvent`.
+
+    Segments rotate once they exceed `max_segment_bytes`; sealing a segment
+    writes its sparse `recv_ts_ms` index next to it. The journal implements
+    the sink protocols, so it can sit behind `QueueRawEventSink` or be
+    written to directly.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        index_interval: int = DEFAULT_INDEX_INTERVAL,
+        fsync: bool = False,
+    ) -> None:
+        if max_segment_bytes <= 0:
+            raise ValueError("max_segment_bytes must be > 0")
+        if index_interval <= 0:
+            raise ValueError("index_interval must be > 0")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_segment_bytes = max_segment_bytes
+        self._index_interval = index_interval
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        existing = segment_paths(directory)
+        self._next_segment = _segment_number(existing[-1]) + 1 if existing else 0
+        self._segment: _SegmentWriter | None = None
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def append(self, event: RawMarketEvent) -> None:
+        with self._lock:
+            self._append_locked(event)
+
+    def write(self, event: RawMarketEvent, *, block: bool, timeout_ms: int | None) -> None:
+        self.append(event)
+
+    def write_batch(
+        self, events: Sequence[RawMarketEvent], *, block: bool, timeout_ms: int | None
+    ) -> None:
+        with self._lock:
+            for event in events:
+                self._append_locked(event)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._segment is not None:
+                self._segment.flush(fsync=self._fsync)
+
+    def rotate(self) -> None:
+        with self._lock:
+            self._seal_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._seal_locked()
+
+    def _append_locked(self, event: RawMarketEvent) -> None:
+        segment = self._segment
+        if segment is None:
+            path = os.path.join(self._directory, f"{self._next_segment:010d}{SEGMENT_SUFFIX}")
+            self._next_segment += 1
+            segment = _SegmentWriter(path, index_interval=self._index_interval)
+            self._segment = segment
+        segment.append(event)
+        if segment.size >= self._max_segment_bytes:
+            self._seal_locked()
+
+    def _seal_locked(self) -> None:
+        if self._segment is None:
+            return
+        self._segment.seal(fsync=self._fsync)
+        self._segment = None
+
+
+class JournalReader:
+    """Iterates journaled events from memory-mapped segments in write order."""
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+
+    def segments(self) -> list[str]:
+        return segment_paths(self._directory)
+
+    def frames(
+        self,
+        *,
+        start_recv_ts_ms: int | None = None,
+        end_recv_ts_ms: int | None = None,
+    ) -> Iterator[JournalFrame]:
+        """Yield frames with `start <= recv_ts_ms < end`, without copying payloads.
+
+        Frames are only valid while the consumer holds them; a segment's
+        mapping is released once no frame from it is referenced.
+        """
+        for path in self.segments():
+            index = _read_index(_index_path(path))
+            if index is not None and start_recv_ts_ms is not None:
+                if index.event_count == 0 or index.max_recv_ts_ms < start_recv_ts_ms:
+                    continue
+            if index is not None and end_recv_ts_ms is not None:
+                if index.event_count == 0 or index.min_recv_ts_ms >= end_recv_ts_ms:
+                    continue
+            yield from _iter_segment(
+                path,
+                index=index,
+                start_recv_ts_ms=start_recv_ts_ms,
+                end_recv_ts_ms=end_recv_ts_ms,
+            )
+
+    def events(
+        self,
+        *,
+        start_recv_ts_ms: int | None = None,
+        end_recv_ts_ms: int | None = None,
+    ) -> Iterator[RawMarketEvent]:
+        for frame in self.frames(start_recv_ts_ms=start_recv_ts_ms, end_recv_ts_ms=end_recv_ts_ms):
+            yield frame.to_event()
+
+
+@dataclass(frozen=True)
+class _SegmentIndex:
+    min_recv_ts_ms: int
+    max_recv_ts_ms: int
+    event_count: int
+    max_before: tuple[int, ...]
+    offsets: tuple[int, ...]
+    strings: dict[int, str]
+
+    def start_offset(self, start_recv_ts_ms: int) -> int | None:
+        # Entries record the max recv_ts_ms of everything before their offset,
+        # so skipping to the last entry below `start` never drops a match even
+        # when clocks step backwards.
+        position = bisect.bisect_left(self.max_before, start_recv_ts_ms) - 1
+        if position < 0:
+            return None
+        return self.offsets[position]
+
+
+def segment_paths(directory: str) -> list[str]:
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(name for name in os.listdir(directory) if name.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(directory, name) for name in names]
+
+
+def _segment_number(path: str) -> int:
+    return int(os.path.basename(path)[: -len(SEGMENT_SUFFIX)])
+
+
+def _index_path(segment_path: str) -> str:
+    return segment_path[: -len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+
+
+def _write_index(
+    path: str,
+    *,
+    min_recv_ts_ms: int,
+    max_recv_ts_ms: int,
+    event_count: int,
+    entries: Sequence[tuple[int, int]],
+    strings: dict[str, int],
+) -> None:
+    encoded = [(string_id, value.encode("utf-8")) for value, string_id in strings.items()]
+    with open(path + ".tmp", "wb") as handle:
+        handle.write(
+            _INDEX_HEADER.pack(
+                _INDEX_MAGIC,
+                FORMAT_VERSION,
+                min_recv_ts_ms,
+                max_recv_ts_ms,
+                event_count,
+                len(entries),
+                len(encoded),
+            )
+        )
+        for max_before, offset in entries:
+            handle.write(_INDEX_ENTRY.pack(max_before, offset))
+        for string_id, value in encoded:
+            handle.write(_STRING_ID.pack(string_id))
+            handle.write(_STRING_ID.pack(len(value)))
+            handle.write(value)
+    os.replace(path + ".tmp", path)
+
+
+def _read_index(path: str) -> _SegmentIndex | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if len(data) < _INDEX_HEADER.size:
+        raise JournalFormatError(f"truncated index: {path}")
+    magic, version, min_ts, max_ts, event_count, entry_count, string_count = (
+        _INDEX_HEADER.unpack_from(data)
+    )
+    if magic != _INDEX_MAGIC or version != FORMAT_VERSION:
+        raise JournalFormatError(f"unsupported index file: {path}")
+    offset = _INDEX_HEADER.size
+    max_before: list[int] = []
+    offsets: list[int] = []
+    for _ in range(entry_count):
+        entry_max, entry_offset = _INDEX_ENTRY.unpack_from(data, offset)
+        max_before.append(entry_max)
+        offsets.append(entry_offset)
+        offset += _INDEX_ENTRY.size
+    strings: dict[int, str] = {}
+    for _ in range(string_count):
+        (string_id,) = _STRING_ID.unpack_from(data, offset)
+        (length,) = _STRING_ID.unpack_from(data, offset + _STRING_ID.size)
+        offset += 2 * _STRING_ID.size
+        strings[string_id] = data[offset : offset + length].decode("utf-8")
+        offset += length
+    return _SegmentIndex(
+        min_recv_ts_ms=min_ts,
+        max_recv_ts_ms=max_ts,
+        event_count=event_count,
+        max_before=tuple(max_before),
+        offsets=tuple(offsets),
+        strings=strings,
+    )
+
+
+def _iter_segment(
+    path: str,
+    *,
+    index: _SegmentIndex | None,
+    start_recv_ts_ms: int | None,
+    end_recv_ts_ms: int | None,
+) -> Iterator[JournalFrame]:
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size <= SEGMENT_HEADER.size:
+            return
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        check_segment_header(view, path)
+        strings: dict[int, str] = {0: ""}
+        offset = SEGMENT_HEADER.size
+        if index is not None and start_recv_ts_ms is not None:
+            seek = index.start_offset(start_recv_ts_ms)
+            if seek is not None:
+                strings.update(index.strings)
+                offset = seek
+        yield from iter_frames(
+            view,
+            offset,
+            strings,
+            start_recv_ts_ms=start_recv_ts_ms,
+            end_recv_ts_ms=end_recv_ts_ms,
+        )
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # Frames still reference the mapping; it is unmapped once they go.
+            pass
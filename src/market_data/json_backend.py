@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+JSON_BACKENDS: tuple[str, ...] = ("orjson", "msgspec", "stdlib")
+
+
+class JsonDecodeError(ValueError):
+    """Raised by every backend when a payload is not valid JSON."""
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    name: str
+    loads: Callable[[bytes | str], Any]
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    try:
+        return json.loads(data)
+    except ValueError as exc:
+        raise JsonDecodeError(str(exc)) from exc
+
+
+def _build_stdlib() -> JsonBackend:
+    return JsonBackend(name="stdlib", loads=_stdlib_loads)
+
+
+def _build_orjson() -> JsonBackend | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    orjson_loads = orjson.loads
+    decode_error = orjson.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return orjson_loads(data)
+        except decode_error as exc:
+            raise JsonDecodeError(str(exc)) from exc
+
+    return JsonBackend(name="orjson", loads=loads)
+
+
+def _build_msgspec() -> JsonBackend | None:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    msgspec_decode = msgspec.json.decode
+    decode_error = msgspec.DecodeError
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return msgspec_decode(data)
+        except decode_error as exc:
+            raise JsonDecodeError(str(exc)) from exc
+
+    return JsonBackend(name="msgspec", loads=loads)
+
+
+_BUILDERS: dict[str, Callable[[], JsonBackend | None]] = {
+    "orjson": _build_orjson,
+    "msgspec": _build_msgspec,
+    "stdlib": _build_stdlib,
+}
+
+
+def select_json_backend(preferred: str = "auto") -> JsonBackend:
+    """Return the requested backend, or the fastest installed one for "auto"."""
+    if preferred == "auto":
+        for name in JSON_BACKENDS:
+            backend = _BUILDERS[name]()
+            if backend is not None:
+                return backend
+        raise RuntimeError("no JSON backend available")
+    builder = _BUILDERS.get(preferred)
+    if builder is None:
+        raise ValueError(f"unsupported json backend: {preferred}")
+    backend = builder()
+    if backend is None:
+        raise ValueError(f"json backend not installed: {preferred}")
+    return backend
+
+
+_JSON_BACKEND: JsonBackend | None = None
+
+
+def set_json_backend(backend: JsonBackend) -> None:
+    global _JSON_BACKEND
+    _JSON_BACKEND = backend
+
+
+def get_json_backend() -> JsonBackend:
+    global _JSON_BACKEND
+    if _JSON_BACKEND is None:
+        _JSON_BACKEND = select_json_backend()
+    return _JSON_BACKEND
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+# Log-linear layout: every power-of-two range is split into SUB_BUCKETS linear
+# buckets, so a bucket's width is at most 1/(2 * SUB_BUCKETS) of its value.
+SUB_BUCKETS = 16
+MIN_EXPONENT = -10
+MAX_EXPONENT = 40
+BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT) * SUB_BUCKETS
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+# Tags in caller insertion order; several raw keys may share one SeriesKey.
+RawKey = tuple[str, tuple[tuple[str, str], ...]]
+
+_MIN_VALUE = math.ldexp(0.5, MIN_EXPONENT)
+_MAX_VALUE = math.ldexp(0.5, MAX_EXPONENT)
+
+
+def bucket_index(value: float) -> int:
+    if value < _MIN_VALUE:
+        return 0
+    if value >= _MAX_VALUE:
+        return BUCKET_COUNT - 1
+    mantissa, exponent = math.frexp(value)
+    return (exponent - MIN_EXPONENT) * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+
+def bucket_upper_bound(index: int) -> float:
+    octave, sub = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2 * SUB_BUCKETS), octave + MIN_EXPONENT)
+
+
+class LogLinearHistogram:
+    """Cumulative bucket counts owned by one writer thread.
+
+    Values below the smallest bucket (including negatives) land in bucket 0.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.total = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bucket_index(value)] += 1
+        self.total += value
+
+
+@dataclass(frozen=True)
+class HistogramSummary:
+    count: int
+    mean: float
+    max: float
+    percentiles: Mapping[float, float]
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Activity since the previous snapshot; gauges hold their last value."""
+
+    counters: Mapping[SeriesKey, int]
+    gauges: Mapping[SeriesKey, float]
+    histograms: Mapping[SeriesKey, HistogramSummary]
+
+
+class HistogramMetrics:
+    """In-process MetricsRecorder backed by log-linear histograms.
+
+    Every thread writes to its own shard, so `observe` and `increment` take no
+    lock once a series has been seen by that thread. `snapshot` merges the
+    shards and reports the delta since the previous snapshot. Percentiles are
+    bucket upper bounds, within ~3% of the true value.
+    """
+
+    def __init__(self, *, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> None:
+        self._percentiles = tuple(percentiles)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+        self._series_keys: dict[RawKey, SeriesKey] = {}
+        self._canonical: dict[SeriesKey, SeriesKey] = {}
+        self._gauges: dict[SeriesKey, float] = {}
+        self._previous_histograms: dict[SeriesKey, tuple[list[int], float]] = {}
+        self._previous_counters: dict[SeriesKey, int] = {}
+
+    def increment(
+        self, name: str, value: int = 1, tags: Mapping[str, str] | None = None
+    ) -> None:
+        raw_key = (name, tuple(tags.items()) if tags else ())
+        shard = self._shard()
+        cell = shard.counters.get(raw_key)
+        if cell is None:
+            cell = self._register_counter(shard, raw_key)
+        cell[0] += value
+
+    def observe(
+        self, name: str, value: float, tags: Mapping[str, str] | None = None
+    ) -> None:
+        raw_key = (name, tuple(tags.items()) if tags else ())
+        shard = self._shard()
+        histogram = shard.histograms.get(raw_key)
+        if histogram is None:
+            histogram = self._register_histogram(shard, raw_key)
+        histogram.record(value)
+
+    def gauge(
+        self, name: str, value: float, tags: Mapping[str, str] | None = None
+    ) -> None:
+        raw_key = (name, tuple(tags.items()) if tags else ())
+        series_key = self._series_keys.get(raw_key)
+        if series_key is None:
+            series_key = self._intern(raw_key)
+        self._gauges[series_key] = value
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            histograms: dict[SeriesKey, LogLinearHistogram] = {}
+            counters: dict[SeriesKey, int] = {}
+            for shard in self._shards:
+                for raw_key, histogram in shard.histograms.items():
+                    series_key = self._series_keys[raw_key]
+                    merged = histograms.get(series_key)
+                    if merged is None:
+                        merged = histograms[series_key] = LogLinearHistogram()
+                    _merge_into(merged, histogram)
+                for raw_key, cell in shard.counters.items():
+                    series_key = self._series_keys[raw_key]
+                    counters[series_key] = counters.get(series_key, 0) + cell[0]
+            gauges = self._gauges.copy()
+            return MetricsSnapshot(
+                counters=self._counter_deltas(counters),
+                gauges=gauges,
+                histograms=self._histogram_deltas(histograms),
+            )
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    # Shard dicts only grow under the lock so `snapshot` can iterate them.
+    def _register_counter(self, shard: _Shard, raw_key: RawKey) -> list[int]:
+        with self._lock:
+            self._intern_locked(raw_key)
+            cell = shard.counters[raw_key] = [0]
+            return cell
+
+    def _register_histogram(self, shard: _Shard, raw_key: RawKey) -> LogLinearHistogram:
+        with self._lock:
+            self._intern_locked(raw_key)
+            histogram = shard.histograms[raw_key] = LogLinearHistogram()
+            return histogram
+
+    def _intern(self, raw_key: RawKey) -> SeriesKey:
+        with self._lock:
+            return self._intern_locked(raw_key)
+
+    def _intern_locked(self, raw_key: RawKey) -> SeriesKey:
+        series_key = self._series_keys.get(raw_key)
+        if series_key is None:
+            name, tags = raw_key
+            canonical = (name, tuple(sorted(tags)))
+            series_key = self._canonical.setdefault(canonical, canonical)
+            self._series_keys[raw_key] = series_key
+        return series_key
+
+    def _counter_deltas(self, counters: Mapping[SeriesKey, int]) -> dict[SeriesKey, int]:
+        deltas = {}
+        for series_key, total in counters.items():
+            delta = total - self._previous_counters.get(series_key, 0)
+            self._previous_counters[series_key] = total
+            if delta:
+                deltas[series_key] = delta
+        return deltas
+
+    def _histogram_deltas(
+        self, histograms: Mapping[SeriesKey, LogLinearHistogram]
+    ) -> dict[SeriesKey, HistogramSummary]:
+        summaries = {}
+        for series_key, merged in histograms.items():
+            previous = self._previous_histograms.get(series_key)
+            self._previous_histograms[series_key] = (merged.counts, merged.total)
+            if previous is None:
+                counts, total = merged.counts, merged.total
+            else:
+                counts = [
+                    now - before for now, before in zip(merged.counts, previous[0], strict=True)
+                ]
+                total = merged.total - previous[1]
+            # Bucket counts are authoritative: a writer may be mid-`record`.
+            count = sum(counts)
+            if count > 0:
+                summaries[series_key] = _summarize(counts, count, total, self._percentiles)
+        return summaries
+
+
+class MetricsReporter:
+    """Calls `on_snapshot` with a fresh snapshot every `interval_ms`."""
+
+    def __init__(
+        self,
+        metrics: HistogramMetrics,
+        *,
+        interval_ms: int,
+        on_snapshot: Callable[[MetricsSnapshot], None],
+    ) -> None:
+        if interval_ms <= 0:
+            raise ValueError("interval_ms must be > 0")
+        self._metrics = metrics
+        self._interval_s = interval_ms / 1000
+        self._on_snapshot = on_snapshot
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="market-data-metrics", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1)
+        self._on_snapshot(self._metrics.snapshot())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            self._on_snapshot(self._metrics.snapshot())
+
+
+class _Shard:
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self) -> None:
+        self.counters: dict[RawKey, list[int]] = {}
+        self.histograms: dict[RawKey, LogLinearHistogram] = {}
+
+
+def _merge_into(target: LogLinearHistogram, source: LogLinearHistogram) -> None:
+    counts = target.counts
+    for index, value in enumerate(source.counts):
+        if value:
+            counts[index] += value
+    target.total += source.total
+
+
+def _summarize(
+    counts: Sequence[int], count: int, total: float, percentiles: Sequence[float]
+) -> HistogramSummary:
+    ranks = sorted((max(1, math.ceil(count * p / 100)), p) for p in percentiles)
+    values: dict[float, float] = {}
+    seen = 0
+    highest = 0
+    position = 0
+    for index, bucket_count in enumerate(counts):
+        if not bucket_count:
+            continue
+        seen += bucket_count
+        highest = index
+        while position < len(ranks) and ranks[position][0] <= seen:
+            values[ranks[position][1]] = bucket_upper_bound(index)
+            position += 1
+    return HistogramSummary(
+        count=count,
+        mean=total / count,
+        max=bucket_upper_bound(highest),
+        percentiles={p: values[p] for p in percentiles},
+    )
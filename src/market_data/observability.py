@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+import threading
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Protocol
 
 from market_data.adapter import StreamKey
 from market_data.contracts import RawMarketEvent
+from market_data.metrics import MetricsSnapshot
 
 
 class StructuredLogger(Protocol):
@@ -31,12 +33,18 @@ class MetricsRecorder(Protocol):
 class StdlibLogger:
     logger: logging.Logger
 
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
     def log(self, level: int, message: str, fields: Mapping[str, object]) -> None:
         self.logger.log(level, message, extra={"fields": dict(fields)})
 
 
 @dataclass(frozen=True)
 class NullLogger:
+    def is_enabled_for(self, level: int) -> bool:
+        return False
+
     def log(self, level: int, message: str, fields: Mapping[str, object]) -> None:
         return None
 
@@ -59,71 +67,152 @@ class NullMetrics:
         return None
 
 
-@dataclass
 class _SymbolCadenceStats:
-    raw_events_ingested: int = 0
-    decode_failures: int = 0
-    first_event_timestamp_ms: int | None = None
-    last_event_timestamp_ms: int | None = None
-
-    def record(self, *, event_type: str, event_timestamp_ms: int) -> None:
+    """Cumulative counts for one symbol, written only by the owning thread."""
+
+    __slots__ = (
+        "raw_events_ingested",
+        "decode_failures",
+        "epoch",
+        "first_event_timestamp_ms",
+        "last_event_timestamp_ms",
+    )
+
+    def __init__(self) -> None:
+        self.raw_events_ingested = 0
+        self.decode_failures = 0
+        self.epoch = -1
+        self.first_event_timestamp_ms: int | None = None
+        self.last_event_timestamp_ms: int | None = None
+
+    def record(self, *, event_type: str, event_timestamp_ms: int, epoch: int) -> None:
         if event_type == "DecodeFailure":
             self.decode_failures += 1
         else:
             self.raw_events_ingested += 1
-        if self.first_event_timestamp_ms is None:
+        if self.epoch != epoch:
+            self.epoch = epoch
             self.first_event_timestamp_ms = event_timestamp_ms
         self.last_event_timestamp_ms = event_timestamp_ms
 
 
-@dataclass
 class MarketDataHealthTracker:
-    _symbol_stats: dict[str, _SymbolCadenceStats] = field(default_factory=dict)
-    _adapter_states: dict[str, str] = field(default_factory=dict)
+    """Per-symbol cadence counters and adapter connection status.
+
+    Each recording thread owns a shard of cumulative counters, so
+    `record_event` never takes a lock after a thread first sees a symbol.
+    `snapshot_and_reset` reports the delta since the previous call for that
+    symbol and starts a new epoch, which resets the first-event timestamp.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[dict[str, _SymbolCadenceStats]] = []
+        self._epochs: dict[str, int] = {}
+        self._reported: dict[tuple[int, str], tuple[int, int]] = {}
+        self._connected_streams: dict[str, set[str]] = {}
 
     def record_event(self, event: RawMarketEvent) -> None:
         symbol = event.symbol
-        stats = self._symbol_stats.setdefault(symbol, _SymbolCadenceStats())
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._register_shard()
+        stats = shard.get(symbol)
+        if stats is None:
+            with self._lock:
+                stats = shard[symbol] = _SymbolCadenceStats()
         event_timestamp_ms = event.exchange_ts_ms or event.recv_ts_ms
-        stats.record(event_type=event.event_type, event_timestamp_ms=event_timestamp_ms)
+        stats.record(
+            event_type=event.event_type,
+            event_timestamp_ms=event_timestamp_ms,
+            epoch=self._epochs.get(symbol, 0),
+        )
 
     def record_transport_state(self, *, stream_key: StreamKey, state: str) -> None:
-        self._adapter_states[_stream_key_id(stream_key)] = state
+        stream_id = _stream_key_id(stream_key)
+        if stream_key.symbol is None:
+            return
+        with self._lock:
+            connected = self._connected_streams.setdefault(stream_key.symbol, set())
+            if state == "connected":
+                connected.add(stream_id)
+            else:
+                connected.discard(stream_id)
 
     def snapshot_and_reset(self, symbol: str) -> dict[str, object]:
-        stats = self._symbol_stats.pop(symbol, _SymbolCadenceStats())
-        adapter_status = _adapter_status_for_symbol(symbol, self._adapter_states)
+        with self._lock:
+            epoch = self._epochs.get(symbol, 0)
+            self._epochs[symbol] = epoch + 1
+            raw_events_ingested = 0
+            decode_failures = 0
+            first_event_timestamp_ms: int | None = None
+            last_event_timestamp_ms: int | None = None
+            for index, shard in enumerate(self._shards):
+                stats = shard.get(symbol)
+                if stats is None:
+                    continue
+                ingested, failures = stats.raw_events_ingested, stats.decode_failures
+                last_ingested, last_failures = self._reported.get((index, symbol), (0, 0))
+                self._reported[(index, symbol)] = (ingested, failures)
+                if ingested == last_ingested and failures == last_failures:
+                    continue
+                raw_events_ingested += ingested - last_ingested
+                decode_failures += failures - last_failures
+                first = stats.first_event_timestamp_ms
+                if stats.epoch == epoch and first is not None:
+                    if first_event_timestamp_ms is None or first < first_event_timestamp_ms:
+                        first_event_timestamp_ms = first
+                last = stats.last_event_timestamp_ms
+                if last is not None:
+                    if last_event_timestamp_ms is None or last > last_event_timestamp_ms:
+                        last_event_timestamp_ms = last
+            connected = self._connected_streams.get(symbol)
         return {
-            "raw_events_ingested": stats.raw_events_ingested,
-            "decode_failures": stats.decode_failures,
-            "first_event_timestamp_ms": stats.first_event_timestamp_ms,
-            "last_event_timestamp_ms": stats.last_event_timestamp_ms,
-            "adapter_status": adapter_status,
+            "raw_events_ingested": raw_events_ingested,
+            "decode_failures": decode_failures,
+            "first_event_timestamp_ms": first_event_timestamp_ms,
+            "last_event_timestamp_ms": last_event_timestamp_ms,
+            "adapter_status": "connected" if connected else "disconnected",
         }
 
+    def _register_shard(self) -> dict[str, _SymbolCadenceStats]:
+        shard: dict[str, _SymbolCadenceStats] = {}
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+
+def _is_enabled_for(logger: StructuredLogger, level: int) -> bool:
+    # Loggers without `is_enabled_for` are treated as enabled at every level.
+    is_enabled_for = getattr(logger, "is_enabled_for", None)
+    return is_enabled_for is None or is_enabled_for(level)
+
 
 def _stream_key_id(stream_key: StreamKey) -> str:
     symbol = stream_key.symbol or ""
     return f"{stream_key.source_id}:{stream_key.channel}:{symbol}"
 
 
-def _adapter_status_for_symbol(
-    symbol: str, adapter_states: Mapping[str, str]
-) -> str:
-    if not adapter_states:
-        return "disconnected"
-    target = f":{symbol}"
-    for key, state in adapter_states.items():
-        if key.endswith(target) and state == "connected":
-            return "connected"
-    return "disconnected"
-
-
 @dataclass(frozen=True)
 class Observability:
     logger: StructuredLogger
     metrics: MetricsRecorder
     health: MarketDataHealthTracker = field(default_factory=MarketDataHealthTracker)
+    # Emit one per-event debug log in every `debug_sample_every` per event_type.
+    debug_sample_every: int = 1
+    _latency_tags: dict[tuple[str, str], Mapping[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _debug_counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.debug_sample_every <= 0:
+            raise ValueError("debug_sample_every must be > 0")
 
     def record_event(self, event: RawMarketEvent) -> None:
         self.health.record_event(event)
@@ -135,7 +224,40 @@ class Observability:
             self.record_event_metrics(event)
         self.record_latency_metrics(event)
 
+    def record_events(self, events: Sequence[RawMarketEvent]) -> None:
+        """Batch form of `record_event`; counters are incremented once per key."""
+        event_counts: dict[tuple[str, str], int] = {}
+        failure_counts: dict[tuple[str, str], int] = {}
+        debug = _is_enabled_for(self.logger, logging.DEBUG)
+        for event in events:
+            self.health.record_event(event)
+            if event.event_type == "DecodeFailure":
+                if debug:
+                    self.log_decode_failure(event)
+                key = (event.source_id, str(event.normalized.get("error_kind")))
+                failure_counts[key] = failure_counts.get(key, 0) + 1
+            else:
+                if debug:
+                    self.log_event(event)
+                key = (event.source_id, event.event_type)
+                event_counts[key] = event_counts.get(key, 0) + 1
+            self.record_latency_metrics(event)
+        for (source_id, event_type), count in event_counts.items():
+            self.metrics.increment(
+                "market_data.events.count",
+                value=count,
+                tags={"source_id": source_id, "event_type": event_type},
+            )
+        for (source_id, error_kind), count in failure_counts.items():
+            self.metrics.increment(
+                "market_data.decode_failures.count",
+                value=count,
+                tags={"source_id": source_id, "error_kind": error_kind},
+            )
+
     def log_event(self, event: RawMarketEvent) -> None:
+        if not self._sample_debug(event.event_type):
+            return
         self.logger.log(
             logging.DEBUG,
             "market_data.event",
@@ -149,6 +271,8 @@ class Observability:
         )
 
     def log_decode_failure(self, event: RawMarketEvent) -> None:
+        if not self._sample_debug(event.event_type):
+            return
         self.logger.log(
             logging.DEBUG,
             "market_data.decode_failure",
@@ -163,6 +287,15 @@ class Observability:
             },
         )
 
+    def _sample_debug(self, event_type: str) -> bool:
+        if not _is_enabled_for(self.logger, logging.DEBUG):
+            return False
+        if self.debug_sample_every == 1:
+            return True
+        count = self._debug_counts.get(event_type, 0)
+        self._debug_counts[event_type] = count + 1
+        return count % self.debug_sample_every == 0
+
     def log_transport_state(
         self,
         *,
@@ -197,17 +330,36 @@ class Observability:
             tags={"source_id": event.source_id, "error_kind": str(error_kind)},
         )
 
+    def record_coalesced_decode_failure(self, event: RawMarketEvent) -> None:
+        """Count a DecodeFailure that was folded into a summary, without logging it."""
+        self.health.record_event(event)
+        self.record_decode_failure_metrics(event)
+
     def record_latency_metrics(self, event: RawMarketEvent) -> None:
         if event.exchange_ts_ms is None:
             return
         latency_ms = event.recv_ts_ms - event.exchange_ts_ms
+        key = (event.source_id, event.event_type)
+        tags = self._latency_tags.get(key)
+        if tags is None:
+            tags = self._latency_tags[key] = {
+                "source_id": event.source_id,
+                "event_type": event.event_type,
+            }
         self.metrics.observe(
             "market_data.exchange_to_recv.latency_ms",
             float(latency_ms),
-            tags={"source_id": event.source_id, "event_type": event.event_type},
+            tags=tags,
         )
 
-    def record_backpressure(self, blocked_ms: int, *, source_id: str) -> None:
+    def record_backpressure(
+        self,
+        blocked_ms: int,
+        *,
+        source_id: str,
+        queue_depth: int | None = None,
+        dropped: int = 0,
+    ) -> None:
         self.metrics.increment(
             "market_data.backpressure.count",
             tags={"source_id": source_id},
@@ -217,6 +369,43 @@ class Observability:
             float(blocked_ms),
             tags={"source_id": source_id},
         )
+        if queue_depth is not None:
+            self.metrics.gauge(
+                "market_data.backpressure.queue_depth",
+                float(queue_depth),
+                tags={"source_id": source_id},
+            )
+        if dropped:
+            self.metrics.increment(
+                "market_data.backpressure.dropped",
+                value=dropped,
+                tags={"source_id": source_id},
+            )
+
+    def record_decode_queue(self, *, worker: str, lag_ms: float, depth: int) -> None:
+        self.metrics.observe(
+            "market_data.decode_queue.lag_ms",
+            lag_ms,
+            tags={"worker": worker},
+        )
+        self.metrics.gauge(
+            "market_data.decode_queue.depth",
+            float(depth),
+            tags={"worker": worker},
+        )
+
+    def record_http_request(
+        self, *, source_id: str, host: str, status: int, latency_ms: float
+    ) -> None:
+        self.metrics.observe(
+            "market_data.http.request_latency_ms",
+            latency_ms,
+            tags={"source_id": source_id, "host": host},
+        )
+        self.metrics.increment(
+            "market_data.http.requests",
+            tags={"source_id": source_id, "host": host, "status": str(status)},
+        )
 
     def record_connection_state(
         self, *, stream_key: StreamKey, state: str, reconnect_count: int
@@ -241,6 +430,19 @@ class Observability:
             value=reconnect_count,
         )
 
+    def log_metrics_snapshot(self, snapshot: MetricsSnapshot) -> None:
+        for (name, tags), summary in snapshot.histograms.items():
+            fields: dict[str, object] = {
+                "metric": name,
+                **dict(tags),
+                "count": summary.count,
+                "mean": summary.mean,
+                "max": summary.max,
+            }
+            for percentile, value in summary.percentiles.items():
+                fields[f"p{percentile:g}"] = value
+            self.logger.log(logging.INFO, "market_data.histogram_summary", fields)
+
     def log_cadence_summary(self, *, symbol: str) -> None:
         fields = {
             "symbol": symbol,
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import bisect
+import os
+import shutil
+import tempfile
+import threading
+
+from market_data.contracts import RawMarketEvent
+from market_data.framing import (
+    NORMALIZED_MARSHAL,
+    JournalFrame,
+    event_frame,
+    header_strings,
+    iter_frames,
+)
+
+DEFAULT_FLUSH_BYTES = 256 * 1024
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+PAYLOAD_SEGMENT_SUFFIX = ".payloads"
+
+
+class _Segment:
+    __slots__ = ("start", "path", "fd")
+
+    def __init__(self, start: int, path: str) -> None:
+        self.start = start
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644)
+
+
+class PayloadStore:
+    """Out-of-line storage for buffered events, raw payload included.
+
+    `put` appends an event as one binary frame (see `framing`) and returns its
+    offset and length; `frame` reads it back byte-for-byte. Offsets grow
+    across segment files of roughly `segment_bytes`, so `discard_before` can
+    unlink whole segments once everything in them has been evicted. Header
+    strings are interned in memory rather than written out.
+
+    Writes are buffered and flushed every `flush_bytes`, or earlier when a
+    read needs bytes that are still buffered. Each store writes into a fresh
+    directory under `directory` that `close` removes again: offsets only mean
+    something to the process that wrote them, which is also why normalized
+    values use the marshal encoding.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        if flush_bytes <= 0:
+            raise ValueError("flush_bytes must be > 0")
+        if segment_bytes <= 0:
+            raise ValueError("segment_bytes must be > 0")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="payloads-", dir=directory)
+        self._flush_bytes = flush_bytes
+        self._segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._segments = [self._open_segment(0)]
+        self._segment_starts = [0]
+        self._flushed = 0
+        self._pending = bytearray()
+        self._string_ids: dict[str, int] = {}
+        self._strings: dict[int, str] = {0: ""}
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Bytes written since the store was opened, discarded segments included."""
+        return self._flushed + len(self._pending)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def put(self, event: RawMarketEvent) -> tuple[int, int]:
+        with self._lock:
+            if self._closed:
+                raise ValueError("payload store is closed")
+            ids = tuple(self._string_id(value) for value in header_strings(event))
+            parts = event_frame(event, ids, normalized_encoding=NORMALIZED_MARSHAL)
+            if self.size - self._segments[-1].start >= self._segment_bytes:
+                self._flush_locked()
+                self._segments.append(self._open_segment(self._flushed))
+                self._segment_starts.append(self._flushed)
+            offset = self.size
+            for part in parts:
+                self._pending += part
+            if len(self._pending) >= self._flush_bytes:
+                self._flush_locked()
+            return offset, self.size - offset
+
+    def frame(self, offset: int, length: int) -> JournalFrame:
+        view = memoryview(self.read(offset, length))
+        return next(
+            iter_frames(
+                view,
+                0,
+                self._strings,
+                start_recv_ts_ms=None,
+                end_recv_ts_ms=None,
+                normalized_encoding=NORMALIZED_MARSHAL,
+            )
+        )
+
+    def read(self, offset: int, length: int) -> bytes:
+        with self._lock:
+            if self._closed:
+                raise ValueError("payload store is closed")
+            if offset < self._segment_starts[0]:
+                raise ValueError(f"payload at offset {offset} has been discarded")
+            if offset + length > self._flushed:
+                self._flush_locked()
+            segment = self._segments[bisect.bisect_right(self._segment_starts, offset) - 1]
+            data = os.pread(segment.fd, length, offset - segment.start)
+        if len(data) != length:
+            raise ValueError(f"payload at offset {offset} is truncated")
+        return data
+
+    def discard_before(self, offset: int) -> int:
+        """Unlink segments holding only data below `offset`; returns how many."""
+        with self._lock:
+            count = bisect.bisect_right(self._segment_starts, offset) - 1
+            # The active segment is never discarded.
+            count = min(count, len(self._segments) - 1)
+            for segment in self._segments[:count]:
+                os.close(segment.fd)
+                os.unlink(segment.path)
+            del self._segments[:count]
+            del self._segment_starts[:count]
+            return max(count, 0)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Close and delete every segment; stored events can no longer be read."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.clear()
+            for segment in self._segments:
+                os.close(segment.fd)
+            self._segments = []
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _string_id(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self._string_ids) + 1
+            self._strings[string_id] = value
+        return string_id
+
+    def _open_segment(self, start: int) -> _Segment:
+        path = os.path.join(self.directory, f"{start:020d}{PAYLOAD_SEGMENT_SUFFIX}")
+        return _Segment(start, path)
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        segment = self._segments[-1]
+        view = memoryview(self._pending)
+        written = 0
+        while written < len(view):
+            written += os.pwrite(
+                segment.fd, view[written:], self._flushed + written - segment.start
+            )
+        view.release()
+        self._flushed += len(self._pending)
+        self._pending.clear()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 
 from market_data.config import BackpressureConfig
@@ -11,8 +11,14 @@ from market_data.contracts import (
     SCHEMA_VERSION,
     RawMarketEvent,
 )
+from market_data.failure_coalescing import DecodeFailureCoalescer
 from market_data.observability import Observability, get_observability
-from market_data.sink import BackpressureError, RawEventSink
+from market_data.sink import (
+    BackpressureError,
+    BatchRawEventSink,
+    BoundedRawEventSink,
+    RawEventSink,
+)
 
 ClockMs = Callable[[], int]
 
@@ -21,12 +27,30 @@ def _default_clock_ms() -> int:
     return int(time.time() * 1000)
 
 
+@dataclass(frozen=True)
+class IngestItem:
+    event_type: str
+    source_id: str
+    symbol: str
+    exchange_ts_ms: int | None
+    raw_payload: bytes | str
+    normalized: Mapping[str, object]
+    source_event_id: str | None = None
+    source_seq: int | None = None
+    channel: str | None = None
+    payload_content_type: str | None = None
+    payload_hash: str | None = None
+    # Overrides the batch `recv_ts_ms`, e.g. when replaying history.
+    recv_ts_ms: int | None = None
+
+
 @dataclass(frozen=True)
 class IngestionPipeline:
     sink: RawEventSink
     backpressure: BackpressureConfig
     observability: Observability
     clock_ms: ClockMs = _default_clock_ms
+    failure_coalescer: DecodeFailureCoalescer | None = None
 
     def ingest(
         self,
@@ -42,8 +66,15 @@ class IngestionPipeline:
         channel: str | None = None,
         payload_content_type: str | None = None,
         payload_hash: str | None = None,
+        recv_ts_ms: int | None = None,
     ) -> RawMarketEvent:
-        recv_ts_ms = self.clock_ms()
+        """Build, validate and emit one event.
+
+        `recv_ts_ms` defaults to the pipeline clock; callers that decode off
+        the receive path pass the time the frame was read.
+        """
+        if recv_ts_ms is None:
+            recv_ts_ms = self.clock_ms()
         _validate_event_type(event_type)
         _validate_required_normalized_keys(event_type, normalized)
 
@@ -64,9 +95,81 @@ class IngestionPipeline:
             payload_hash=payload_hash,
         )
 
+        coalescer = self.failure_coalescer
+        if coalescer is not None:
+            self._emit_failure_summaries(coalescer, recv_ts_ms)
+            if event_type == "DecodeFailure" and not coalescer.admit(event):
+                self.observability.record_coalesced_decode_failure(event)
+                return event
         self._emit(event)
         return event
 
+    def ingest_batch(
+        self, items: Sequence[IngestItem], *, recv_ts_ms: int | None = None
+    ) -> tuple[RawMarketEvent, ...]:
+        """Ingest events that arrived together, e.g. the fan-out of one frame.
+
+        Items share one `recv_ts_ms` unless they carry their own. The batch is
+        validated before anything is written, so a bad item rejects the whole
+        batch. Envelopes are identical to those `ingest` would build with the
+        same clock reading.
+        """
+        if not items:
+            return ()
+        if recv_ts_ms is None:
+            recv_ts_ms = self.clock_ms()
+        for event_type in {item.event_type for item in items}:
+            _validate_event_type(event_type)
+        for item in items:
+            _validate_required_normalized_keys(item.event_type, item.normalized)
+
+        events = tuple(
+            RawMarketEvent(
+                schema=SCHEMA_NAME,
+                schema_version=SCHEMA_VERSION,
+                event_type=item.event_type,
+                source_id=item.source_id,
+                symbol=item.symbol,
+                exchange_ts_ms=item.exchange_ts_ms,
+                recv_ts_ms=recv_ts_ms if item.recv_ts_ms is None else item.recv_ts_ms,
+                raw_payload=item.raw_payload,
+                normalized=item.normalized,
+                source_event_id=item.source_event_id,
+                source_seq=item.source_seq,
+                channel=item.channel,
+                payload_content_type=item.payload_content_type,
+                payload_hash=item.payload_hash,
+            )
+            for item in items
+        )
+        coalescer = self.failure_coalescer
+        if coalescer is None:
+            self._emit_batch(events)
+            return events
+        self._emit_failure_summaries(coalescer, recv_ts_ms)
+        admitted = []
+        for event in events:
+            if event.event_type == "DecodeFailure" and not coalescer.admit(event):
+                self.observability.record_coalesced_decode_failure(event)
+            else:
+                admitted.append(event)
+        if admitted:
+            self._emit_batch(tuple(admitted))
+        return events
+
+    def flush_failure_summaries(self, *, force: bool = False) -> None:
+        """Emit decode-failure summaries whose window has ended, or all of them
+        with `force`; a no-op without a failure coalescer."""
+        coalescer = self.failure_coalescer
+        if coalescer is None:
+            return
+        for summary in coalescer.drain(self.clock_ms(), force=force):
+            self._emit(summary)
+
+    def _emit_failure_summaries(self, coalescer: DecodeFailureCoalescer, now_ms: int) -> None:
+        for summary in coalescer.drain(now_ms):
+            self._emit(summary)
+
     def _emit(self, event: RawMarketEvent) -> None:
         block = self.backpressure.policy == "block"
         timeout_ms = self.backpressure.max_block_ms if block else 0
@@ -75,14 +178,47 @@ class IngestionPipeline:
             self.sink.write(event, block=block, timeout_ms=timeout_ms)
         except BackpressureError:
             blocked_ms = int((time.monotonic() - start) * 1000)
-            self.observability.record_backpressure(blocked_ms, source_id=event.source_id)
+            self.observability.record_backpressure(
+                blocked_ms, source_id=event.source_id, queue_depth=self._queue_depth()
+            )
             raise
         else:
             blocked_ms = int((time.monotonic() - start) * 1000)
             if block and blocked_ms > 0:
-                self.observability.record_backpressure(blocked_ms, source_id=event.source_id)
+                self.observability.record_backpressure(
+                    blocked_ms, source_id=event.source_id, queue_depth=self._queue_depth()
+                )
             self.observability.record_event(event)
 
+    def _emit_batch(self, events: tuple[RawMarketEvent, ...]) -> None:
+        if len(events) == 1 or not isinstance(self.sink, BatchRawEventSink):
+            for event in events:
+                self._emit(event)
+            return
+        block = self.backpressure.policy == "block"
+        timeout_ms = self.backpressure.max_block_ms if block else 0
+        source_id = events[0].source_id
+        start = time.monotonic()
+        try:
+            self.sink.write_batch(events, block=block, timeout_ms=timeout_ms)
+        except BackpressureError:
+            blocked_ms = int((time.monotonic() - start) * 1000)
+            self.observability.record_backpressure(
+                blocked_ms, source_id=source_id, queue_depth=self._queue_depth()
+            )
+            raise
+        blocked_ms = int((time.monotonic() - start) * 1000)
+        if block and blocked_ms > 0:
+            self.observability.record_backpressure(
+                blocked_ms, source_id=source_id, queue_depth=self._queue_depth()
+            )
+        self.observability.record_events(events)
+
+    def _queue_depth(self) -> int | None:
+        if isinstance(self.sink, BoundedRawEventSink):
+            return self.sink.pending
+        return None
+
 
 def _validate_event_type(event_type: str) -> None:
     if event_type not in EVENT_TYPE_REQUIRED_NORMALIZED_KEYS:
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable
+from dataclasses import replace
+from multiprocessing.connection import Connection
+from multiprocessing.synchronize import Event
+
+from market_data.metrics import HistogramMetrics, MetricsReporter
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.runtime import MarketDataRuntimeInfo, build_market_data_runtime
+from market_data.runtime_config import DeploymentMode, MarketDataRuntimeConfig
+from market_data.shm_ring import (
+    SharedMemoryEventReader,
+    SharedMemoryRawEventSink,
+    SharedMemoryRing,
+)
+from market_data.sink import RawEventSink
+
+ObservabilityFactory = Callable[[], Observability]
+
+_STARTUP_TIMEOUT_S = 30.0
+_SHUTDOWN_TIMEOUT_S = 5.0
+
+
+class MarketDataProcess:
+    """Runs `build_market_data_runtime` in a child process.
+
+    The child writes events into a shared-memory ring; a reader thread in
+    this process rebuilds them and writes them to `sink`, so `sink` sees the
+    same events, in the same order, as it would in-process. The child is
+    started with `spawn`, so `observability_factory` must be picklable (a
+    module-level function); it runs in the child to build its observability.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink: RawEventSink,
+        config: MarketDataRuntimeConfig,
+        observability: Observability | None = None,
+        observability_factory: ObservabilityFactory | None = None,
+        metrics_report_interval_ms: int | None = None,
+    ) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._context = context
+        self._config = config
+        self._observability_factory = observability_factory
+        self._metrics_report_interval_ms = metrics_report_interval_ms
+        self._ring = SharedMemoryRing(ready=context.Event(), capacity=config.shm_ring_bytes)
+        self._reader = SharedMemoryEventReader(self._ring, sink, observability=observability)
+        self._stop = context.Event()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._info: MarketDataRuntimeInfo | None = None
+
+    @property
+    def info(self) -> MarketDataRuntimeInfo:
+        if self._info is None:
+            raise RuntimeError("market data process has not started")
+        return self._info
+
+    def start(self) -> None:
+        """Start the reader and the child; returns once the child's adapters are built."""
+        if self._process is not None:
+            return
+        self._reader.start()
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_run_child,
+            args=(
+                self._ring.name,
+                self._ring.ready,
+                self._stop,
+                replace(self._config, deployment=DeploymentMode.IN_PROCESS),
+                self._observability_factory,
+                self._metrics_report_interval_ms,
+                sender,
+            ),
+            name="market-data",
+            daemon=True,
+        )
+        process.start()
+        self._process = process
+        sender.close()
+        if not receiver.poll(_STARTUP_TIMEOUT_S):
+            self.stop()
+            raise RuntimeError("market data process did not start")
+        try:
+            self._info = receiver.recv()
+        except EOFError as exc:
+            self.stop()
+            raise RuntimeError("market data process exited during startup") from exc
+        finally:
+            receiver.close()
+
+    def stop(self) -> None:
+        self._stop.set()
+        process = self._process
+        if process is not None:
+            process.join(timeout=_SHUTDOWN_TIMEOUT_S)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1)
+        self._reader.stop()
+        self._ring.close()
+        self._ring.unlink()
+
+
+def _run_child(
+    ring_name: str,
+    ready: Event,
+    stop: Event,
+    config: MarketDataRuntimeConfig,
+    observability_factory: ObservabilityFactory | None,
+    metrics_report_interval_ms: int | None,
+    conn: Connection,
+) -> None:
+    if observability_factory is None:
+        observability = Observability(logger=NullLogger(), metrics=NullMetrics())
+    else:
+        observability = observability_factory()
+    ring = SharedMemoryRing(ready=ready, name=ring_name)
+    runtime = build_market_data_runtime(
+        sink=SharedMemoryRawEventSink(ring),
+        observability=observability,
+        config=config,
+    )
+    reporter = None
+    if metrics_report_interval_ms is not None and isinstance(
+        observability.metrics, HistogramMetrics
+    ):
+        reporter = MetricsReporter(
+            observability.metrics,
+            interval_ms=metrics_report_interval_ms,
+            on_snapshot=observability.log_metrics_snapshot,
+        )
+        reporter.start()
+    conn.send(runtime.info)
+    conn.close()
+    runtime.start()
+    try:
+        stop.wait()
+    finally:
+        runtime.stop()
+        if reporter is not None:
+            reporter.stop()
+        ring.close()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+
+from market_data.config import BackpressureConfig, _validate_backpressure
+from market_data.contracts import RawMarketEvent
+from market_data.observability import Observability, get_observability
+from market_data.sink import BackpressureError, RawEventSink
+
+
+class QueueRawEventSink:
+    """Bounded hand-off between adapter threads and a downstream sink.
+
+    `write` only enqueues; a dedicated drain thread delivers events to the
+    downstream sink in arrival order. `max_pending` counts both queued events
+    and the batch the drain thread is currently delivering, so a slow consumer
+    pushes back on producers instead of growing memory. Batches are capped
+    below `max_pending` so that, under `drop_oldest`, a full sink always holds
+    a queued event to discard.
+
+    Under `fail` and `block`, `write_batch` enqueues a batch whole or not at
+    all: it waits for (or fails without) room for every event. A batch larger
+    than `max_pending` waits for an empty queue and then overshoots the bound.
+    An exception raised by the downstream sink is logged, and the first one
+    not yet reported is re-raised by the next `write`/`write_batch`.
+    """
+
+    def __init__(
+        self,
+        downstream: RawEventSink,
+        *,
+        backpressure: BackpressureConfig,
+        observability: Observability | None = None,
+        name: str = "market-data-sink-drain",
+    ) -> None:
+        _validate_backpressure(backpressure)
+        self._downstream = downstream
+        self._backpressure = backpressure
+        self._observability = observability
+        self._name = name
+        self._queue: deque[RawMarketEvent] = deque()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._delivery_error: Exception | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue) + self._in_flight
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._drain, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 1.0) -> None:
+        """Stop the drain thread once it has flushed everything already queued."""
+        with self._lock:
+            self._running = False
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout_s)
+            self._thread = None
+
+    def write(self, event: RawMarketEvent, *, block: bool, timeout_ms: int | None) -> None:
+        self.write_batch((event,), block=block, timeout_ms=timeout_ms)
+
+    def write_batch(
+        self, events: Sequence[RawMarketEvent], *, block: bool, timeout_ms: int | None
+    ) -> None:
+        if not events:
+            return
+        deadline = None if timeout_ms is None else time.monotonic() + timeout_ms / 1000
+        dropped = 0
+        with self._lock:
+            error = self._delivery_error
+            if error is not None:
+                self._delivery_error = None
+                raise error
+            if self._backpressure.policy == "drop_oldest":
+                for event in events:
+                    dropped += self._put_dropping_oldest_locked(event)
+            else:
+                self._reserve_locked(len(events), block=block, deadline=deadline)
+                self._queue.extend(events)
+            depth = self._pending_locked()
+            self._not_empty.notify()
+        if dropped:
+            self._get_observability().record_backpressure(
+                0, source_id=events[0].source_id, queue_depth=depth, dropped=dropped
+            )
+
+    def _put_dropping_oldest_locked(self, event: RawMarketEvent) -> int:
+        dropped = 0
+        # Only with max_pending=1 can everything pending be in flight; that
+        # event cannot be recalled, so the new one queues behind it.
+        if self._pending_locked() >= self._backpressure.max_pending and self._queue:
+            self._queue.popleft()
+            dropped = 1
+        self._queue.append(event)
+        return dropped
+
+    def _pending_locked(self) -> int:
+        return len(self._queue) + self._in_flight
+
+    def _reserve_locked(self, count: int, *, block: bool, deadline: float | None) -> None:
+        max_pending = self._backpressure.max_pending
+        limit = max_pending - min(count, max_pending)
+        if self._pending_locked() <= limit:
+            return
+        if not block:
+            raise BackpressureError(f"sink queue full: {max_pending} pending")
+        while self._pending_locked() > limit:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise BackpressureError(f"sink queue full: {max_pending} pending after timeout")
+            self._not_full.wait(remaining)
+
+    def _drain(self) -> None:
+        batch_limit = max(1, self._backpressure.max_pending - 1)
+        while True:
+            with self._lock:
+                while not self._queue and self._running:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                queue = self._queue
+                batch = [queue.popleft() for _ in range(min(len(queue), batch_limit))]
+                self._in_flight = len(batch)
+            try:
+                for event in batch:
+                    self._deliver(event)
+            finally:
+                with self._lock:
+                    self._in_flight = 0
+                    self._not_full.notify_all()
+
+    def _deliver(self, event: RawMarketEvent) -> None:
+        try:
+            self._downstream.write(event, block=True, timeout_ms=None)
+        except Exception as exc:
+            with self._lock:
+                if self._delivery_error is None:
+                    self._delivery_error = exc
+            self._get_observability().logger.log(
+                logging.ERROR,
+                "market_data.sink_delivery_failed",
+                {
+                    "source_id": event.source_id,
+                    "symbol": event.symbol,
+                    "event_type": event.event_type,
+                    "error_detail": str(exc),
+                },
+            )
+
+    def _get_observability(self) -> Observability:
+        return self._observability or get_observability()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from collections.abc import Sequence
+
+import websockets
+
+SYNTHETIC_STREAMS = ("aggTrade", "depth", "markPrice", "kline")
+
+
+def synthetic_frames(
+    stream: str,
+    *,
+    symbol: str = "BTCUSDT",
+    count: int = 1_000,
+    start_ms: int = 1_700_000_000_000,
+    seed: int = 0,
+) -> list[str]:
+    """Binance futures frames shaped like the live `stream` payloads."""
+    if stream not in SYNTHETIC_STREAMS:
+        raise ValueError(f"stream must be one of: {', '.join(SYNTHETIC_STREAMS)}")
+    rng = random.Random(seed)
+    frames = []
+    price = 42_000.0
+    for index in range(count):
+        price = max(1.0, price + rng.uniform(-5.0, 5.0))
+        event_ms = start_ms + index
+        if stream == "aggTrade":
+            payload: dict[str, object] = {
+                "e": "aggTrade",
+                "E": event_ms,
+                "a": index,
+                "s": symbol,
+                "p": f"{price:.1f}",
+                "q": f"{rng.uniform(0.001, 2.0):.3f}",
+                "f": index,
+                "l": index,
+                "T": event_ms,
+                "m": rng.random() < 0.5,
+            }
+        elif stream == "depth":
+            payload = {
+                "e": "depthUpdate",
+                "E": event_ms,
+                "T": event_ms,
+                "s": symbol,
+                "U": index * 10 + 1,
+                "u": index * 10 + 10,
+                "pu": index * 10,
+                "b": [
+                    [f"{price - level * 0.1:.1f}", f"{rng.uniform(0, 5):.3f}"]
+                    for level in range(1, 11)
+                ],
+                "a": [
+                    [f"{price + level * 0.1:.1f}", f"{rng.uniform(0, 5):.3f}"]
+                    for level in range(1, 11)
+                ],
+            }
+        elif stream == "markPrice":
+            payload = {
+                "e": "markPriceUpdate",
+                "E": event_ms,
+                "s": symbol,
+                "p": f"{price:.2f}",
+                "i": f"{price - 1.5:.2f}",
+                "P": f"{price + 0.5:.2f}",
+                "r": "0.00010000",
+                "T": event_ms + 3_600_000,
+            }
+        else:
+            open_ms = start_ms + index * 180_000
+            payload = {
+                "e": "kline",
+                "E": event_ms,
+                "s": symbol,
+                "k": {
+                    "t": open_ms,
+                    "T": open_ms + 179_999,
+                    "s": symbol,
+                    "i": "3m",
+                    "o": f"{price:.1f}",
+                    "c": f"{price + 1:.1f}",
+                    "h": f"{price + 3:.1f}",
+                    "l": f"{price - 3:.1f}",
+                    "v": f"{rng.uniform(10, 500):.3f}",
+                    "x": True,
+                },
+            }
+        frames.append(json.dumps(payload, separators=(",", ":")))
+    return frames
+
+
+def load_recorded_frames(path: str) -> list[str]:
+    """One frame per line, as captured from a live stream."""
+    with open(path, encoding="utf-8") as handle:
+        return [line.rstrip("\n") for line in handle if line.strip()]
+
+
+class ReplayServer:
+    """Local websocket server that replays frames to every client.
+
+    Frames are sent in order, cycling through `frames`, at `rate_per_s`
+    (0 means as fast as the connection allows) until `duration_s` elapses.
+    The connection is then closed. `sent` counts frames handed to the socket.
+    """
+
+    def __init__(
+        self,
+        frames: Sequence[str | bytes],
+        *,
+        rate_per_s: float,
+        duration_s: float,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if not frames:
+            raise ValueError("frames must not be empty")
+        if rate_per_s < 0:
+            raise ValueError("rate_per_s must be >= 0")
+        if duration_s <= 0:
+            raise ValueError("duration_s must be > 0")
+        self._frames = list(frames)
+        self._rate_per_s = rate_per_s
+        self._duration_s = duration_s
+        self._host = host
+        self._port = port
+        self._server: websockets.Server | None = None
+        self._finished: asyncio.Event | None = None
+        self.sent = 0
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://{self._host}:{port}"
+
+    async def __aenter__(self) -> ReplayServer:
+        self._finished = asyncio.Event()
+        self._server = await websockets.serve(self._handle, self._host, self._port)
+        return self
+
+    async def wait_finished(self) -> None:
+        """Wait until a client has been served for the full duration or disconnected."""
+        if self._finished is None:
+            raise RuntimeError("server is not started")
+        await self._finished.wait()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, connection: websockets.ServerConnection) -> None:
+        frames = self._frames
+        total = len(frames)
+        start = time.perf_counter()
+        deadline = start + self._duration_s
+        index = 0
+        try:
+            while True:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if self._rate_per_s:
+                    due = int((now - start) * self._rate_per_s) - index
+                    if due <= 0:
+                        await asyncio.sleep(min(0.001, deadline - now))
+                        continue
+                else:
+                    due = 256
+                for _ in range(due):
+                    await connection.send(frames[index % total])
+                    index += 1
+                self.sent = index
+            await connection.close()
+        finally:
+            # A client that disconnects early makes `send` raise; waiters
+            # still need to be released with what was sent so far.
+            self.sent = index
+            if self._finished is not None:
+                self._finished.set()
@@ -1,39 +1,139 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import threading
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 
-from market_data.adapter import Adapter
+from market_data.adapter import Adapter, AsyncAdapter
 from market_data.adapters.binance.adapter import (
     BinanceAggTradeAdapter,
     BinanceBookTickerAdapter,
+    BinanceCombinedStreamAdapter,
     BinanceDepthAdapter,
     BinanceForceOrderAdapter,
     BinanceKlineAdapter,
     BinanceMarkPriceAdapter,
     BinanceOpenInterestPoller,
+    BinanceStreamShards,
 )
 from market_data.adapters.binance.config import (
     BinanceAggTradeConfig,
     BinanceBookTickerConfig,
+    BinanceCombinedStreamConfig,
     BinanceDepthConfig,
     BinanceForceOrderConfig,
     BinanceKlineConfig,
     BinanceMarkPriceConfig,
     BinanceOpenInterestConfig,
 )
+from market_data.decode_pool import DecodePoolClient, DecodeWorkerPool
+from market_data.failure_coalescing import DecodeFailureCoalescer
+from market_data.json_backend import select_json_backend, set_json_backend
 from market_data.observability import Observability, set_observability
 from market_data.pipeline import IngestionPipeline
-from market_data.runtime_config import AdapterType, MarketDataRuntimeConfig
+from market_data.runtime_config import (
+    AdapterType,
+    MarketDataRuntimeConfig,
+    RuntimeMode,
+    TransportMode,
+)
 from market_data.sink import RawEventSink
 
 
 @dataclass(frozen=True)
 class MarketDataRuntimeInfo:
-    symbol: str
+    symbols: tuple[str, ...]
     adapter_count: int
     optional_enabled: bool
+    connection_count: int = 0
+
+
+class SharedLoopRunner:
+    """Runs every adapter as a supervisor task on one event loop thread.
+
+    `cancel` may be called before the loop is running; the tasks are then
+    cancelled as soon as they are created.
+    """
+
+    def __init__(self, adapters: Iterable[AsyncAdapter], *, name: str) -> None:
+        self._adapters = list(adapters)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name=name)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            loop = self._loop
+            tasks = self._tasks
+        if loop is None or loop.is_closed():
+            return
+        for task in tasks:
+            loop.call_soon_threadsafe(task.cancel)
+
+    def _run(self) -> None:
+        asyncio.run(self._supervise())
+
+    async def _supervise(self) -> None:
+        tasks = [
+            asyncio.create_task(adapter.run_async(), name=_adapter_task_name(adapter))
+            for adapter in self._adapters
+        ]
+        with self._lock:
+            self._tasks = tasks
+            self._loop = asyncio.get_running_loop()
+            cancelled = self._cancelled
+        if cancelled:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class FailureSummaryFlusher:
+    """Background thread that flushes a pipeline's decode-failure summaries.
+
+    Summaries otherwise only go out when a later event is ingested, so a
+    quiet stream would hold them indefinitely. `stop` flushes whatever is
+    still pending, forcing the open window closed.
+    """
+
+    def __init__(self, pipeline: IngestionPipeline, *, interval_ms: int) -> None:
+        self._pipeline = pipeline
+        self._interval_s = interval_ms / 1000
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="market-data-failure-summaries", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        self._flush(force=True)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_s):
+            self._flush(force=False)
+
+    def _flush(self, *, force: bool) -> None:
+        try:
+            self._pipeline.flush_failure_summaries(force=force)
+        except Exception as exc:
+            self._pipeline.observability.logger.log(
+                logging.ERROR,
+                "market_data.failure_summary_flush_failed",
+                {"error_detail": str(exc)},
+            )
 
 
 class MarketDataRuntime:
@@ -43,26 +143,54 @@ class MarketDataRuntime:
         adapters: Iterable[Adapter],
         threads: Iterable[threading.Thread],
         info: MarketDataRuntimeInfo,
+        loop_runner: SharedLoopRunner | None = None,
+        shards: BinanceStreamShards | None = None,
+        decode_pool: DecodeWorkerPool | None = None,
+        summary_flusher: FailureSummaryFlusher | None = None,
     ) -> None:
         self._adapters = list(adapters)
         self._threads = list(threads)
         self._info = info
+        self._loop_runner = loop_runner
+        self._shards = shards
+        self._decode_pool = decode_pool
+        self._summary_flusher = summary_flusher
 
     @property
     def info(self) -> MarketDataRuntimeInfo:
         return self._info
 
     def start(self) -> None:
+        if self._decode_pool is not None:
+            self._decode_pool.start()
         for adapter in self._adapters:
             adapter.start()
         for thread in self._threads:
             thread.start()
+        if self._summary_flusher is not None:
+            self._summary_flusher.start()
 
     def stop(self) -> None:
         for adapter in self._adapters:
             adapter.stop()
+        if self._loop_runner is not None:
+            self._loop_runner.cancel()
         for thread in self._threads:
             thread.join(timeout=1)
+        if self._decode_pool is not None:
+            self._decode_pool.stop()
+        # Last, so summaries cover every failure the adapters ingested.
+        if self._summary_flusher is not None:
+            self._summary_flusher.stop()
+
+    def rebalance(self, symbols: Sequence[str]) -> None:
+        """Replan combined-stream shards; connections adopt it as they reconnect.
+
+        The open connections are kept, so `symbols` must fit their capacity.
+        """
+        if self._shards is None:
+            raise ValueError("rebalance requires the combined transport")
+        self._shards.set_symbols(symbols)
 
 
 def build_market_data_runtime(
@@ -73,29 +201,84 @@ def build_market_data_runtime(
 ) -> MarketDataRuntime:
     set_observability(observability)
     runtime_config = config or MarketDataRuntimeConfig.default()
+    set_json_backend(select_json_backend(runtime_config.json_backend))
+    coalescing = runtime_config.decode_failure_coalescing
     pipeline = IngestionPipeline(
         sink=sink,
         backpressure=runtime_config.backpressure,
         observability=observability,
+        failure_coalescer=(
+            DecodeFailureCoalescer(coalescing) if coalescing is not None else None
+        ),
     )
-    adapters = _build_binance_adapters(
+    adapters, shards = _build_binance_adapters(
         config=runtime_config,
         pipeline=pipeline,
         observability=observability,
     )
+    info = MarketDataRuntimeInfo(
+        symbols=runtime_config.symbols,
+        adapter_count=len(adapters),
+        optional_enabled=runtime_config.optional_enabled,
+        connection_count=shards.shard_count if shards is not None else 0,
+    )
+    decode_pool = _build_decode_pool(runtime_config, adapters, observability)
+    summary_flusher = (
+        FailureSummaryFlusher(pipeline, interval_ms=coalescing.window_ms)
+        if coalescing is not None
+        else None
+    )
+    if runtime_config.runtime_mode == RuntimeMode.SHARED_LOOP:
+        loop_runner = SharedLoopRunner(adapters, name="binance-shared-loop")
+        return MarketDataRuntime(
+            adapters=adapters,
+            threads=[loop_runner.thread],
+            info=info,
+            loop_runner=loop_runner,
+            shards=shards,
+            decode_pool=decode_pool,
+            summary_flusher=summary_flusher,
+        )
     threads = [
         threading.Thread(
             target=adapter.run,
-            name=f"binance-{adapter.stream_key.channel}",
+            name=_adapter_task_name(adapter),
         )
         for adapter in adapters
     ]
-    info = MarketDataRuntimeInfo(
-        symbol=runtime_config.symbol,
-        adapter_count=len(adapters),
-        optional_enabled=runtime_config.optional_enabled,
+    return MarketDataRuntime(
+        adapters=adapters,
+        threads=threads,
+        info=info,
+        shards=shards,
+        decode_pool=decode_pool,
+        summary_flusher=summary_flusher,
+    )
+
+
+def _build_decode_pool(
+    config: MarketDataRuntimeConfig,
+    adapters: Sequence[AsyncAdapter],
+    observability: Observability,
+) -> DecodeWorkerPool | None:
+    if config.decode_workers == 0:
+        return None
+    pool = DecodeWorkerPool(
+        workers=config.decode_workers,
+        queue_size=config.decode_queue_size,
+        observability=observability,
     )
-    return MarketDataRuntime(adapters=adapters, threads=threads, info=info)
+    for adapter in adapters:
+        if isinstance(adapter, DecodePoolClient):
+            adapter.attach_decode_pool(pool)
+    return pool
+
+
+def _adapter_task_name(adapter: Adapter) -> str:
+    symbol = adapter.stream_key.symbol
+    if symbol:
+        return f"binance-{adapter.stream_key.channel}-{symbol}"
+    return f"binance-{adapter.stream_key.channel}"
 
 
 def _build_binance_adapters(
@@ -103,106 +286,155 @@ def _build_binance_adapters(
     config: MarketDataRuntimeConfig,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> list[Adapter]:
-    adapters: list[Adapter] = []
-    for adapter_type in config.iter_enabled_adapters():
-        factory = _ADAPTER_FACTORIES.get(adapter_type)
-        if factory is None:
+) -> tuple[list[AsyncAdapter], BinanceStreamShards | None]:
+    enabled = config.iter_enabled_adapters()
+    for adapter_type in enabled:
+        if adapter_type not in _ADAPTER_FACTORIES and adapter_type not in _POLLED_FACTORIES:
             raise ValueError(f"unsupported adapter: {adapter_type}")
-        adapters.append(factory(config, pipeline, observability))
-    return adapters
+    combined = config.transport == TransportMode.COMBINED
+    multiplexed = tuple(
+        adapter_type
+        for adapter_type in enabled
+        if combined and adapter_type not in _POLLED_FACTORIES
+    )
+
+    adapters: list[AsyncAdapter] = []
+    shards: BinanceStreamShards | None = None
+    if multiplexed:
+
+        def channels_for_symbol(symbol: str) -> list[AsyncAdapter]:
+            return [
+                _ADAPTER_FACTORIES[adapter_type](symbol, pipeline, observability)
+                for adapter_type in multiplexed
+            ]
+
+        shards = BinanceStreamShards(
+            symbols=config.symbols,
+            channels_for_symbol=channels_for_symbol,
+            max_streams_per_connection=config.max_streams_per_connection,
+        )
+        adapters.extend(
+            BinanceCombinedStreamAdapter(
+                config=BinanceCombinedStreamConfig.default(),
+                pipeline=pipeline,
+                observability=observability,
+                shards=shards,
+                shard_index=shard_index,
+            )
+            for shard_index in range(shards.shard_count)
+        )
+    for symbol in config.symbols:
+        for adapter_type in enabled:
+            if adapter_type in multiplexed or adapter_type in _POLLED_FACTORIES:
+                continue
+            adapters.append(_ADAPTER_FACTORIES[adapter_type](symbol, pipeline, observability))
+    for adapter_type in enabled:
+        if adapter_type in _POLLED_FACTORIES:
+            adapters.append(
+                _POLLED_FACTORIES[adapter_type](config.symbols, pipeline, observability)
+            )
+    return adapters, shards
 
 
 def _build_agg_trade_adapter(
-    config: MarketDataRuntimeConfig,
+    symbol: str,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceAggTradeAdapter(
-        config=BinanceAggTradeConfig.default(symbol=config.symbol),
+        config=BinanceAggTradeConfig.default(symbol=symbol),
         pipeline=pipeline,
         observability=observability,
     )
 
 
 def _build_kline_adapter(
-    config: MarketDataRuntimeConfig,
+    symbol: str,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceKlineAdapter(
-        config=BinanceKlineConfig.default(symbol=config.symbol),
+        config=BinanceKlineConfig.default(symbol=symbol),
         pipeline=pipeline,
         observability=observability,
     )
 
 
 def _build_open_interest_poller(
-    config: MarketDataRuntimeConfig,
+    symbols: Sequence[str],
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceOpenInterestPoller(
-        config=BinanceOpenInterestConfig.default(symbol=config.symbol),
+        config=BinanceOpenInterestConfig.default(symbol=symbols[0]),
         pipeline=pipeline,
         observability=observability,
+        symbols=symbols,
     )
 
 
 def _build_book_ticker_adapter(
-    config: MarketDataRuntimeConfig,
+    symbol: str,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceBookTickerAdapter(
-        config=BinanceBookTickerConfig.default(symbol=config.symbol),
+        config=BinanceBookTickerConfig.default(symbol=symbol),
         pipeline=pipeline,
         observability=observability,
     )
 
 
 def _build_depth_adapter(
-    config: MarketDataRuntimeConfig,
+    symbol: str,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceDepthAdapter(
-        config=BinanceDepthConfig.default(symbol=config.symbol),
+        config=BinanceDepthConfig.default(symbol=symbol),
         pipeline=pipeline,
         observability=observability,
     )
 
 
 def _build_mark_price_adapter(
-    config: MarketDataRuntimeConfig,
+    symbol: str,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceMarkPriceAdapter(
-        config=BinanceMarkPriceConfig.default(symbol=config.symbol),
+        config=BinanceMarkPriceConfig.default(symbol=symbol),
         pipeline=pipeline,
         observability=observability,
     )
 
 
 def _build_force_order_adapter(
-    config: MarketDataRuntimeConfig,
+    symbol: str,
     pipeline: IngestionPipeline,
     observability: Observability,
-) -> Adapter:
+) -> AsyncAdapter:
     return BinanceForceOrderAdapter(
-        config=BinanceForceOrderConfig.default(symbol=config.symbol),
+        config=BinanceForceOrderConfig.default(symbol=symbol),
         pipeline=pipeline,
         observability=observability,
     )
 
 
+# Polled adapters serve every symbol from one instance over a shared pool.
+_POLLED_FACTORIES: dict[
+    AdapterType,
+    Callable[[Sequence[str], IngestionPipeline, Observability], AsyncAdapter],
+] = {
+    AdapterType.OPEN_INTEREST: _build_open_interest_poller,
+}
+
 _ADAPTER_FACTORIES: dict[
-    AdapterType, Callable[[MarketDataRuntimeConfig, IngestionPipeline, Observability], Adapter]
+    AdapterType,
+    Callable[[str, IngestionPipeline, Observability], AsyncAdapter],
 ] = {
     AdapterType.AGG_TRADE: _build_agg_trade_adapter,
     AdapterType.KLINE: _build_kline_adapter,
-    AdapterType.OPEN_INTEREST: _build_open_interest_poller,
     AdapterType.BOOK_TICKER: _build_book_ticker_adapter,
     AdapterType.DEPTH: _build_depth_adapter,
     AdapterType.MARK_PRICE: _build_mark_price_adapter,
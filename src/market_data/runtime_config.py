@@ -3,7 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 
-from market_data.config import BackpressureConfig
+from market_data.config import (
+    BackpressureConfig,
+    DecodeFailureCoalescingConfig,
+    _validate_decode_failure_coalescing,
+)
 
 
 class AdapterType(str, Enum):
@@ -16,6 +20,21 @@ class AdapterType(str, Enum):
     FORCE_ORDER = "force_order"
 
 
+class RuntimeMode(str, Enum):
+    THREADED = "threaded"
+    SHARED_LOOP = "shared_loop"
+
+
+class DeploymentMode(str, Enum):
+    IN_PROCESS = "in_process"
+    SUBPROCESS = "subprocess"
+
+
+class TransportMode(str, Enum):
+    PER_STREAM = "per_stream"
+    COMBINED = "combined"
+
+
 _ADAPTER_ORDER: tuple[AdapterType, ...] = (
     AdapterType.AGG_TRADE,
     AdapterType.KLINE,
@@ -36,11 +55,44 @@ _OPTIONAL_ADAPTERS: frozenset[AdapterType] = frozenset(
 )
 
 
+DEFAULT_MAX_STREAMS_PER_CONNECTION = 200
+DEFAULT_DECODE_QUEUE_SIZE = 10_000
+DEFAULT_SHM_RING_BYTES = 64 * 1024 * 1024
+
+
 @dataclass(frozen=True)
 class MarketDataRuntimeConfig:
-    symbol: str
+    symbols: tuple[str, ...]
     enabled_adapters: frozenset[AdapterType]
     backpressure: BackpressureConfig
+    runtime_mode: RuntimeMode = RuntimeMode.THREADED
+    transport: TransportMode = TransportMode.PER_STREAM
+    max_streams_per_connection: int = DEFAULT_MAX_STREAMS_PER_CONNECTION
+    json_backend: str = "auto"
+    decode_workers: int = 0
+    decode_queue_size: int = DEFAULT_DECODE_QUEUE_SIZE
+    # None disables coalescing; every DecodeFailure is emitted.
+    decode_failure_coalescing: DecodeFailureCoalescingConfig | None = (
+        DecodeFailureCoalescingConfig()
+    )
+    deployment: DeploymentMode = DeploymentMode.IN_PROCESS
+    shm_ring_bytes: int = DEFAULT_SHM_RING_BYTES
+
+    def __post_init__(self) -> None:
+        if not self.symbols:
+            raise ValueError("market_data config requires at least one symbol")
+        if len(set(self.symbols)) != len(self.symbols):
+            raise ValueError("market_data config symbols must be unique")
+        if self.max_streams_per_connection <= 0:
+            raise ValueError("max_streams_per_connection must be > 0")
+        if self.decode_workers < 0:
+            raise ValueError("decode_workers must be >= 0")
+        if self.decode_queue_size <= 0:
+            raise ValueError("decode_queue_size must be > 0")
+        if self.decode_failure_coalescing is not None:
+            _validate_decode_failure_coalescing(self.decode_failure_coalescing)
+        if self.shm_ring_bytes <= 0:
+            raise ValueError("shm_ring_bytes must be > 0")
 
     def iter_enabled_adapters(self) -> tuple[AdapterType, ...]:
         return tuple(adapter for adapter in _ADAPTER_ORDER if adapter in self.enabled_adapters)
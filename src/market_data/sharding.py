@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+
+def required_shard_count(stream_counts: Mapping[str, int], *, max_streams_per_shard: int) -> int:
+    _validate_stream_counts(stream_counts, max_streams_per_shard=max_streams_per_shard)
+    total = sum(stream_counts.values())
+    if total == 0:
+        return 0
+    shard_count = -(-total // max_streams_per_shard)
+    while True:
+        try:
+            assign_shards(
+                stream_counts,
+                shard_count=shard_count,
+                max_streams_per_shard=max_streams_per_shard,
+            )
+        except ValueError:
+            shard_count += 1
+            continue
+        return shard_count
+
+
+def assign_shards(
+    stream_counts: Mapping[str, int],
+    *,
+    shard_count: int,
+    max_streams_per_shard: int,
+) -> tuple[tuple[str, ...], ...]:
+    """Assign symbols to shards, keeping each symbol's streams on one shard.
+
+    Symbols are placed largest first onto the least loaded shard that still
+    fits, ties broken by symbol and shard index, so the result depends only
+    on the inputs and not on mapping order.
+    """
+    _validate_stream_counts(stream_counts, max_streams_per_shard=max_streams_per_shard)
+    if shard_count < 0:
+        raise ValueError("shard_count must be >= 0")
+    loads = [0] * shard_count
+    shards: list[list[str]] = [[] for _ in range(shard_count)]
+    for symbol in _placement_order(stream_counts):
+        count = stream_counts[symbol]
+        candidates = [
+            index for index in range(shard_count) if loads[index] + count <= max_streams_per_shard
+        ]
+        if not candidates:
+            raise ValueError(
+                f"cannot place {symbol}: {shard_count} shards of "
+                f"{max_streams_per_shard} streams are full"
+            )
+        target = min(candidates, key=lambda index: (loads[index], index))
+        loads[target] += count
+        shards[target].append(symbol)
+    return tuple(tuple(sorted(shard)) for shard in shards)
+
+
+def _placement_order(stream_counts: Mapping[str, int]) -> Sequence[str]:
+    return sorted(stream_counts, key=lambda symbol: (-stream_counts[symbol], symbol))
+
+
+def _validate_stream_counts(
+    stream_counts: Mapping[str, int], *, max_streams_per_shard: int
+) -> None:
+    if max_streams_per_shard <= 0:
+        raise ValueError("max_streams_per_shard must be > 0")
+    for symbol, count in stream_counts.items():
+        if count < 0:
+            raise ValueError(f"stream count for {symbol} must be >= 0")
+        if count > max_streams_per_shard:
+            raise ValueError(f"{symbol} needs {count} streams, above the per-shard cap")
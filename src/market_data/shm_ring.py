@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import logging
+import struct
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event
+
+from market_data.contracts import RawMarketEvent
+from market_data.framing import (
+    NORMALIZED_MARSHAL,
+    JournalFrame,
+    event_frame,
+    header_strings,
+    iter_frames,
+    string_frame,
+)
+from market_data.observability import Observability, get_observability
+from market_data.sink import BackpressureError, RawEventSink
+
+# Layout: write position, read position (each on its own cache line), then the
+# data area. Positions are monotonically increasing byte counts; records are
+# `<length:u32><journal frames>` and never straddle the end of the data area.
+DEFAULT_RING_BYTES = 64 * 1024 * 1024
+
+_POSITION = struct.Struct("<Q")
+_WRITE_POS_OFFSET = 0
+_READ_POS_OFFSET = 64
+_DATA_OFFSET = 128
+_RECORD_HEADER = struct.Struct("<I")
+_WRAP_MARKER = 0xFFFFFFFF
+_FULL_POLL_S = 0.0002
+_EMPTY_WAIT_S = 0.05
+
+
+class SharedMemoryRing:
+    """Single-producer, single-consumer byte ring over `SharedMemory`.
+
+    The creating process owns the segment and must `unlink` it; the other
+    side attaches by `name`. `ready` is set after every write so the reader
+    can sleep while the ring is empty.
+    """
+
+    def __init__(
+        self,
+        *,
+        ready: Event,
+        name: str | None = None,
+        capacity: int = DEFAULT_RING_BYTES,
+    ) -> None:
+        if name is None:
+            if capacity <= _RECORD_HEADER.size:
+                raise ValueError("capacity must be larger than a record header")
+            self._shm = SharedMemory(create=True, size=_DATA_OFFSET + capacity)
+            self._shm.buf[:_DATA_OFFSET] = bytes(_DATA_OFFSET)
+        else:
+            self._shm = SharedMemory(name=name)
+        self.ready = ready
+        self.capacity = len(self._shm.buf) - _DATA_OFFSET
+        self._buf = self._shm.buf
+        self._write_pos = _POSITION.unpack_from(self._buf, _WRITE_POS_OFFSET)[0]
+        self._read_pos = _POSITION.unpack_from(self._buf, _READ_POS_OFFSET)[0]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def pending_bytes(self) -> int:
+        write_pos = _POSITION.unpack_from(self._buf, _WRITE_POS_OFFSET)[0]
+        read_pos = _POSITION.unpack_from(self._buf, _READ_POS_OFFSET)[0]
+        return write_pos - read_pos
+
+    def write(self, record: bytes, *, block: bool, timeout_ms: int | None) -> None:
+        """Append one record; raise BackpressureError if it does not fit in time."""
+        capacity = self.capacity
+        need = _RECORD_HEADER.size + len(record)
+        if need > capacity:
+            raise ValueError(f"record of {len(record)} bytes exceeds ring capacity {capacity}")
+        buf = self._buf
+        write_pos = self._write_pos
+        offset = write_pos % capacity
+        tail = capacity - offset
+        skip = tail if need > tail else 0
+        deadline = None
+        while True:
+            read_pos = _POSITION.unpack_from(buf, _READ_POS_OFFSET)[0]
+            if write_pos + skip + need - read_pos <= capacity:
+                break
+            if not block:
+                raise BackpressureError(f"shared memory ring full: {capacity} bytes")
+            if timeout_ms is not None:
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + timeout_ms / 1000
+                elif now >= deadline:
+                    raise BackpressureError(
+                        f"shared memory ring full: {capacity} bytes after timeout"
+                    )
+            time.sleep(_FULL_POLL_S)
+        if skip:
+            if tail >= _RECORD_HEADER.size:
+                _RECORD_HEADER.pack_into(buf, _DATA_OFFSET + offset, _WRAP_MARKER)
+            write_pos += skip
+            offset = 0
+        start = _DATA_OFFSET + offset
+        _RECORD_HEADER.pack_into(buf, start, len(record))
+        start += _RECORD_HEADER.size
+        buf[start : start + len(record)] = record
+        write_pos += need
+        self._write_pos = write_pos
+        # Publish only after the record bytes are in place.
+        _POSITION.pack_into(buf, _WRITE_POS_OFFSET, write_pos)
+        self.ready.set()
+
+    def read(self) -> list[bytes]:
+        """Copy out every complete record and release its space to the writer."""
+        buf = self._buf
+        capacity = self.capacity
+        write_pos = _POSITION.unpack_from(buf, _WRITE_POS_OFFSET)[0]
+        read_pos = self._read_pos
+        records: list[bytes] = []
+        while read_pos < write_pos:
+            offset = read_pos % capacity
+            tail = capacity - offset
+            if tail < _RECORD_HEADER.size:
+                read_pos += tail
+                continue
+            (length,) = _RECORD_HEADER.unpack_from(buf, _DATA_OFFSET + offset)
+            if length == _WRAP_MARKER:
+                read_pos += tail
+                continue
+            start = _DATA_OFFSET + offset + _RECORD_HEADER.size
+            records.append(bytes(buf[start : start + length]))
+            read_pos += _RECORD_HEADER.size + length
+        if read_pos != self._read_pos:
+            self._read_pos = read_pos
+            _POSITION.pack_into(buf, _READ_POS_OFFSET, read_pos)
+        return records
+
+    def close(self) -> None:
+        self._buf = None  # type: ignore[assignment]
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+class SharedMemoryRawEventSink:
+    """RawEventSink that frames events into a SharedMemoryRing.
+
+    Events use the `framing` module's binary frames; header strings are interned
+    once per ring, so the reader must consume every record in order.
+    """
+
+    def __init__(self, ring: SharedMemoryRing) -> None:
+        self._ring = ring
+        self._lock = threading.Lock()
+        self._strings: dict[str, int] = {}
+
+    def write(self, event: RawMarketEvent, *, block: bool, timeout_ms: int | None) -> None:
+        self.write_batch((event,), block=block, timeout_ms=timeout_ms)
+
+    def write_batch(
+        self, events: Sequence[RawMarketEvent], *, block: bool, timeout_ms: int | None
+    ) -> None:
+        if not events:
+            return
+        with self._lock:
+            strings = self._strings
+            first_new_id = len(strings) + 1
+            parts: list[bytes] = []
+            for event in events:
+                ids = tuple(self._intern(value, parts) for value in header_strings(event))
+                parts.extend(event_frame(event, ids, normalized_encoding=NORMALIZED_MARSHAL))
+            try:
+                self._ring.write(b"".join(parts), block=block, timeout_ms=timeout_ms)
+            except Exception:
+                # Strings first framed in the rejected record never reached the reader.
+                for value in [value for value, id_ in strings.items() if id_ >= first_new_id]:
+                    del strings[value]
+                raise
+
+    def _intern(self, value: str | None, parts: list[bytes]) -> int:
+        if value is None:
+            return 0
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings) + 1
+            self._strings[value] = string_id
+            parts.append(string_frame(string_id, value))
+        return string_id
+
+
+class SharedMemoryEventReader:
+    """Drains a SharedMemoryRing into a downstream sink on its own thread.
+
+    Records are copied out of shared memory as soon as they are read, but
+    each `RawMarketEvent` is only built from its frame when it is delivered.
+    """
+
+    def __init__(
+        self,
+        ring: SharedMemoryRing,
+        downstream: RawEventSink,
+        *,
+        observability: Observability | None = None,
+        name: str = "market-data-shm-reader",
+    ) -> None:
+        self._ring = ring
+        self._downstream = downstream
+        self._observability = observability
+        self._name = name
+        self._strings: dict[int, str] = {0: ""}
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._drain, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 1.0) -> None:
+        """Stop the reader once everything already in the ring is delivered."""
+        self._running = False
+        self._ring.ready.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout_s)
+            self._thread = None
+
+    def frames(self) -> Iterator[JournalFrame]:
+        """Frames of every record currently in the ring, in write order."""
+        strings = self._strings
+        for record in self._ring.read():
+            yield from iter_frames(
+                memoryview(record),
+                0,
+                strings,
+                start_recv_ts_ms=None,
+                end_recv_ts_ms=None,
+                normalized_encoding=NORMALIZED_MARSHAL,
+            )
+
+    def _drain(self) -> None:
+        ready = self._ring.ready
+        while True:
+            delivered = self._deliver_available()
+            if delivered:
+                continue
+            if not self._running:
+                return
+            ready.clear()
+            if self._deliver_available():
+                continue
+            ready.wait(_EMPTY_WAIT_S)
+
+    def _deliver_available(self) -> int:
+        delivered = 0
+        for frame in self.frames():
+            delivered += 1
+            event = frame.to_event()
+            try:
+                self._downstream.write(event, block=True, timeout_ms=None)
+            except Exception as exc:
+                self._get_observability().logger.log(
+                    logging.ERROR,
+                    "market_data.sink_delivery_failed",
+                    {
+                        "source_id": event.source_id,
+                        "symbol": event.symbol,
+                        "event_type": event.event_type,
+                        "error_detail": str(exc),
+                    },
+                )
+        return delivered
+
+    def _get_observability(self) -> Observability:
+        return self._observability or get_observability()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Sequence
+from typing import Protocol, runtime_checkable
 
 from market_data.contracts import RawMarketEvent
 
@@ -12,3 +13,20 @@ class BackpressureError(RuntimeError):
 class RawEventSink(Protocol):
     def write(self, event: RawMarketEvent, *, block: bool, timeout_ms: int | None) -> None:
         """Write a raw market event or raise BackpressureError when saturated."""
+
+
+@runtime_checkable
+class BoundedRawEventSink(RawEventSink, Protocol):
+    @property
+    def pending(self) -> int:
+        """Number of events accepted but not yet delivered downstream."""
+        ...
+
+
+@runtime_checkable
+class BatchRawEventSink(RawEventSink, Protocol):
+    def write_batch(
+        self, events: Sequence[RawMarketEvent], *, block: bool, timeout_ms: int | None
+    ) -> None:
+        """Write events in order; `timeout_ms` bounds the whole batch."""
+        ...
@@ -3,12 +3,15 @@
 from orchestrator.buffer import BufferFullError, RawInputBuffer
 from orchestrator.config import (
     BufferRetentionConfig,
+    BufferSpillConfig,
     EngineConfig,
     OrchestratorConfig,
     OutputPublishConfig,
     RetryPolicy,
     SchedulerConfig,
     SourceConfig,
+    validate_buffer_retention,
+    validate_buffer_spill,
     validate_config,
 )
 from orchestrator.contracts import (
@@ -61,6 +64,7 @@ from orchestrator.subscription import BufferingSubscriber, InputSubscriber
 __all__ = [
     "BufferRetentionConfig",
     "BufferFullError",
+    "BufferSpillConfig",
     "EngineConfig",
     "OrchestratorConfig",
     "OutputPublishConfig",
@@ -68,6 +72,8 @@ __all__ = [
     "RetryPolicy",
     "SchedulerConfig",
     "SourceConfig",
+    "validate_buffer_retention",
+    "validate_buffer_spill",
     "validate_config",
     "ENGINE_MODE_HYSTERESIS",
     "ENGINE_MODE_TRUTH",
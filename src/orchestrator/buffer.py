@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
 import time
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 
+from market_data.columnar import ColumnarEventStore
 from market_data.contracts import RawMarketEvent
+from market_data.payload_store import PayloadStore
+from orchestrator.config import (
+    BufferRetentionConfig,
+    BufferSpillConfig,
+    validate_buffer_retention,
+    validate_buffer_spill,
+)
 from orchestrator.contracts import RawInputBufferRecord
+from orchestrator.spill import SPILL_SEGMENT_SUFFIX, SpillSegment, write_spill_segment
+
+# Eviction waits until at least this many records (or 1/8 of the buffer) are
+# evictable, so each `del records[:n]` is paid for by the records it drops.
+_EVICT_CHUNK_RECORDS = 1024
 
 
 class BufferFullError(RuntimeError):
@@ -14,54 +34,492 @@ class BufferFullError(RuntimeError):
 
 @dataclass
 class RawInputBuffer:
+    """Ingest-ordered records with seq and per-symbol range queries.
+
+    Seqs are assigned consecutively, so `records[seq - first_seq]` locates a
+    record directly; each symbol keeps its own ascending list of seqs, and
+    symbol range queries bisect it, costing O(log n + k).
+
+    With `retention` set, records at or below the low watermark are evicted
+    from the head: the minimum of the seq consumers have `release`d, every
+    pinned seq, and the newest `retention.max_records` records (and, with
+    `max_age_ms`, those ingested within it). Without it the buffer only grows.
+
+    With `spill` set, `records` is only the hot tail: once it holds more than
+    `spill.max_hot_records`, a background thread writes the oldest
+    `spill.segment_records` to a memory-mapped segment file and drops them
+    from memory. Range queries span both tiers; `max_records` then caps the
+    hot tail alone, and is reached only if spilling falls behind.
+
+    Concurrency: any number of threads may call `append`, but appends are
+    serialized by a writer lock, so the buffer has a single writer at a time
+    and seqs are assigned in the order records land. A record becomes
+    visible only when `last_ingest_seq` advances past it, which happens after
+    it is fully indexed; every read clamps to that seq, so readers always see
+    a gap-free prefix and never a half-appended record. Spilling and
+    eviction only drop records from the head, under a separate tier lock
+    that readers also take, and never wait for the writer lock.
+    """
+
     max_records: int
     records: list[RawInputBufferRecord]
     _next_seq: int = 1
+    payload_store: PayloadStore | None = None
+    columnar: ColumnarEventStore | None = None
+    retention: BufferRetentionConfig | None = None
+    spill: BufferSpillConfig | None = None
 
-    def __init__(self, *, max_records: int) -> None:
+    def __init__(
+        self,
+        *,
+        max_records: int,
+        payload_store: PayloadStore | None = None,
+        columnar: ColumnarEventStore | None = None,
+        retention: BufferRetentionConfig | None = None,
+        spill: BufferSpillConfig | None = None,
+    ) -> None:
         if max_records <= 0:
             raise ValueError("max_records must be > 0")
+        if retention is not None:
+            validate_buffer_retention(retention)
+            if spill is None and retention.max_records >= max_records:
+                raise ValueError("buffer_retention.max_records must be < max_records")
+        if spill is not None:
+            validate_buffer_spill(spill)
+            if spill.max_hot_records + spill.segment_records >= max_records:
+                raise ValueError(
+                    "buffer_spill.max_hot_records + buffer_spill.segment_records "
+                    "must be < max_records"
+                )
         self.max_records = max_records
         self.records = []
         self._next_seq = 1
+        self._symbol_seqs: dict[str, list[int]] = {}
+        self.payload_store = payload_store
+        self.columnar = columnar
+        self.retention = retention
+        self.spill = spill
+        self._released_seq = 0
+        self._evicted_through_seq = 0
+        self._pins: dict[int, int] = {}
+        self._append_lock = threading.Lock()
+        # Guards the tier boundary: spilling and eviction drop the head of
+        # `records` under it, so readers take it to index records safely.
+        self._lock = threading.Lock()
+        self._segments: list[SpillSegment] = []
+        self._spiller: _Spiller | None = None
+        if spill is not None:
+            os.makedirs(spill.directory, exist_ok=True)
+            directory = tempfile.mkdtemp(prefix="raw-input-", dir=spill.directory)
+            self._spiller = _Spiller(self, directory)
+            self._spiller.start()
 
     def append(
         self, event: RawMarketEvent, *, ingest_ts_ms: int | None = None
     ) -> RawInputBufferRecord:
-        if len(self.records) >= self.max_records:
-            raise BufferFullError("input buffer capacity exceeded")
-        timestamp = ingest_ts_ms if ingest_ts_ms is not None else _now_ms()
-        record = RawInputBufferRecord(
-            ingest_seq=self._next_seq,
-            ingest_ts_ms=timestamp,
-            event=event,
-        )
-        self.records.append(record)
-        self._next_seq += 1
+        with self._append_lock:
+            if len(self.records) >= self.max_records and not self._evict(force=True):
+                raise BufferFullError("input buffer capacity exceeded")
+            seq = self._next_seq
+            timestamp = ingest_ts_ms if ingest_ts_ms is not None else _now_ms()
+            record: RawInputBufferRecord
+            if self.payload_store is None:
+                record = RawInputBufferRecord(
+                    ingest_seq=seq,
+                    ingest_ts_ms=timestamp,
+                    event=event,
+                )
+            else:
+                offset, length = self.payload_store.put(event)
+                record = StoredPayloadRecord(
+                    ingest_seq=seq,
+                    ingest_ts_ms=timestamp,
+                    store=self.payload_store,
+                    offset=offset,
+                    length=length,
+                )
+            self.records.append(record)
+            seqs = self._symbol_seqs.get(event.symbol)
+            if seqs is None:
+                seqs = self._symbol_seqs[event.symbol] = []
+            seqs.append(seq)
+            if self.columnar is not None:
+                self.columnar.append(seq, event)
+            # Publish last: readers treat everything up to here as complete.
+            self._next_seq = seq + 1
+        spiller = self._spiller
+        if spiller is not None and len(self.records) >= spiller.threshold:
+            spiller.wake()
         return record
 
     def all_records(self) -> Iterable[RawInputBufferRecord]:
-        return tuple(self.records)
+        last_seq = self.last_ingest_seq()
+        if last_seq is None:
+            return ()
+        return tuple(self.range_by_seq(start_seq=1, end_seq=last_seq))
 
     def range_by_seq(self, *, start_seq: int, end_seq: int) -> list[RawInputBufferRecord]:
         if start_seq > end_seq:
             raise ValueError("start_seq must be <= end_seq")
-        return [
-            record
-            for record in self.records
-            if start_seq <= record.ingest_seq <= end_seq
-        ]
+        end_seq = min(end_seq, self._next_seq - 1)
+        with self._lock:
+            start_seq = max(start_seq, self._evicted_through_seq + 1)
+            segments = self._segments_in_range(start_seq, end_seq)
+            records = self.records
+            hot: list[RawInputBufferRecord] = []
+            if records:
+                first_seq = records[0].ingest_seq
+                start = max(start_seq - first_seq, 0)
+                end = max(end_seq - first_seq + 1, 0)
+                hot = records[start:end]
+        if not segments:
+            return hot
+        result: list[RawInputBufferRecord] = []
+        for segment in segments:
+            result.extend(segment.range_by_seq(start_seq, end_seq))
+        result.extend(hot)
+        return result
 
     def range_by_symbol(
         self, *, symbol: str, start_seq: int, end_seq: int
     ) -> list[RawInputBufferRecord]:
-        records = self.range_by_seq(start_seq=start_seq, end_seq=end_seq)
-        return [record for record in records if record.event.symbol == symbol]
+        if start_seq > end_seq:
+            raise ValueError("start_seq must be <= end_seq")
+        end_seq = min(end_seq, self._next_seq - 1)
+        with self._lock:
+            start_seq = max(start_seq, self._evicted_through_seq + 1)
+            segments = self._segments_in_range(start_seq, end_seq)
+            seqs = self._symbol_seqs.get(symbol)
+            records = self.records
+            hot: list[RawInputBufferRecord] = []
+            if seqs and records:
+                first_seq = records[0].ingest_seq
+                start = bisect.bisect_left(seqs, max(start_seq, first_seq))
+                end = bisect.bisect_right(seqs, end_seq)
+                hot = [records[seq - first_seq] for seq in seqs[start:end]]
+        if not segments:
+            return hot
+        result: list[RawInputBufferRecord] = []
+        for segment in segments:
+            result.extend(segment.range_by_symbol(symbol, start_seq, end_seq))
+        result.extend(hot)
+        return result
 
-    def last_ingest_seq(self) -> int | None:
-        if not self.records:
+    def first_seq_for_symbol(self, symbol: str, *, end_seq: int) -> int | None:
+        """Oldest buffered seq for `symbol` that is <= `end_seq`."""
+        end_seq = min(end_seq, self._next_seq - 1)
+        with self._lock:
+            first_seq = None
+            for segment in self._segments:
+                first_seq = segment.first_seq_for_symbol(
+                    symbol, after_seq=self._evicted_through_seq
+                )
+                if first_seq is not None:
+                    break
+            if first_seq is None:
+                seqs = self._symbol_seqs.get(symbol)
+                first_seq = seqs[0] if seqs else None
+        if first_seq is None or first_seq > end_seq:
             return None
-        return self.records[-1].ingest_seq
+        return first_seq
+
+    def last_ingest_seq(self) -> int | None:
+        return self._next_seq - 1 if self._next_seq > 1 else None
+
+    def symbols(self) -> tuple[str, ...]:
+        """Symbols with at least one buffered record."""
+        with self._lock:
+            symbols = {symbol for symbol, seqs in self._symbol_seqs.items() if seqs}
+            for segment in self._segments:
+                symbols.update(segment.symbols())
+        return tuple(sorted(symbols))
+
+    @property
+    def evicted_through_seq(self) -> int:
+        """Highest evicted seq; 0 until the first eviction."""
+        return self._evicted_through_seq
+
+    @property
+    def spilled_records(self) -> int:
+        """Records currently held in spill segments rather than memory."""
+        with self._lock:
+            return sum(len(segment) for segment in self._segments)
+
+    def pin(self, seq: int) -> None:
+        """Keep records from `seq` onwards until the matching `unpin`."""
+        with self._lock:
+            if seq <= self._evicted_through_seq:
+                raise ValueError(f"seq {seq} has already been evicted")
+            self._pins[seq] = self._pins.get(seq, 0) + 1
+
+    def unpin(self, seq: int) -> None:
+        with self._lock:
+            count = self._pins.get(seq)
+            if count is None:
+                raise ValueError(f"seq {seq} is not pinned")
+            if count == 1:
+                del self._pins[seq]
+            else:
+                self._pins[seq] = count - 1
+
+    @contextmanager
+    def pinned(self, seq: int) -> Iterator[None]:
+        self.pin(seq)
+        try:
+            yield
+        finally:
+            self.unpin(seq)
+
+    def release(self, seq: int, *, now_ms: int | None = None) -> int:
+        """Mark records through `seq` consumed; returns how many were evicted."""
+        with self._lock:
+            if seq > self._released_seq:
+                self._released_seq = seq
+        return self._evict(force=False, now_ms=now_ms)
+
+    def low_watermark(self, *, now_ms: int | None = None) -> int:
+        """Highest seq retention allows evicting."""
+        with self._lock:
+            return self._low_watermark_locked(now_ms)
+
+    def flush_spill(self, timeout_s: float = 5.0) -> None:
+        """Wait until the hot tail is back within its budget."""
+        if self._spiller is not None:
+            self._spiller.drain(timeout_s)
+
+    def close(self) -> None:
+        """Stop spilling and delete the spill segments; spilled records are lost."""
+        spiller = self._spiller
+        if spiller is None:
+            return
+        self._spiller = None
+        spiller.stop()
+        with self._lock:
+            self._segments = []
+        shutil.rmtree(spiller.directory, ignore_errors=True)
+
+    def _low_watermark_locked(self, now_ms: int | None) -> int:
+        retention = self.retention
+        last_seq = self._next_seq - 1
+        if retention is None or last_seq <= 0:
+            return self._evicted_through_seq
+        watermark = min(self._released_seq, last_seq - retention.max_records)
+        if self._pins:
+            watermark = min(watermark, min(self._pins) - 1)
+        if retention.max_age_ms is not None:
+            cutoff_ms = (now_ms if now_ms is not None else _now_ms()) - retention.max_age_ms
+            watermark = min(watermark, self._first_seq_ingested_since(cutoff_ms) - 1)
+        return max(watermark, self._evicted_through_seq)
+
+    def _first_seq_ingested_since(self, cutoff_ms: int) -> int:
+        # Ingest timestamps come from the wall clock, so they are treated as
+        # non-decreasing and each tier is bisected.
+        for segment in self._segments:
+            ingest_ts_ms = segment.ingest_ts_ms
+            if ingest_ts_ms[-1] >= cutoff_ms:
+                return segment.first_seq + bisect.bisect_left(ingest_ts_ms, cutoff_ms)
+        records = self.records
+        if not records:
+            return self._next_seq
+        return records[0].ingest_seq + bisect.bisect_left(records, cutoff_ms, key=_ingest_ts_ms)
+
+    def _evict(self, *, force: bool, now_ms: int | None = None) -> int:
+        with self._lock:
+            evicted_through = self._evicted_through_seq
+            watermark = self._low_watermark_locked(now_ms)
+            count = watermark - evicted_through
+            if count <= 0:
+                return 0
+            retained = self._next_seq - 1 - evicted_through
+            if not force and count < max(_EVICT_CHUNK_RECORDS, retained // 8):
+                return 0
+            dropped = 0
+            while dropped < len(self._segments) and self._segments[dropped].last_seq <= watermark:
+                dropped += 1
+            if dropped:
+                self._spiller.discard(self._segments[:dropped])  # type: ignore[union-attr]
+                del self._segments[:dropped]
+            records = self.records
+            if records:
+                hot_count = min(watermark - records[0].ingest_seq + 1, len(records))
+                if hot_count > 0:
+                    del records[:hot_count]
+                    self._discard_payloads()
+            self._trim_symbol_seqs(watermark)
+            if self.columnar is not None:
+                self.columnar.evict_through(watermark)
+            self._evicted_through_seq = watermark
+            return count
+
+    def _discard_payloads(self) -> None:
+        # Only called once eviction reaches the hot tier, so every record
+        # before the hot head is gone and its stored payload can go too.
+        store = self.payload_store
+        if store is None:
+            return
+        records = self.records
+        if not records:
+            store.discard_before(store.size)
+        elif isinstance(records[0], StoredPayloadRecord):
+            store.discard_before(records[0].offset)
+
+    def _spill_once(self, directory: str) -> bool:
+        spill = self.spill
+        assert spill is not None
+        with self._lock:
+            records = self.records
+            if len(records) - spill.max_hot_records < spill.segment_records:
+                return False
+            committed = self._next_seq - records[0].ingest_seq
+            batch = records[: min(spill.segment_records, committed)]
+        path = os.path.join(directory, f"{batch[0].ingest_seq:020d}{SPILL_SEGMENT_SUFFIX}")
+        segment = write_spill_segment(path, batch)
+        with self._lock:
+            if segment.last_seq <= self._evicted_through_seq:
+                segment.unlink()
+                return True
+            del self.records[: segment.last_seq - self.records[0].ingest_seq + 1]
+            self._segments.append(segment)
+            self._trim_symbol_seqs(segment.last_seq)
+        return True
+
+    def _segments_in_range(self, start_seq: int, end_seq: int) -> list[SpillSegment]:
+        segments = self._segments
+        index = bisect.bisect_left(segments, start_seq, key=_segment_last_seq)
+        selected = []
+        while index < len(segments) and segments[index].first_seq <= end_seq:
+            selected.append(segments[index])
+            index += 1
+        return selected
+
+    def _trim_symbol_seqs(self, through_seq: int) -> None:
+        # Emptied lists are kept: `append` may hold one without the lock.
+        for seqs in list(self._symbol_seqs.values()):
+            index = bisect.bisect_right(seqs, through_seq)
+            if index:
+                del seqs[:index]
+
+
+class _Spiller:
+    """Background thread that moves the hot tail's head into spill segments.
+
+    Segment files are written outside the buffer lock; only publishing a
+    finished segment and dropping its records from memory take it, so
+    `append` never waits on disk. Evicted segments are unlinked here too.
+    """
+
+    def __init__(self, buffer: RawInputBuffer, directory: str) -> None:
+        spill = buffer.spill
+        assert spill is not None
+        self.directory = directory
+        self.threshold = spill.max_hot_records + spill.segment_records
+        self._buffer = buffer
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._discarded: list[SpillSegment] = []
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="orchestrator-buffer-spill", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def wake(self) -> None:
+        if not self._wake.is_set():
+            self._idle.clear()
+            self._wake.set()
+
+    def drain(self, timeout_s: float) -> None:
+        deadline = time.monotonic() + timeout_s
+        while len(self._buffer.records) >= self.threshold or self._discarded:
+            self.wake()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._idle.wait(remaining):
+                raise TimeoutError("buffer spill did not finish in time")
+
+    def discard(self, segments: list[SpillSegment]) -> None:
+        self._discarded.extend(segments)
+        self.wake()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._running:
+                self._unlink_discarded()
+                return
+            while self._buffer._spill_once(self.directory):
+                pass
+            self._unlink_discarded()
+            if not self._wake.is_set():
+                self._idle.set()
+
+    def _unlink_discarded(self) -> None:
+        while self._discarded:
+            self._discarded.pop().unlink()
+
+
+class StoredPayloadRecord(RawInputBufferRecord):
+    """Buffer record whose event lives in a PayloadStore.
+
+    Only the ingest fields and the event's offset in the store stay in
+    memory; `event` and `compact_event` read the event back each time they
+    are accessed, and `event` fills in `payload_hash` from the stored bytes
+    when the source did not provide one. Once the buffer evicts a record its
+    store segment may be discarded, after which reading it raises ValueError.
+    """
+
+    __slots__ = ("store", "offset", "length")
+
+    def __init__(
+        self,
+        *,
+        ingest_seq: int,
+        ingest_ts_ms: int,
+        store: PayloadStore,
+        offset: int,
+        length: int,
+    ) -> None:
+        object.__setattr__(self, "ingest_seq", ingest_seq)
+        object.__setattr__(self, "ingest_ts_ms", ingest_ts_ms)
+        object.__setattr__(self, "store", store)
+        object.__setattr__(self, "offset", offset)
+        object.__setattr__(self, "length", length)
+
+    @property
+    def symbol(self) -> str:
+        return self.store.frame(self.offset, self.length).symbol  # type: ignore[attr-defined]
+
+    @property
+    def compact_event(self) -> RawMarketEvent:
+        return self.store.frame(self.offset, self.length).to_event()  # type: ignore[attr-defined]
+
+    @property  # type: ignore[override]
+    def event(self) -> RawMarketEvent:
+        frame = self.store.frame(self.offset, self.length)  # type: ignore[attr-defined]
+        event = frame.to_event()
+        if event.payload_hash is None:
+            event = replace(event, payload_hash=hashlib.sha256(frame.raw_payload).hexdigest())
+        return event
+
+
+def _ingest_ts_ms(record: RawInputBufferRecord) -> int:
+    return record.ingest_ts_ms
+
+
+def _segment_last_seq(segment: SpillSegment) -> int:
+    return segment.last_seq
 
 
 def _now_ms() -> int:
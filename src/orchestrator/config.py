@@ -18,6 +18,13 @@ class BufferRetentionConfig:
     max_age_ms: int | None = None
 
 
+@dataclass(frozen=True)
+class BufferSpillConfig:
+    directory: str
+    max_hot_records: int
+    segment_records: int = 4096
+
+
 @dataclass(frozen=True)
 class OutputPublishConfig:
     max_pending: int
@@ -79,15 +86,26 @@ def validate_config(config: OrchestratorConfig) -> None:
     _validate_retry(config.engine_retry, "engine_retry")
     _validate_retry(config.publish_retry, "publish_retry")
 
-    _require_positive(config.buffer_retention.max_records, "buffer_retention.max_records")
-    if config.buffer_retention.max_age_ms is not None:
-        _require_positive(config.buffer_retention.max_age_ms, "buffer_retention.max_age_ms")
+    validate_buffer_retention(config.buffer_retention)
 
     _require_positive(config.output_publish.max_pending, "output_publish.max_pending")
     if config.output_publish.max_block_ms is not None:
         _require_positive(config.output_publish.max_block_ms, "output_publish.max_block_ms")
 
 
+def validate_buffer_retention(retention: BufferRetentionConfig) -> None:
+    _require_positive(retention.max_records, "buffer_retention.max_records")
+    if retention.max_age_ms is not None:
+        _require_positive(retention.max_age_ms, "buffer_retention.max_age_ms")
+
+
+def validate_buffer_spill(spill: BufferSpillConfig) -> None:
+    if not spill.directory:
+        raise ValueError("buffer_spill.directory must be set")
+    _require_positive(spill.max_hot_records, "buffer_spill.max_hot_records")
+    _require_positive(spill.segment_records, "buffer_spill.segment_records")
+
+
 def _validate_scheduler(scheduler: SchedulerConfig) -> None:
     if scheduler.mode not in {"timer", "boundary"}:
         raise ValueError("scheduler.mode must be 'timer' or 'boundary'")
@@ -68,12 +68,21 @@ class OrchestratorEvent:
     payload: object | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RawInputBufferRecord:
     ingest_seq: int
     ingest_ts_ms: int
     event: RawMarketEvent
 
+    @property
+    def symbol(self) -> str:
+        return self.event.symbol
+
+    @property
+    def compact_event(self) -> RawMarketEvent:
+        """The event as feature computation needs it; `raw_payload` may be empty."""
+        return self.event
+
 
 @dataclass(frozen=True)
 class EngineRunRecord:
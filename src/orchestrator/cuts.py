@@ -28,8 +28,10 @@ class CutSelector:
         if cut_end_ingest_seq <= 0:
             raise ValueError("cut_end_ingest_seq must be > 0")
         last_end = self._last_end_by_symbol.get(symbol)
-        start_seq = (last_end + 1) if last_end is not None else self._first_seq_for_symbol(
-            buffer, symbol, cut_end_ingest_seq
+        start_seq = (
+            (last_end + 1)
+            if last_end is not None
+            else buffer.first_seq_for_symbol(symbol, end_seq=cut_end_ingest_seq)
         )
         if start_seq is None:
             raise ValueError("no buffered records available for symbol")
@@ -43,15 +45,24 @@ class CutSelector:
             cut_kind=cut_kind,
         )
 
+    def low_watermark(self, buffer: RawInputBuffer) -> int:
+        """Highest seq every buffered symbol has been cut through.
+
+        A symbol that has never been cut holds the watermark just below its
+        oldest buffered record.
+        """
+        latest_seq = buffer.last_ingest_seq()
+        if latest_seq is None:
+            return 0
+        watermark = latest_seq
+        for symbol in buffer.symbols():
+            last_end = self._last_end_by_symbol.get(symbol)
+            if last_end is None:
+                first_seq = buffer.first_seq_for_symbol(symbol, end_seq=latest_seq)
+                last_end = first_seq - 1 if first_seq is not None else latest_seq
+            watermark = min(watermark, last_end)
+        return watermark
+
     @staticmethod
     def latest_ingest_seq(buffer: RawInputBuffer) -> int | None:
         return buffer.last_ingest_seq()
-
-    @staticmethod
-    def _first_seq_for_symbol(
-        buffer: RawInputBuffer, symbol: str, cut_end_ingest_seq: int
-    ) -> int | None:
-        for record in buffer.range_by_seq(start_seq=1, end_seq=cut_end_ingest_seq):
-            if record.event.symbol == symbol:
-                return record.ingest_seq
-        return None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from orchestrator.contracts import ENGINE_MODE_HYSTERESIS, ENGINE_MODE_TRUTH
 from orchestrator.observability import NullLogger, NullMetrics, Observability
@@ -25,6 +26,7 @@ def _embedded_evidence_present(snapshot: RegimeInputSnapshot) -> bool:
 class HysteresisStatePersistence:
     store: HysteresisStore
     path: str
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     @classmethod
     def restore(
@@ -35,7 +37,9 @@ class HysteresisStatePersistence:
         return cls(store=store, path=path)
 
     def append(self, state: HysteresisState) -> None:
-        append_record(self.path, state)
+        # Engine runs for different symbols may persist concurrently.
+        with self._lock:
+            append_record(self.path, state)
 
 
 class HysteresisPersistenceError(RuntimeError):
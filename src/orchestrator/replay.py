@@ -35,6 +35,20 @@ def replay_events(
     run_records: Iterable[EngineRunRecord],
     engine_runner: EngineCallable,
 ) -> ReplayResult:
+    run_records = tuple(run_records)
+    if not run_records:
+        return ReplayResult(events=[])
+    # Pinning raises if any cut has already been evicted, and keeps the
+    # retained range in place while the runs are replayed.
+    with buffer.pinned(min(record.cut_start_ingest_seq for record in run_records)):
+        return ReplayResult(events=_replay(buffer, run_records, engine_runner))
+
+
+def _replay(
+    buffer: RawInputBuffer,
+    run_records: tuple[EngineRunRecord, ...],
+    engine_runner: EngineCallable,
+) -> list[OrchestratorEvent]:
     sequencer = SymbolSequencer()
     events: list[OrchestratorEvent] = []
 
@@ -149,7 +163,7 @@ def replay_events(
         )
         _publish(sequencer, events, completed_event)
 
-    return ReplayResult(events=events)
+    return events
 
 
 def _publish(
@@ -167,7 +181,7 @@ def _raw_events_for_cut(
     end_seq: int,
 ) -> tuple[RawMarketEvent, ...]:
     records = buffer.range_by_symbol(symbol=symbol, start_seq=start_seq, end_seq=end_seq)
-    return tuple(record.event for record in records)
+    return tuple(record.compact_event for record in records)
 
 
 def _counts_by_event_type(raw_events: tuple[RawMarketEvent, ...]) -> dict[str, int]:
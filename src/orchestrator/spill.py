@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+from array import array
+from collections.abc import Sequence
+
+from market_data.contracts import RawMarketEvent
+from market_data.framing import (
+    NORMALIZED_MARSHAL,
+    JournalFrame,
+    event_frame,
+    header_strings,
+    iter_frames,
+    segment_header,
+    string_frame,
+)
+from orchestrator.contracts import RawInputBufferRecord
+
+SPILL_SEGMENT_SUFFIX = ".journal"
+
+
+class SpilledRecord(RawInputBufferRecord):
+    """Buffer record read back from a spill segment.
+
+    `frame` views the segment's mapping without copying; `event` decodes a
+    full event from it each time it is accessed.
+    """
+
+    __slots__ = ("frame",)
+
+    def __init__(self, *, ingest_seq: int, ingest_ts_ms: int, frame: JournalFrame) -> None:
+        object.__setattr__(self, "ingest_seq", ingest_seq)
+        object.__setattr__(self, "ingest_ts_ms", ingest_ts_ms)
+        object.__setattr__(self, "frame", frame)
+
+    @property
+    def symbol(self) -> str:
+        return self.frame.symbol  # type: ignore[attr-defined, no-any-return]
+
+    @property  # type: ignore[override]
+    def event(self) -> RawMarketEvent:
+        return self.frame.to_event()  # type: ignore[attr-defined, no-any-return]
+
+
+class SpillSegment:
+    """Consecutive buffer records spilled to a journal-format segment file.
+
+    Seqs run from `first_seq` without gaps, so record offsets are indexed by
+    `seq - first_seq`. The file is mapped read-only; the mapping is released
+    once neither the segment nor any frame read from it is referenced, so a
+    segment can be unlinked while readers still hold its records.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        first_seq: int,
+        offsets: array,
+        ingest_ts_ms: array,
+        symbol_seqs: dict[str, array],
+        strings: dict[int, str],
+    ) -> None:
+        self.path = path
+        self.first_seq = first_seq
+        self.last_seq = first_seq + len(offsets) - 1
+        self.ingest_ts_ms = ingest_ts_ms
+        self._offsets = offsets
+        self._symbol_seqs = symbol_seqs
+        self._strings = strings
+        with open(path, "rb") as handle:
+            self._view = memoryview(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def symbols(self) -> tuple[str, ...]:
+        return tuple(self._symbol_seqs)
+
+    def first_seq_for_symbol(self, symbol: str, *, after_seq: int) -> int | None:
+        seqs = self._symbol_seqs.get(symbol)
+        if seqs is None:
+            return None
+        index = bisect.bisect_right(seqs, after_seq)
+        return seqs[index] if index < len(seqs) else None
+
+    def range_by_seq(self, start_seq: int, end_seq: int) -> list[SpilledRecord]:
+        """Records in `[start_seq, end_seq]`, read sequentially from the file."""
+        low = max(start_seq, self.first_seq) - self.first_seq
+        high = min(end_seq, self.last_seq) - self.first_seq + 1
+        if low >= high:
+            return []
+        frames = iter_frames(
+            self._view,
+            self._offsets[low],
+            self._strings,
+            start_recv_ts_ms=None,
+            end_recv_ts_ms=None,
+            normalized_encoding=NORMALIZED_MARSHAL,
+        )
+        ingest_ts_ms = self.ingest_ts_ms
+        return [
+            SpilledRecord(
+                ingest_seq=self.first_seq + index,
+                ingest_ts_ms=ingest_ts_ms[index],
+                frame=frame,
+            )
+            for index, frame in zip(range(low, high), frames, strict=False)
+        ]
+
+    def range_by_symbol(self, symbol: str, start_seq: int, end_seq: int) -> list[SpilledRecord]:
+        seqs = self._symbol_seqs.get(symbol)
+        if seqs is None:
+            return []
+        low = bisect.bisect_left(seqs, start_seq)
+        high = bisect.bisect_right(seqs, end_seq)
+        return [self._record(seq) for seq in seqs[low:high]]
+
+    def unlink(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _record(self, seq: int) -> SpilledRecord:
+        index = seq - self.first_seq
+        frames = iter_frames(
+            self._view,
+            self._offsets[index],
+            self._strings,
+            start_recv_ts_ms=None,
+            end_recv_ts_ms=None,
+            normalized_encoding=NORMALIZED_MARSHAL,
+        )
+        return SpilledRecord(
+            ingest_seq=seq, ingest_ts_ms=self.ingest_ts_ms[index], frame=next(frames)
+        )
+
+
+def write_spill_segment(path: str, records: Sequence[RawInputBufferRecord]) -> SpillSegment:
+    """Write consecutive `records` to a new segment file and map it."""
+    if not records:
+        raise ValueError("records must not be empty")
+    strings: dict[str, int] = {}
+    offsets = array("Q")
+    ingest_ts_ms = array("q")
+    symbol_seqs: dict[str, array] = {}
+    with open(path, "xb") as handle:
+        header = segment_header(NORMALIZED_MARSHAL)
+        handle.write(header)
+        size = len(header)
+        for record in records:
+            event = record.event
+            ids = []
+            for value in header_strings(event):
+                if value is None:
+                    ids.append(0)
+                    continue
+                string_id = strings.get(value)
+                if string_id is None:
+                    string_id = strings[value] = len(strings) + 1
+                    frame = string_frame(string_id, value)
+                    handle.write(frame)
+                    size += len(frame)
+                ids.append(string_id)
+            offsets.append(size)
+            for part in event_frame(event, tuple(ids), normalized_encoding=NORMALIZED_MARSHAL):
+                handle.write(part)
+                size += len(part)
+            ingest_ts_ms.append(record.ingest_ts_ms)
+            seqs = symbol_seqs.get(event.symbol)
+            if seqs is None:
+                seqs = symbol_seqs[event.symbol] = array("q")
+            seqs.append(record.ingest_seq)
+    return SpillSegment(
+        path,
+        first_seq=records[0].ingest_seq,
+        offsets=offsets,
+        ingest_ts_ms=ingest_ts_ms,
+        symbol_seqs=symbol_seqs,
+        strings={0: "", **{string_id: value for value, string_id in strings.items()}},
+    )
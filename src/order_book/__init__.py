@@ -0,0 +1,21 @@
+"""Local L2 order books maintained from market_data BookDelta events."""
+
+from order_book.book import OrderBook, PriceLevel
+from order_book.engine import OrderBookEngine, OrderBookStatus
+from order_book.snapshot import (
+    BinanceDepthSnapshotProvider,
+    OrderBookSnapshot,
+    SnapshotProvider,
+    parse_binance_snapshot,
+)
+
+__all__ = [
+    "BinanceDepthSnapshotProvider",
+    "OrderBook",
+    "OrderBookEngine",
+    "OrderBookSnapshot",
+    "OrderBookStatus",
+    "PriceLevel",
+    "SnapshotProvider",
+    "parse_binance_snapshot",
+]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+
+PriceLevel = tuple[float, float]
+
+
+class _BookSide:
+    """Price levels held in two parallel `array('d')` columns.
+
+    Keys are sorted ascending with the best level last. Bids use the price as
+    key and asks the negated price. Finding a level is a bisection, O(log n),
+    and changing an existing level's quantity is O(log n) overall; adding or
+    removing a level also shifts the k better levels above it by one slot
+    (a memmove), so that is O(log n + k). Deltas cluster near the touch,
+    where k is small.
+    """
+
+    __slots__ = ("_keys", "_quantities", "_sign")
+
+    def __init__(self, *, is_bid: bool) -> None:
+        self._keys = array("d")
+        self._quantities = array("d")
+        self._sign = 1.0 if is_bid else -1.0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def copy(self) -> _BookSide:
+        side = _BookSide(is_bid=self._sign > 0)
+        side._keys = array("d", self._keys)
+        side._quantities = array("d", self._quantities)
+        return side
+
+    def set_level(self, price: float, quantity: float) -> None:
+        key = price * self._sign
+        keys = self._keys
+        index = bisect_left(keys, key)
+        found = index < len(keys) and keys[index] == key
+        if quantity <= 0.0:
+            if found:
+                del keys[index]
+                del self._quantities[index]
+            return
+        if found:
+            self._quantities[index] = quantity
+        else:
+            keys.insert(index, key)
+            self._quantities.insert(index, quantity)
+
+    def replace(self, levels: Iterable[Sequence[float]]) -> None:
+        merged: dict[float, float] = {}
+        for level in levels:
+            price, quantity = float(level[0]), float(level[1])
+            if quantity > 0.0:
+                merged[price * self._sign] = quantity
+        ordered = sorted(merged)
+        self._keys = array("d", ordered)
+        self._quantities = array("d", (merged[key] for key in ordered))
+
+    def best(self) -> PriceLevel | None:
+        if not self._keys:
+            return None
+        return self._keys[-1] * self._sign, self._quantities[-1]
+
+    def top(self, depth: int) -> list[PriceLevel]:
+        keys = self._keys
+        quantities = self._quantities
+        sign = self._sign
+        stop = max(len(keys) - depth, 0)
+        return [(keys[i] * sign, quantities[i]) for i in range(len(keys) - 1, stop - 1, -1)]
+
+    def quantity(self, depth: int) -> float:
+        quantities = self._quantities
+        return sum(quantities[max(len(quantities) - depth, 0) :])
+
+
+class OrderBook:
+    """L2 book for one symbol; quantities of 0 remove a level."""
+
+    __slots__ = ("symbol", "last_seq", "_bids", "_asks")
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.last_seq: int | None = None
+        self._bids = _BookSide(is_bid=True)
+        self._asks = _BookSide(is_bid=False)
+
+    def copy(self) -> OrderBook:
+        book = OrderBook(self.symbol)
+        book.last_seq = self.last_seq
+        book._bids = self._bids.copy()
+        book._asks = self._asks.copy()
+        return book
+
+    @property
+    def bid_levels(self) -> int:
+        return len(self._bids)
+
+    @property
+    def ask_levels(self) -> int:
+        return len(self._asks)
+
+    def replace(
+        self,
+        *,
+        bids: Iterable[Sequence[float]],
+        asks: Iterable[Sequence[float]],
+        last_seq: int | None,
+    ) -> None:
+        self._bids.replace(bids)
+        self._asks.replace(asks)
+        self.last_seq = last_seq
+
+    def apply(
+        self,
+        *,
+        bids: Iterable[Sequence[float]],
+        asks: Iterable[Sequence[float]],
+        seq: int | None = None,
+    ) -> None:
+        set_bid = self._bids.set_level
+        for level in bids:
+            set_bid(float(level[0]), float(level[1]))
+        set_ask = self._asks.set_level
+        for level in asks:
+            set_ask(float(level[0]), float(level[1]))
+        if seq is not None:
+            self.last_seq = seq
+
+    def best_bid(self) -> PriceLevel | None:
+        return self._bids.best()
+
+    def best_ask(self) -> PriceLevel | None:
+        return self._asks.best()
+
+    def mid_price(self) -> float | None:
+        bid = self._bids.best()
+        ask = self._asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def top_bids(self, depth: int) -> list[PriceLevel]:
+        return self._bids.top(depth)
+
+    def top_asks(self, depth: int) -> list[PriceLevel]:
+        return self._asks.top(depth)
+
+    def imbalance(self, depth: int) -> float | None:
+        """(bid qty - ask qty) / (bid qty + ask qty) over the top `depth` levels."""
+        bid_quantity = self._bids.quantity(depth)
+        ask_quantity = self._asks.quantity(depth)
+        total = bid_quantity + ask_quantity
+        if total <= 0.0:
+            return None
+        return (bid_quantity - ask_quantity) / total
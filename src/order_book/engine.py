@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from market_data.contracts import RawMarketEvent
+from order_book.book import OrderBook, PriceLevel
+from order_book.snapshot import SnapshotProvider
+
+
+@dataclass(frozen=True)
+class OrderBookStatus:
+    symbol: str
+    synced: bool
+    last_seq: int | None
+    gap_count: int
+    resync_count: int
+    resync_failures: int
+
+
+@dataclass(frozen=True)
+class _Delta:
+    bids: Sequence[Sequence[float]]
+    asks: Sequence[Sequence[float]]
+    seq: int | None
+    first_seq: int | None
+    prev_seq: int | None
+
+
+@dataclass
+class _SymbolBook:
+    book: OrderBook
+    pending: deque[_Delta]
+    synced: bool = False
+    bridged: bool = False
+    resyncing: bool = False
+    gap_count: int = 0
+    resync_count: int = 0
+    resync_failures: int = 0
+
+
+class OrderBookEngine:
+    """Maintains one local L2 book per symbol from `BookDelta` events.
+
+    A book starts unsynced and is seeded from the snapshot provider on its
+    first delta. Deltas at or below the book's `last_seq` are dropped. The
+    first delta after a snapshot must bridge it (`first_seq <= last_seq + 1`);
+    afterwards continuity is checked with `prev_seq` when the source sends it
+    and `first_seq` otherwise. A gap triggers a resync; failed snapshot
+    fetches leave the book unsynced until the next delta retries.
+
+    Snapshots are fetched on `resync_executor`, never under the engine lock,
+    so a slow fetch does not stall deltas for other symbols. While a symbol
+    is unsynced its deltas are buffered (up to `max_buffered_deltas`, oldest
+    dropped first) and replayed on top of the snapshot once it arrives.
+    """
+
+    def __init__(
+        self,
+        snapshot_provider: SnapshotProvider,
+        *,
+        resync_executor: Executor | None = None,
+        max_buffered_deltas: int = 1_000,
+    ) -> None:
+        if max_buffered_deltas <= 0:
+            raise ValueError("max_buffered_deltas must be > 0")
+        self._snapshot_provider = snapshot_provider
+        self._owns_executor = resync_executor is None
+        self._resync_executor = resync_executor or ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="order-book-resync"
+        )
+        self._max_buffered_deltas = max_buffered_deltas
+        self._books: dict[str, _SymbolBook] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._resync_executor.shutdown(wait=False, cancel_futures=True)
+
+    def on_event(self, event: RawMarketEvent) -> None:
+        if event.event_type != "BookDelta":
+            return
+        normalized = event.normalized
+        self.apply_delta(
+            event.symbol,
+            bids=normalized["bids"],  # type: ignore[arg-type]
+            asks=normalized["asks"],  # type: ignore[arg-type]
+            seq=event.source_seq,
+            first_seq=normalized.get("first_seq"),  # type: ignore[arg-type]
+            prev_seq=normalized.get("prev_seq"),  # type: ignore[arg-type]
+        )
+
+    def apply_delta(
+        self,
+        symbol: str,
+        *,
+        bids: Sequence[Sequence[float]],
+        asks: Sequence[Sequence[float]],
+        seq: int | None,
+        first_seq: int | None = None,
+        prev_seq: int | None = None,
+    ) -> bool:
+        """Apply one delta; returns False when it was dropped or buffered for a resync."""
+        delta = _Delta(bids=bids, asks=asks, seq=seq, first_seq=first_seq, prev_seq=prev_seq)
+        with self._lock:
+            entry = self._books.get(symbol)
+            if entry is None:
+                entry = _SymbolBook(
+                    book=OrderBook(symbol), pending=deque(maxlen=self._max_buffered_deltas)
+                )
+                self._books[symbol] = entry
+            if entry.synced:
+                applied = self._apply_locked(entry, delta)
+                if applied is not None:
+                    return applied
+                entry.gap_count += 1
+                entry.synced = False
+            entry.pending.append(delta)
+            if entry.resyncing:
+                return False
+            entry.resyncing = True
+        self._resync_executor.submit(self._resync, symbol)
+        return False
+
+    def book(self, symbol: str) -> OrderBook | None:
+        """A copy of the synced book for `symbol`, or None while it is unsynced."""
+        with self._lock:
+            book = self._synced_book_locked(symbol)
+            return book.copy() if book is not None else None
+
+    def top(self, symbol: str, depth: int) -> tuple[list[PriceLevel], list[PriceLevel]] | None:
+        with self._lock:
+            book = self._synced_book_locked(symbol)
+            if book is None:
+                return None
+            return book.top_bids(depth), book.top_asks(depth)
+
+    def imbalance(self, symbol: str, depth: int) -> float | None:
+        with self._lock:
+            book = self._synced_book_locked(symbol)
+            if book is None:
+                return None
+            return book.imbalance(depth)
+
+    def status(self, symbol: str) -> OrderBookStatus:
+        with self._lock:
+            entry = self._books.get(symbol)
+            if entry is None:
+                return OrderBookStatus(
+                    symbol=symbol,
+                    synced=False,
+                    last_seq=None,
+                    gap_count=0,
+                    resync_count=0,
+                    resync_failures=0,
+                )
+            return OrderBookStatus(
+                symbol=symbol,
+                synced=entry.synced,
+                last_seq=entry.book.last_seq,
+                gap_count=entry.gap_count,
+                resync_count=entry.resync_count,
+                resync_failures=entry.resync_failures,
+            )
+
+    def _synced_book_locked(self, symbol: str) -> OrderBook | None:
+        entry = self._books.get(symbol)
+        if entry is None or not entry.synced:
+            return None
+        return entry.book
+
+    def _resync(self, symbol: str) -> None:
+        try:
+            snapshot = self._snapshot_provider.fetch(symbol)
+        except Exception:
+            with self._lock:
+                entry = self._books[symbol]
+                entry.resync_failures += 1
+                entry.resyncing = False
+            return
+        with self._lock:
+            entry = self._books[symbol]
+            entry.resyncing = False
+            entry.book.replace(bids=snapshot.bids, asks=snapshot.asks, last_seq=snapshot.last_seq)
+            entry.synced = True
+            entry.bridged = False
+            entry.resync_count += 1
+            pending = entry.pending
+            while pending:
+                if self._apply_locked(entry, pending[0]) is None:
+                    # Either the snapshot is older than the buffered deltas or
+                    # they have a gap; the next delta retries the sync.
+                    if entry.bridged:
+                        entry.gap_count += 1
+                    entry.synced = False
+                    return
+                pending.popleft()
+
+    def _apply_locked(self, entry: _SymbolBook, delta: _Delta) -> bool | None:
+        """Apply `delta` to a synced book; None means it does not continue the book."""
+        book = entry.book
+        seq = delta.seq
+        last_seq = book.last_seq
+        if seq is not None and last_seq is not None:
+            if seq <= last_seq:
+                return False
+            if _is_gap(entry, last_seq, first_seq=delta.first_seq, prev_seq=delta.prev_seq):
+                return None
+        book.apply(bids=delta.bids, asks=delta.asks, seq=seq)
+        entry.bridged = True
+        return True
+
+
+def _is_gap(
+    entry: _SymbolBook,
+    last_seq: int | None,
+    *,
+    first_seq: int | None,
+    prev_seq: int | None,
+) -> bool:
+    if last_seq is None:
+        return False
+    if not entry.bridged:
+        return first_seq is not None and first_seq > last_seq + 1
+    if prev_seq is not None:
+        return prev_seq != last_seq
+    if first_seq is not None:
+        return first_seq != last_seq + 1
+    return False
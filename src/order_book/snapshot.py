@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import urllib.parse
+import urllib.request
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from order_book.book import PriceLevel
+
+BINANCE_FUTURES_DEPTH_URL = "https://fapi.binance.com/fapi/v1/depth"
+
+
+@dataclass(frozen=True)
+class OrderBookSnapshot:
+    symbol: str
+    last_seq: int
+    bids: tuple[PriceLevel, ...]
+    asks: tuple[PriceLevel, ...]
+
+
+class SnapshotProvider(Protocol):
+    def fetch(self, symbol: str) -> OrderBookSnapshot:
+        """Return a full book whose `last_seq` is comparable to delta `source_seq`."""
+        ...
+
+
+@dataclass(frozen=True)
+class BinanceDepthSnapshotProvider:
+    url: str = BINANCE_FUTURES_DEPTH_URL
+    limit: int = 1000
+    timeout_ms: int = 5000
+
+    def fetch(self, symbol: str) -> OrderBookSnapshot:
+        query = urllib.parse.urlencode({"symbol": symbol, "limit": self.limit})
+        with urllib.request.urlopen(
+            f"{self.url}?{query}", timeout=self.timeout_ms / 1000
+        ) as response:
+            payload = json.loads(response.read())
+        return parse_binance_snapshot(symbol, payload)
+
+
+def parse_binance_snapshot(symbol: str, payload: object) -> OrderBookSnapshot:
+    if not isinstance(payload, Mapping):
+        raise ValueError("depth snapshot must be a mapping")
+    last_seq = payload.get("lastUpdateId")
+    if not isinstance(last_seq, int) or isinstance(last_seq, bool):
+        raise ValueError("depth snapshot lastUpdateId must be an int")
+    return OrderBookSnapshot(
+        symbol=symbol,
+        last_seq=last_seq,
+        bids=_parse_levels(payload.get("bids"), "bids"),
+        asks=_parse_levels(payload.get("asks"), "asks"),
+    )
+
+
+def _parse_levels(value: object, key: str) -> tuple[PriceLevel, ...]:
+    if not isinstance(value, Sequence) or isinstance(value, (str, bytes)):
+        raise ValueError(f"depth snapshot {key} must be a list")
+    levels: list[PriceLevel] = []
+    for level in value:
+        if not isinstance(level, Sequence) or isinstance(level, (str, bytes)) or len(level) < 2:
+            raise ValueError(f"depth snapshot {key} levels must be [price, quantity]")
+        levels.append((float(level[0]), float(level[1])))
+    return tuple(levels)
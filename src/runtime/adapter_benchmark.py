@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, replace
+from multiprocessing.connection import Connection
+
+from market_data.adapters.binance.adapter import (
+    BinanceAggTradeAdapter,
+    BinanceDepthAdapter,
+    BinanceKlineAdapter,
+    BinanceMarkPriceAdapter,
+)
+from market_data.adapters.binance.config import (
+    BinanceAggTradeConfig,
+    BinanceDepthConfig,
+    BinanceKlineConfig,
+    BinanceMarkPriceConfig,
+)
+from market_data.config import BackpressureConfig
+from market_data.contracts import RawMarketEvent
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.pipeline import IngestionPipeline
+from market_data.replay_server import (
+    SYNTHETIC_STREAMS,
+    ReplayServer,
+    load_recorded_frames,
+    synthetic_frames,
+)
+from runtime.bus import EventBus
+from runtime.bus_sink import BusRawEventSink
+
+DEFAULT_RATES = (1_000, 5_000, 10_000, 20_000, 50_000)
+DEFAULT_DURATION_S = 5.0
+SATURATION_RATIO = 0.95
+_SERVER_TIMEOUT_S = 10.0
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+
+@dataclass(frozen=True)
+class BenchmarkRun:
+    """One replay at a fixed offered rate; 0 means as fast as possible."""
+
+    offered_rate_per_s: float
+    sent: int
+    frames: int
+    events: int
+    throughput_per_s: float
+    cpu_us_per_frame: float
+    latency: LatencySummary | None
+
+
+@dataclass(frozen=True)
+class BenchmarkReport:
+    stream: str
+    source: str
+    duration_s: float
+    runs: tuple[BenchmarkRun, ...]
+    saturation_rate_per_s: float | None
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+
+_WsAdapter = (
+    BinanceAggTradeAdapter | BinanceDepthAdapter | BinanceMarkPriceAdapter | BinanceKlineAdapter
+)
+
+
+def _agg_trade_adapter(url: str, symbol: str, pipeline: IngestionPipeline) -> _WsAdapter:
+    config = replace(BinanceAggTradeConfig.default(symbol=symbol), ws_url=url)
+    return BinanceAggTradeAdapter(config=config, pipeline=pipeline)
+
+
+def _depth_adapter(url: str, symbol: str, pipeline: IngestionPipeline) -> _WsAdapter:
+    config = replace(BinanceDepthConfig.default(symbol=symbol), ws_url=url)
+    return BinanceDepthAdapter(config=config, pipeline=pipeline)
+
+
+def _mark_price_adapter(url: str, symbol: str, pipeline: IngestionPipeline) -> _WsAdapter:
+    config = replace(BinanceMarkPriceConfig.default(symbol=symbol), ws_url=url)
+    return BinanceMarkPriceAdapter(config=config, pipeline=pipeline)
+
+
+def _kline_adapter(url: str, symbol: str, pipeline: IngestionPipeline) -> _WsAdapter:
+    config = replace(BinanceKlineConfig.default(symbol=symbol), ws_url=url)
+    return BinanceKlineAdapter(config=config, pipeline=pipeline)
+
+
+_ADAPTER_FACTORIES: dict[str, Callable[[str, str, IngestionPipeline], _WsAdapter]] = {
+    "aggTrade": _agg_trade_adapter,
+    "depth": _depth_adapter,
+    "markPrice": _mark_price_adapter,
+    "kline": _kline_adapter,
+}
+
+
+class _FrameClock:
+    """Frame observer that keeps the receive stamp of the frame being decoded.
+
+    Frames are decoded on the receive loop and the bus delivers
+    synchronously, so every event published between two frames belongs to
+    the last frame stamped.
+    """
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.recv_ns = 0
+
+    def __call__(self, recv_ns: int) -> None:
+        self.recv_ns = recv_ns
+        self.frames += 1
+
+
+def run_benchmark(
+    stream: str,
+    *,
+    rates: Sequence[float] = DEFAULT_RATES,
+    duration_s: float = DEFAULT_DURATION_S,
+    frames: Sequence[str] | None = None,
+    source: str = "synthetic",
+    symbol: str = "BTCUSDT",
+) -> BenchmarkReport:
+    """Replay `frames` at each offered rate and measure one adapter.
+
+    The server runs in a child process so its CPU is not charged to the
+    adapter. Latency is measured from the websocket receive returning a frame,
+    before it is decoded, to the RawMarketEvent reaching an EventBus subscriber. The saturation
+    rate is the first offered rate whose throughput falls below 95% of it.
+    """
+    if stream not in _ADAPTER_FACTORIES:
+        raise ValueError(f"stream must be one of: {', '.join(SYNTHETIC_STREAMS)}")
+    if duration_s <= 0:
+        raise ValueError("duration_s must be > 0")
+    if not rates:
+        raise ValueError("rates must not be empty")
+    replay_frames = list(frames) if frames is not None else synthetic_frames(stream, symbol=symbol)
+    runs = tuple(
+        asyncio.run(_run_once(stream, replay_frames, rate, duration_s, symbol)) for rate in rates
+    )
+    saturation = next(
+        (
+            run.offered_rate_per_s
+            for run in runs
+            if run.offered_rate_per_s
+            and run.throughput_per_s < run.offered_rate_per_s * SATURATION_RATIO
+        ),
+        None,
+    )
+    return BenchmarkReport(
+        stream=stream,
+        source=source,
+        duration_s=duration_s,
+        runs=runs,
+        saturation_rate_per_s=saturation,
+    )
+
+
+async def _run_once(
+    stream: str, frames: list[str], rate: float, duration_s: float, symbol: str
+) -> BenchmarkRun:
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(
+        target=_serve, args=(frames, rate, duration_s, child), daemon=True
+    )
+    server.start()
+    loop = asyncio.get_running_loop()
+    try:
+        url = await loop.run_in_executor(None, _receive, parent, _SERVER_TIMEOUT_S)
+        bus = EventBus()
+        pipeline = IngestionPipeline(
+            sink=BusRawEventSink(bus),
+            backpressure=BackpressureConfig(policy="block", max_pending=1),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+        )
+        adapter = _ADAPTER_FACTORIES[stream](str(url), symbol, pipeline)
+        clock = _FrameClock()
+        adapter.attach_frame_observer(clock)
+        latencies_ns: list[int] = []
+
+        def on_event(event: RawMarketEvent) -> None:
+            latencies_ns.append(time.perf_counter_ns() - clock.recv_ns)
+
+        bus.subscribe(RawMarketEvent, on_event)
+        adapter.start()
+        cpu_start = time.thread_time()
+        task = asyncio.create_task(adapter.run_async())
+        sent = await loop.run_in_executor(
+            None, _receive, parent, duration_s + _SERVER_TIMEOUT_S
+        )
+        cpu_s = time.thread_time() - cpu_start
+        adapter.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    finally:
+        server.join(timeout=1)
+        if server.is_alive():
+            server.terminate()
+    processed = clock.frames
+    return BenchmarkRun(
+        offered_rate_per_s=rate,
+        sent=int(sent),
+        frames=processed,
+        events=len(latencies_ns),
+        throughput_per_s=processed / duration_s,
+        cpu_us_per_frame=cpu_s * 1e6 / processed if processed else 0.0,
+        latency=_summarize_latency(latencies_ns),
+    )
+
+
+def _serve(frames: list[str], rate: float, duration_s: float, conn: Connection) -> None:
+    async def serve() -> None:
+        async with ReplayServer(frames, rate_per_s=rate, duration_s=duration_s) as server:
+            conn.send(server.url)
+            await server.wait_finished()
+            conn.send(server.sent)
+
+    asyncio.run(serve())
+
+
+def _receive(conn: Connection, timeout_s: float) -> object:
+    if not conn.poll(timeout_s):
+        raise RuntimeError("replay server did not respond")
+    return conn.recv()
+
+
+def _summarize_latency(latencies_ns: list[int]) -> LatencySummary | None:
+    if not latencies_ns:
+        return None
+    ordered = sorted(latencies_ns)
+    last = len(ordered) - 1
+    return LatencySummary(
+        p50_us=ordered[int(last * 0.5)] / 1000,
+        p99_us=ordered[int(last * 0.99)] / 1000,
+        max_us=ordered[last] / 1000,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m runtime.adapter_benchmark",
+        description="Measure Binance websocket adapter throughput against a local replay.",
+    )
+    parser.add_argument("stream", choices=SYNTHETIC_STREAMS)
+    parser.add_argument(
+        "--rates",
+        default=",".join(str(rate) for rate in DEFAULT_RATES),
+        help="comma-separated offered rates in frames/s; 0 replays as fast as possible",
+    )
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_S)
+    parser.add_argument("--frames", help="recorded frames, one JSON payload per line")
+    parser.add_argument("--symbol", default="BTCUSDT")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+    report = run_benchmark(
+        args.stream,
+        rates=[float(rate) for rate in args.rates.split(",") if rate],
+        duration_s=args.duration,
+        frames=load_recorded_frames(args.frames) if args.frames else None,
+        source=args.frames or "synthetic",
+        symbol=args.symbol,
+    )
+    payload = json.dumps(report.to_dict(), sort_keys=True, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        sys.stdout.write(payload + "\n")
+
+
+if __name__ == "__main__":
+    main()
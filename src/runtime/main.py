@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import time
 
-from market_data.runtime import build_market_data_runtime
-from market_data.runtime_config import MarketDataRuntimeConfig
+from market_data.metrics import MetricsReporter
+from market_data.observability import Observability as MarketObservability
+from market_data.process_runtime import MarketDataProcess
+from market_data.queue_sink import QueueRawEventSink
+from market_data.runtime import MarketDataRuntime, build_market_data_runtime
+from market_data.runtime_config import DeploymentMode, MarketDataRuntimeConfig
 from runtime.bus import EventBus
 from runtime.bus_sink import BusRawEventSink
 from runtime.observability import bootstrap_observability
@@ -11,6 +15,7 @@ from runtime.wiring import build_runtime, register_subscriptions
 
 # Configuration will go in config files later
 LOG_DIR = "logs"
+METRICS_REPORT_INTERVAL_MS = 60_000
 
 
 def main() -> None:
@@ -18,30 +23,65 @@ def main() -> None:
     bus = EventBus()
     runtime = build_runtime(bus)
     register_subscriptions(bus, runtime)
-    market_data_runtime = build_market_data_runtime(
-        sink=BusRawEventSink(bus),
-        observability=observability.market_data,
-        config=MarketDataRuntimeConfig.default(),
-    )
+    market_data_config = MarketDataRuntimeConfig.default()
+    # A subprocess hands events over through its shared-memory ring, which
+    # already bounds them; only in-process adapters need the queue sink.
+    sink: QueueRawEventSink | None = None
+    market_data_runtime: MarketDataRuntime | MarketDataProcess
+    if market_data_config.deployment == DeploymentMode.SUBPROCESS:
+        market_data_runtime = MarketDataProcess(
+            sink=BusRawEventSink(bus),
+            config=market_data_config,
+            observability=observability.market_data,
+            observability_factory=_market_data_process_observability,
+            metrics_report_interval_ms=METRICS_REPORT_INTERVAL_MS,
+        )
+    else:
+        sink = QueueRawEventSink(
+            BusRawEventSink(bus),
+            backpressure=market_data_config.backpressure,
+            observability=observability.market_data,
+        )
+        market_data_runtime = build_market_data_runtime(
+            sink=sink,
+            observability=observability.market_data,
+            config=market_data_config,
+        )
     runtime.orchestrator.start()
     runtime.dashboards.start()
     runtime.dashboards.render_once()
     observability.runtime.log_runtime_started()
+    metrics_reporter = MetricsReporter(
+        observability.market_data_metrics,
+        interval_ms=METRICS_REPORT_INTERVAL_MS,
+        on_snapshot=observability.market_data.log_metrics_snapshot,
+    )
+    metrics_reporter.start()
+    if sink is not None:
+        sink.start()
+    market_data_runtime.start()
+    # A market data process only knows its adapters once it has started.
     market_info = market_data_runtime.info
     observability.runtime.log_market_data_adapters_initialized(
-        symbol=market_info.symbol,
+        symbols=market_info.symbols,
         adapter_count=market_info.adapter_count,
         optional_enabled=market_info.optional_enabled,
     )
-    market_data_runtime.start()
     try:
         while True:
             time.sleep(1)
     finally:
         market_data_runtime.stop()
+        if sink is not None:
+            sink.stop()
+        metrics_reporter.stop()
         runtime.orchestrator.stop()
         runtime.dashboards.stop()
 
 
+def _market_data_process_observability() -> MarketObservability:
+    return bootstrap_observability(log_dir=LOG_DIR).market_data
+
+
 if __name__ == "__main__":
     main()
@@ -7,9 +7,7 @@ from dataclasses import dataclass
 from composer.observability import Observability as ComposerObservability
 from composer.observability import StdlibLogger as ComposerStdlibLogger
 from composer.observability import set_observability as set_composer_observability
-from market_data.observability import (
-    NullMetrics as MarketNullMetrics,
-)
+from market_data.metrics import HistogramMetrics
 from market_data.observability import (
     Observability as MarketObservability,
 )
@@ -31,7 +29,7 @@ class RuntimeObservability:
     def log_market_data_adapters_initialized(
         self,
         *,
-        symbol: str,
+        symbols: tuple[str, ...],
         adapter_count: int,
         optional_enabled: bool,
     ) -> None:
@@ -39,7 +37,7 @@ class RuntimeObservability:
             "runtime.market_data_adapters_initialized",
             extra={
                 "fields": {
-                    "symbol": symbol,
+                    "symbols": list(symbols),
                     "adapter_count": adapter_count,
                     "optional_enabled": optional_enabled,
                 }
@@ -51,6 +49,7 @@ class RuntimeObservability:
 class ObservabilityBundle:
     runtime: RuntimeObservability
     market_data: MarketObservability
+    market_data_metrics: HistogramMetrics
 
 
 class _FieldsFilter(logging.Filter):
@@ -72,12 +71,14 @@ def bootstrap_observability(*, log_dir: str) -> ObservabilityBundle:
     )
     set_regime_observability(RegimeObservability(logger=RegimeStdlibLogger(regime_logger)))
 
+    market_data_metrics = HistogramMetrics()
     return ObservabilityBundle(
         runtime=RuntimeObservability(logger=runtime_logger),
         market_data=MarketObservability(
             logger=MarketStdlibLogger(market_logger),
-            metrics=MarketNullMetrics(),
+            metrics=market_data_metrics,
         ),
+        market_data_metrics=market_data_metrics,
     )
 
 
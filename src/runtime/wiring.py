@@ -3,11 +3,17 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 
 from composer.engine_evidence.compute import compute_engine_evidence_snapshot
-from composer.features.compute import compute_feature_snapshot
-from composer.legacy_snapshot import build_legacy_snapshot
+from composer.features.compute import (
+    compute_feature_snapshot,
+    compute_feature_snapshot_from_columns,
+)
+from composer.legacy_snapshot import SNAPSHOT_EVENT_TYPE, build_legacy_snapshot
 from consumers.analysis_engine import AnalysisEngine, AnalysisEngineConfig
 from consumers.analysis_engine.contracts import AnalysisEngineEvent
 from consumers.analysis_engine.observability import NullMetrics as AnalysisNullMetrics
@@ -24,10 +30,12 @@ from consumers.state_gate.contracts import StateGateEvent
 from consumers.state_gate.observability import NullMetrics as GateNullMetrics
 from consumers.state_gate.observability import Observability as GateObservability
 from consumers.state_gate.observability import StdlibLogger as GateStdlibLogger
+from market_data.columnar import ColumnarEventStore
 from market_data.contracts import RawMarketEvent
+from market_data.payload_store import PayloadStore
 from market_data.pipeline import emit_cadence_summary
 from orchestrator.buffer import RawInputBuffer
-from orchestrator.config import SchedulerConfig
+from orchestrator.config import BufferRetentionConfig, BufferSpillConfig, SchedulerConfig
 from orchestrator.contracts import (
     ENGINE_MODE_HYSTERESIS,
     ENGINE_MODE_TRUTH,
@@ -36,7 +44,7 @@ from orchestrator.contracts import (
     EngineRunRecord,
     OrchestratorEvent,
 )
-from orchestrator.cuts import CutSelector
+from orchestrator.cuts import Cut, CutSelector
 from orchestrator.engine_runner import (
     EngineRunner,
     HysteresisMonotonicityError,
@@ -69,6 +77,80 @@ class BusEventSink:
         self._bus.publish(event)
 
 
+_BUFFER_MAX_RECORDS = 50_000
+_DEFAULT_BUFFER_RETENTION = BufferRetentionConfig(max_records=10_000)
+
+
+@dataclass(frozen=True)
+class _PlannedRun:
+    run_id: str
+    cut: Cut
+    cut_kind: CutKind
+    engine_timestamp_ms: int
+    planned_ts_ms: int
+
+    def run_record(self, engine_mode: EngineMode, *, started_ts_ms: int) -> EngineRunRecord:
+        return EngineRunRecord(
+            run_id=self.run_id,
+            symbol=self.cut.symbol,
+            engine_timestamp_ms=self.engine_timestamp_ms,
+            engine_mode=engine_mode,
+            cut_kind=self.cut_kind,
+            cut_start_ingest_seq=self.cut.cut_start_ingest_seq,
+            cut_end_ingest_seq=self.cut.cut_end_ingest_seq,
+            planned_ts_ms=self.planned_ts_ms,
+            started_ts_ms=started_ts_ms,
+            completed_ts_ms=None,
+            status="started",
+            attempts=1,
+        )
+
+    def started_event(self, engine_mode: EngineMode) -> OrchestratorEvent:
+        return build_engine_run_started(
+            run_id=self.run_id,
+            symbol=self.cut.symbol,
+            engine_timestamp_ms=self.engine_timestamp_ms,
+            cut_start_ingest_seq=self.cut.cut_start_ingest_seq,
+            cut_end_ingest_seq=self.cut.cut_end_ingest_seq,
+            cut_kind=self.cut_kind,
+            engine_mode=engine_mode,
+            attempt=1,
+        )
+
+
+@dataclass(frozen=True)
+class _RunOutcome:
+    """Events to publish after a run's EngineRunStarted; `halt` stops the scheduler."""
+
+    started_ts_ms: int
+    events: tuple[OrchestratorEvent, ...]
+    halt: bool = False
+
+
+class _CommitGate:
+    """Admits pooled hysteresis runs to the engine one at a time, in run order.
+
+    Once a run halts, every later run in the tick is refused, so no state is
+    committed past the halt, exactly as in a serial tick.
+    """
+
+    def __init__(self) -> None:
+        self._turn = 0
+        self._halted = False
+        self._cond = threading.Condition()
+
+    def wait_turn(self, turn: int) -> bool:
+        with self._cond:
+            self._cond.wait_for(lambda: self._halted or self._turn == turn)
+            return not self._halted
+
+    def finish(self, turn: int, *, halt: bool) -> None:
+        with self._cond:
+            self._halted = self._halted or halt
+            self._turn = turn + 1
+            self._cond.notify_all()
+
+
 class OrchestratorRuntime:
     def __init__(
         self,
@@ -79,8 +161,24 @@ class OrchestratorRuntime:
         hysteresis_config: HysteresisConfig | None = None,
         observability: OrchestratorObservability | None = None,
         scheduler_config: SchedulerConfig | None = None,
+        payload_store_dir: str | None = None,
+        columnar_features: bool = False,
+        buffer_retention: BufferRetentionConfig | None = _DEFAULT_BUFFER_RETENTION,
+        buffer_spill: BufferSpillConfig | None = None,
+        engine_workers: int = 1,
     ) -> None:
-        self._buffer = RawInputBuffer(max_records=50_000)
+        if engine_workers <= 0:
+            raise ValueError("engine_workers must be > 0")
+        self._payload_store = (
+            PayloadStore(payload_store_dir) if payload_store_dir is not None else None
+        )
+        self._buffer = RawInputBuffer(
+            max_records=_BUFFER_MAX_RECORDS,
+            payload_store=self._payload_store,
+            columnar=ColumnarEventStore() if columnar_features else None,
+            retention=buffer_retention,
+            spill=buffer_spill,
+        )
         self._cut_selector = CutSelector()
         self._engine_mode: EngineMode = engine_mode
         self._symbols: set[str] = set()
@@ -111,6 +209,11 @@ class OrchestratorRuntime:
             or SchedulerConfig(mode="boundary", boundary_interval_ms=180_000, boundary_delay_ms=0)
         )
         self._run_log = EngineRunLog()
+        self._engine_executor = (
+            ThreadPoolExecutor(max_workers=engine_workers, thread_name_prefix="orchestrator-engine")
+            if engine_workers > 1
+            else None
+        )
         self._scheduler_running = False
         self._scheduler_thread: threading.Thread | None = None
 
@@ -127,6 +230,11 @@ class OrchestratorRuntime:
         self._scheduler_running = False
         if self._scheduler_thread is not None:
             self._scheduler_thread.join(timeout=1)
+        if self._engine_executor is not None:
+            self._engine_executor.shutdown(wait=True, cancel_futures=True)
+        self._buffer.close()
+        if self._payload_store is not None:
+            self._payload_store.close()
 
     def handle_raw_event(self, event: RawMarketEvent) -> None:
         self._buffer.append(event)
@@ -150,10 +258,12 @@ class OrchestratorRuntime:
             return
         cut_kind: CutKind = "boundary" if self._scheduler.config.mode == "boundary" else "timer"
         engine_timestamp_ms = _engine_timestamp_ms(self._scheduler.config, planned_ts_ms)
+        runs: list[_PlannedRun] = []
+        halted = False
         for symbol in symbols:
             if self._guard_hysteresis_monotonic(symbol, engine_timestamp_ms):
-                self._scheduler_running = False
-                return
+                halted = True
+                break
             emit_cadence_summary(symbol)
             try:
                 cut = self._cut_selector.next_cut(
@@ -170,32 +280,89 @@ class OrchestratorRuntime:
                 cut_end_ingest_seq=cut.cut_end_ingest_seq,
                 engine_mode=self._engine_mode,
             )
-            run_record = EngineRunRecord(
-                run_id=run_id,
-                symbol=symbol,
-                engine_timestamp_ms=engine_timestamp_ms,
-                engine_mode=self._engine_mode,
-                cut_kind=cut_kind,
-                cut_start_ingest_seq=cut.cut_start_ingest_seq,
-                cut_end_ingest_seq=cut.cut_end_ingest_seq,
-                planned_ts_ms=planned_ts_ms,
-                started_ts_ms=_now_ms(),
-                completed_ts_ms=None,
-                status="started",
-                attempts=1,
+            runs.append(
+                _PlannedRun(
+                    run_id=run_id,
+                    cut=cut,
+                    cut_kind=cut_kind,
+                    engine_timestamp_ms=engine_timestamp_ms,
+                    planned_ts_ms=planned_ts_ms,
+                )
             )
-            self._run_log.append(run_record)
-            started = build_engine_run_started(
-                run_id=run_id,
-                symbol=symbol,
-                engine_timestamp_ms=engine_timestamp_ms,
-                cut_start_ingest_seq=cut.cut_start_ingest_seq,
-                cut_end_ingest_seq=cut.cut_end_ingest_seq,
-                cut_kind=cut_kind,
-                engine_mode=self._engine_mode,
-                attempt=1,
+        runs.sort(key=lambda run: (run.cut.symbol, run.run_id))
+
+        # With a pool, every run starts at once, but events are still
+        # published strictly in run order, so the sequence matches a serial
+        # tick exactly; a slow symbol only holds back publication of the
+        # symbols after it, not their engine runs. Hysteresis runs still build
+        # snapshots concurrently but enter the engine in run order, so a halt
+        # stops later runs before they touch persisted state.
+        executor = self._engine_executor
+        futures: list[Future[_RunOutcome]] = []
+        outcomes: Iterable[Callable[[], _RunOutcome]]
+        if executor is None:
+            outcomes = (partial(self._execute_run, run) for run in runs)
+        else:
+            gate = _CommitGate() if self._engine_mode == ENGINE_MODE_HYSTERESIS else None
+            futures = [
+                executor.submit(self._execute_run, run, gate=gate, turn=turn)
+                for turn, run in enumerate(runs)
+            ]
+            outcomes = [future.result for future in futures]
+        for run, outcome in zip(runs, outcomes, strict=True):
+            result = outcome()
+            self._run_log.append(
+                run.run_record(self._engine_mode, started_ts_ms=result.started_ts_ms)
+            )
+            self._publisher.publish(run.started_event(self._engine_mode))
+            if result.halt:
+                halted = True
+                break
+            for event in result.events:
+                self._publisher.publish(event)
+        if halted:
+            for future in futures:
+                future.cancel()
+            self._scheduler_running = False
+            return
+        self._buffer.release(self._cut_selector.low_watermark(self._buffer))
+
+    def _execute_run(
+        self, run: _PlannedRun, *, gate: _CommitGate | None = None, turn: int = 0
+    ) -> _RunOutcome:
+        started_ts_ms = _now_ms()
+        if gate is None:
+            return self._run_cut(run, started_ts_ms=started_ts_ms, gate=None, turn=turn)
+        outcome: _RunOutcome | None = None
+        try:
+            outcome = self._run_cut(run, started_ts_ms=started_ts_ms, gate=gate, turn=turn)
+            return outcome
+        finally:
+            gate.finish(turn, halt=outcome is None or outcome.halt)
+
+    def _run_cut(
+        self, run: _PlannedRun, *, started_ts_ms: int, gate: _CommitGate | None, turn: int
+    ) -> _RunOutcome:
+        cut = run.cut
+        symbol = cut.symbol
+        engine_timestamp_ms = run.engine_timestamp_ms
+        columnar = self._buffer.columnar
+        if columnar is not None:
+            # Features come from the columns, so only the events the legacy
+            # snapshot reads are materialized.
+            counts_by_event_type = columnar.counts_by_event_type(
+                symbol=symbol, start_seq=cut.cut_start_ingest_seq, end_seq=cut.cut_end_ingest_seq
+            )
+            raw_events = _raw_events_at_seqs(
+                buffer=self._buffer,
+                seqs=columnar.seqs(
+                    SNAPSHOT_EVENT_TYPE,
+                    symbol=symbol,
+                    start_seq=cut.cut_start_ingest_seq,
+                    end_seq=cut.cut_end_ingest_seq,
+                ),
             )
-            self._publisher.publish(started)
+        else:
             raw_events = _raw_events_for_cut(
                 buffer=self._buffer,
                 symbol=symbol,
@@ -203,86 +370,96 @@ class OrchestratorRuntime:
                 cut_end_ingest_seq=cut.cut_end_ingest_seq,
             )
             counts_by_event_type = _counts_by_event_type(raw_events)
-            try:
-                feature_snapshot = compute_feature_snapshot(
-                    raw_events,
+        try:
+            if columnar is not None:
+                feature_snapshot = compute_feature_snapshot_from_columns(
+                    columnar,
                     symbol=symbol,
                     engine_timestamp_ms=engine_timestamp_ms,
+                    start_seq=cut.cut_start_ingest_seq,
+                    end_seq=cut.cut_end_ingest_seq,
                 )
-                evidence_snapshot = compute_engine_evidence_snapshot(feature_snapshot)
-                snapshot = build_legacy_snapshot(
+            else:
+                feature_snapshot = compute_feature_snapshot(
                     raw_events,
                     symbol=symbol,
                     engine_timestamp_ms=engine_timestamp_ms,
-                    feature_snapshot=feature_snapshot,
-                    evidence_snapshot=evidence_snapshot,
                 )
-            except Exception as exc:
-                failed = build_engine_run_failed(
-                    run_id=run_id,
-                    symbol=symbol,
-                    engine_timestamp_ms=engine_timestamp_ms,
-                    cut_start_ingest_seq=cut.cut_start_ingest_seq,
-                    cut_end_ingest_seq=cut.cut_end_ingest_seq,
-                    cut_kind=cut_kind,
-                    engine_mode=self._engine_mode,
-                    error_kind="snapshot_build_failure",
-                    error_detail=str(exc),
-                    attempt=1,
-                    counts_by_event_type=counts_by_event_type,
-                )
-                self._publisher.publish(failed)
-                continue
-            try:
-                result = self._engine_runner.run_engine(snapshot)
-            except (HysteresisPersistenceError, HysteresisMonotonicityError):
-                self._scheduler_running = False
-                return
-            except Exception as exc:
-                failed = build_engine_run_failed(
-                    run_id=run_id,
-                    symbol=symbol,
-                    engine_timestamp_ms=engine_timestamp_ms,
-                    cut_start_ingest_seq=cut.cut_start_ingest_seq,
-                    cut_end_ingest_seq=cut.cut_end_ingest_seq,
-                    cut_kind=cut_kind,
-                    engine_mode=self._engine_mode,
-                    error_kind="engine_failure",
-                    error_detail=str(exc),
-                    attempt=1,
-                    counts_by_event_type=counts_by_event_type,
-                )
-                self._publisher.publish(failed)
-                continue
+            evidence_snapshot = compute_engine_evidence_snapshot(feature_snapshot)
+            snapshot = build_legacy_snapshot(
+                raw_events,
+                symbol=symbol,
+                engine_timestamp_ms=engine_timestamp_ms,
+                feature_snapshot=feature_snapshot,
+                evidence_snapshot=evidence_snapshot,
+            )
+        except Exception as exc:
+            failed = build_engine_run_failed(
+                run_id=run.run_id,
+                symbol=symbol,
+                engine_timestamp_ms=engine_timestamp_ms,
+                cut_start_ingest_seq=cut.cut_start_ingest_seq,
+                cut_end_ingest_seq=cut.cut_end_ingest_seq,
+                cut_kind=run.cut_kind,
+                engine_mode=self._engine_mode,
+                error_kind="snapshot_build_failure",
+                error_detail=str(exc),
+                attempt=1,
+                counts_by_event_type=counts_by_event_type,
+            )
+            return _RunOutcome(started_ts_ms=started_ts_ms, events=(failed,))
+        if gate is not None and not gate.wait_turn(turn):
+            return _RunOutcome(started_ts_ms=started_ts_ms, events=(), halt=True)
+        try:
+            result = self._engine_runner.run_engine(snapshot)
+        except (HysteresisPersistenceError, HysteresisMonotonicityError):
+            return _RunOutcome(started_ts_ms=started_ts_ms, events=(), halt=True)
+        except Exception as exc:
+            failed = build_engine_run_failed(
+                run_id=run.run_id,
+                symbol=symbol,
+                engine_timestamp_ms=engine_timestamp_ms,
+                cut_start_ingest_seq=cut.cut_start_ingest_seq,
+                cut_end_ingest_seq=cut.cut_end_ingest_seq,
+                cut_kind=run.cut_kind,
+                engine_mode=self._engine_mode,
+                error_kind="engine_failure",
+                error_detail=str(exc),
+                attempt=1,
+                counts_by_event_type=counts_by_event_type,
+            )
+            return _RunOutcome(started_ts_ms=started_ts_ms, events=(failed,))
 
-            if result.hysteresis_state is not None:
-                decision_event = build_hysteresis_state_published(
-                    run_id=run_id,
+        events: list[OrchestratorEvent] = []
+        if result.hysteresis_state is not None:
+            events.append(
+                build_hysteresis_state_published(
+                    run_id=run.run_id,
                     symbol=symbol,
                     engine_timestamp_ms=engine_timestamp_ms,
                     cut_start_ingest_seq=cut.cut_start_ingest_seq,
                     cut_end_ingest_seq=cut.cut_end_ingest_seq,
-                    cut_kind=cut_kind,
+                    cut_kind=run.cut_kind,
                     hysteresis_state=result.hysteresis_state,
                     attempt=1,
                     counts_by_event_type=counts_by_event_type,
                 )
-                self._publisher.publish(decision_event)
-            regime_output = result.regime_output
-
-            completed = build_engine_run_completed(
-                run_id=run_id,
+            )
+        events.append(
+            build_engine_run_completed(
+                run_id=run.run_id,
                 symbol=symbol,
                 engine_timestamp_ms=engine_timestamp_ms,
                 cut_start_ingest_seq=cut.cut_start_ingest_seq,
                 cut_end_ingest_seq=cut.cut_end_ingest_seq,
-                cut_kind=cut_kind,
+                cut_kind=run.cut_kind,
                 engine_mode=self._engine_mode,
-                regime_output=regime_output,
+                regime_output=result.regime_output,
                 attempt=1,
                 counts_by_event_type=counts_by_event_type,
             )
-            self._publisher.publish(completed)
+        )
+        return _RunOutcome(started_ts_ms=started_ts_ms, events=tuple(events))
 
     def _guard_hysteresis_monotonic(self, symbol: str, engine_timestamp_ms: int) -> bool:
         if self._engine_mode != ENGINE_MODE_HYSTERESIS:
@@ -428,7 +605,17 @@ def _raw_events_for_cut(
         start_seq=cut_start_ingest_seq,
         end_seq=cut_end_ingest_seq,
     )
-    return tuple(record.event for record in records)
+    return tuple(record.compact_event for record in records)
+
+
+def _raw_events_at_seqs(
+    *, buffer: RawInputBuffer, seqs: Iterable[int]
+) -> tuple[RawMarketEvent, ...]:
+    events = []
+    for seq in seqs:
+        for record in buffer.range_by_seq(start_seq=seq, end_seq=seq):
+            events.append(record.compact_event)
+    return tuple(events)
 
 
 def _counts_by_event_type(raw_events: tuple[RawMarketEvent, ...]) -> dict[str, int]:
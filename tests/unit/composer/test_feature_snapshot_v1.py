@@ -1,7 +1,12 @@
 import math
+import random
 import unittest
 
-from composer.features.compute import compute_feature_snapshot
+from composer.features.compute import (
+    compute_feature_snapshot,
+    compute_feature_snapshot_from_columns,
+)
+from market_data.columnar import ColumnarEventStore
 from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
 
 
@@ -160,5 +165,60 @@ class TestFeatureSnapshotV1(unittest.TestCase):
         self.assertEqual(snapshot.features["open_interest_latest"], 3.0)
 
 
+class TestFeatureSnapshotFromColumns(unittest.TestCase):
+    def test_matches_event_based_features(self) -> None:
+        rng = random.Random(7)
+        engine_timestamp_ms = 60 * 180_000
+        events: list[RawMarketEvent] = []
+        for index in range(60):
+            close_ts = (index + 1) * 180_000 - 1
+            events.append(
+                _candle(
+                    high=100.0 + rng.uniform(0, 5),
+                    low=95.0 - rng.uniform(0, 5),
+                    close=97.0 + rng.uniform(-2, 2),
+                    exchange_ts_ms=close_ts,
+                    is_final=index % 17 != 0,
+                    interval_ms=60_000 if index % 23 == 0 else 180_000,
+                )
+            )
+            for _ in range(20):
+                ts = close_ts - rng.randint(0, 179_999)
+                side = rng.choice(("buy", "sell", None))
+                events.append(
+                    _trade(
+                        price=rng.uniform(90, 110),
+                        quantity=rng.choice((rng.uniform(0, 3), 0.0, float("nan"))),
+                        side=side,
+                        exchange_ts_ms=ts,
+                        symbol=rng.choice(("TEST", "TEST", "OTHER")),
+                    )
+                )
+            events.append(_open_interest(value=float(index), exchange_ts_ms=close_ts))
+        store = ColumnarEventStore()
+        for seq, event in enumerate(events, start=1):
+            store.append(seq, event)
+
+        for start_seq in (1, 400, 900):
+            expected = compute_feature_snapshot(
+                events[start_seq - 1 :], symbol="TEST", engine_timestamp_ms=engine_timestamp_ms
+            )
+            actual = compute_feature_snapshot_from_columns(
+                store,
+                symbol="TEST",
+                engine_timestamp_ms=engine_timestamp_ms,
+                start_seq=start_seq,
+                end_seq=len(events),
+            )
+            self.assertEqual(dict(actual.features), dict(expected.features))
+            self.assertEqual(list(actual.features), list(expected.features))
+
+    def test_empty_range_has_no_features(self) -> None:
+        snapshot = compute_feature_snapshot_from_columns(
+            ColumnarEventStore(), symbol="TEST", engine_timestamp_ms=0, start_seq=1, end_seq=1
+        )
+        self.assertTrue(all(value is None for value in snapshot.features.values()))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,17 @@
+import asyncio
+import json
 import unittest
 
+import websockets
+
 from market_data.adapters.binance.adapter import (
     BinanceAggTradeAdapter,
+    BinanceCombinedStreamAdapter,
     BinanceMarkPriceAdapter,
 )
 from market_data.adapters.binance.config import (
     BinanceAggTradeConfig,
+    BinanceCombinedStreamConfig,
     BinanceMarkPriceConfig,
 )
 from market_data.config import BackpressureConfig
@@ -87,5 +93,122 @@ class TestBinanceAdapters(unittest.TestCase):
         self.assertEqual(event.event_type, "DecodeFailure")
 
 
+class TestBinanceCombinedStreamAdapter(unittest.TestCase):
+    def _pipeline(self, sink: RecordingSink) -> IngestionPipeline:
+        return IngestionPipeline(
+            sink=sink,
+            backpressure=BackpressureConfig(policy="block", max_pending=1, max_block_ms=50),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            clock_ms=lambda: 100,
+        )
+
+    def _adapter(
+        self, pipeline: IngestionPipeline, *, ws_url: str = "wss://example.invalid/stream"
+    ) -> BinanceCombinedStreamAdapter:
+        config = BinanceCombinedStreamConfig.default()
+        channels = [
+            BinanceAggTradeAdapter(
+                config=BinanceAggTradeConfig.default(symbol="BTCUSDT"), pipeline=pipeline
+            ),
+            BinanceMarkPriceAdapter(
+                config=BinanceMarkPriceConfig.default(symbol="ETHUSDT"), pipeline=pipeline
+            ),
+        ]
+        return BinanceCombinedStreamAdapter(
+            config=BinanceCombinedStreamConfig(
+                source_id=config.source_id,
+                channel=config.channel,
+                ws_url=ws_url,
+                retry=config.retry,
+                connect_timeout_ms=config.connect_timeout_ms,
+                read_timeout_ms=config.read_timeout_ms,
+            ),
+            channels=channels,
+            pipeline=pipeline,
+        )
+
+    def test_routes_frames_by_stream(self) -> None:
+        sink = RecordingSink()
+        adapter = self._adapter(self._pipeline(sink))
+        trade = (
+            '{"stream":"btcusdt@aggTrade","data":{"e":"aggTrade","E":1,"a":1,'
+            '"s":"BTCUSDT","p":"100.0","q":"0.5","T":2,"m":false}}'
+        )
+        mark = (
+            '{"stream":"ethusdt@markPrice@1s","data":{"e":"markPriceUpdate","E":3,'
+            '"s":"ETHUSDT","p":"1.1","i":"1.2","r":"0.01"}}'
+        )
+        adapter._handle_message(trade)
+        adapter._handle_message(mark)
+
+        self.assertEqual(len(sink.events), 4)
+        self.assertEqual(sink.events[0].event_type, "TradeTick")
+        self.assertEqual(sink.events[0].symbol, "BTCUSDT")
+        self.assertEqual(sink.events[0].channel, "trades")
+        self.assertEqual(sink.events[0].raw_payload, trade)
+        for event in sink.events[1:]:
+            self.assertEqual(event.symbol, "ETHUSDT")
+            self.assertEqual(event.channel, "mark_price")
+            self.assertEqual(event.raw_payload, mark)
+        self.assertEqual(
+            [key.channel for key in adapter.channels], ["trades", "mark_price"]
+        )
+
+    def test_unknown_stream_emits_decode_failure(self) -> None:
+        sink = RecordingSink()
+        adapter = self._adapter(self._pipeline(sink))
+        adapter._handle_message('{"stream":"solusdt@aggTrade","data":{}}')
+        adapter._handle_message('{"e":"aggTrade"}')
+
+        self.assertEqual([event.event_type for event in sink.events], ["DecodeFailure"] * 2)
+        self.assertEqual(
+            sink.events[0].normalized["error_detail"], "unknown stream: solusdt@aggTrade"
+        )
+        self.assertEqual(sink.events[0].channel, "combined")
+
+    def test_consumes_local_combined_stream_server(self) -> None:
+        frames = [
+            json.dumps(
+                {
+                    "stream": "btcusdt@aggTrade",
+                    "data": {"E": 1, "a": index, "p": "100.0", "q": "1", "T": index, "m": True},
+                },
+                separators=(",", ":"),
+            )
+            for index in range(3)
+        ]
+        paths: list[str] = []
+        sink = RecordingSink()
+
+        async def handler(connection) -> None:
+            paths.append(connection.request.path)
+            for frame in frames:
+                await connection.send(frame)
+            await connection.wait_closed()
+
+        async def scenario() -> None:
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                adapter = self._adapter(
+                    self._pipeline(sink), ws_url=f"ws://127.0.0.1:{port}/stream"
+                )
+                adapter.start()
+                task = asyncio.create_task(adapter.run_async())
+                for _ in range(200):
+                    if len(sink.events) >= len(frames):
+                        break
+                    await asyncio.sleep(0.01)
+                adapter.stop()
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(scenario())
+
+        self.assertEqual(paths, ["/stream?streams=btcusdt@aggTrade/ethusdt@markPrice@1s"])
+        self.assertEqual([event.source_event_id for event in sink.events], ["0", "1", "2"])
+        self.assertEqual([event.raw_payload for event in sink.events], frames)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+
+from market_data.adapters.binance.compiled import (
+    FieldSpec,
+    StreamSpec,
+    compile_stream,
+    decode_agg_trade_fast,
+    decode_book_ticker_fast,
+    decode_depth_fast,
+    decode_force_order_fast,
+    decode_kline_fast,
+    decode_mark_price_fast,
+    decode_open_interest_fast,
+)
+from market_data.adapters.binance.decoder import (
+    DecodedEvents,
+    DecodeError,
+    decode_agg_trade,
+    decode_book_ticker,
+    decode_depth,
+    decode_force_order,
+    decode_kline,
+    decode_mark_price,
+    decode_open_interest,
+)
+
+_KLINE = {"T": 3, "i": "3m", "o": "1.0", "h": "2.0", "l": "0.5", "c": "1.5", "v": "10", "x": True}
+
+CASES = {
+    "agg_trade": (
+        decode_agg_trade,
+        decode_agg_trade_fast,
+        [
+            {"T": 1, "p": "100.5", "q": "0.25", "m": False, "a": 123},
+            {"T": 1.0, "p": 100, "q": 0.25, "m": "true", "a": "x"},
+            {"T": "7", "p": "1", "q": "2", "m": None, "a": None},
+            {"T": 1, "p": "abc", "q": "0.25", "m": True},
+            {"T": True, "p": "1", "q": "1"},
+            {"p": "1", "q": "1"},
+            {"T": 1, "p": "1"},
+            {"T": 1, "p": False, "q": "1"},
+        ],
+    ),
+    "kline": (
+        decode_kline,
+        decode_kline_fast,
+        [
+            {"E": 2, "k": dict(_KLINE)},
+            {"E": 2, "k": {**_KLINE, "T": None, "x": "false"}},
+            {"k": {**_KLINE, "T": None}},
+            {"E": 2, "k": {**_KLINE, "i": "1m"}},
+            {"E": 2, "k": {**_KLINE, "i": 3}},
+            {"E": 2, "k": {**_KLINE, "x": "maybe"}},
+            {"E": 2, "k": {**_KLINE, "o": "bad"}},
+            {"E": 2, "k": "not-a-mapping"},
+            {"E": 2},
+        ],
+    ),
+    "book_ticker": (
+        decode_book_ticker,
+        decode_book_ticker_fast,
+        [
+            {"b": "1", "B": "2", "a": "3", "A": "4", "E": 5},
+            {"b": "1", "B": "2", "a": "3", "A": "4"},
+            {"b": "1", "B": "2", "a": "3"},
+            {"b": "1", "B": "2", "a": "3", "A": "4", "E": "x"},
+        ],
+    ),
+    "depth": (
+        decode_depth,
+        decode_depth_fast,
+        [
+            {"b": [["1", "2"]], "a": [["3", "4"]], "E": 5, "u": 9},
+            {"b": [], "a": [["3", "4", "extra"]]},
+            {"b": [["1"]], "a": []},
+            {"b": "bad", "a": []},
+            {"b": [], "a": [], "u": "seq"},
+            {"b": [], "a": [], "U": 7, "u": 9, "pu": 6},
+            {"b": [], "a": [], "U": "x", "u": 9},
+        ],
+    ),
+    "mark_price": (
+        decode_mark_price,
+        decode_mark_price_fast,
+        [
+            {"E": 3, "p": "1.1", "i": "1.2", "r": "0.01"},
+            {"E": 3, "p": "1.1", "r": "bad"},
+            {"p": "1.1", "i": 1, "r": 0.0},
+            {"E": "bad", "p": "1.1", "i": "1.2", "r": "0.01"},
+            {},
+        ],
+    ),
+    "force_order": (
+        decode_force_order,
+        decode_force_order_fast,
+        [
+            {"o": {"T": 1, "p": "1", "q": "2", "S": "BUY"}},
+            {"o": {"p": "1", "q": "2", "S": "hold"}},
+            {"o": {"T": 1, "p": "1"}},
+            {"o": None},
+        ],
+    ),
+    "open_interest": (
+        decode_open_interest,
+        decode_open_interest_fast,
+        [
+            {"openInterest": "10.5", "time": 1},
+            {"openInterest": "10.5"},
+            {"openInterest": None},
+            {"openInterest": "1", "time": []},
+        ],
+    ),
+}
+
+
+def _legacy(decode, payload):
+    try:
+        result = decode(payload)
+    except DecodeError as exc:
+        return ("error", exc.error_kind, exc.error_detail)
+    if not isinstance(result, DecodedEvents):
+        result = DecodedEvents(events=(result,), errors=())
+    events = [
+        (e.event_type, e.exchange_ts_ms, dict(e.normalized), e.source_event_id, e.source_seq)
+        for e in result.events
+    ]
+    errors = [(e.error_kind, e.error_detail) for e in result.errors]
+    return ("ok", events, errors)
+
+
+def _compiled(decode, payload):
+    try:
+        events, errors = decode(payload)
+    except DecodeError as exc:
+        return ("error", exc.error_kind, exc.error_detail)
+    return (
+        "ok",
+        [tuple(event) for event in events],
+        [(e.error_kind, e.error_detail) for e in errors],
+    )
+
+
+class TestCompiledBinanceDecoders(unittest.TestCase):
+    def test_compiled_decoders_match_reference_decoders(self) -> None:
+        for name, (legacy, compiled, payloads) in CASES.items():
+            for payload in payloads:
+                with self.subTest(stream=name, payload=payload):
+                    self.assertEqual(_compiled(compiled, payload), _legacy(legacy, payload))
+
+    def test_spec_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            compile_stream(
+                StreamSpec(name="bad", event_type="TradeTick", fields=(FieldSpec("p", "hex", "x"),))
+            )
+        with self.assertRaises(ValueError):
+            compile_stream(
+                StreamSpec(
+                    name="bad",
+                    event_type="TradeTick",
+                    fields=(FieldSpec("p", "float", "price", event_type="MarkPrice"),),
+                )
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,11 +57,13 @@ class TestBinanceDecoder(unittest.TestCase):
         self.assertEqual(event.normalized["best_bid_price"], 1.0)
 
     def test_decode_depth(self) -> None:
-        payload = {"b": [["1.0", "2.0"]], "a": [["3.0", "4.0"]], "u": 9}
+        payload = {"b": [["1.0", "2.0"]], "a": [["3.0", "4.0"]], "U": 7, "u": 9, "pu": 6}
         event = decode_depth(payload)
         self.assertEqual(event.event_type, "BookDelta")
         self.assertEqual(event.source_seq, 9)
         self.assertEqual(event.normalized["bids"], [[1.0, 2.0]])
+        self.assertEqual(event.normalized["first_seq"], 7)
+        self.assertEqual(event.normalized["prev_seq"], 6)
 
     def test_decode_mark_price(self) -> None:
         payload = {"p": "1.1", "i": "1.2", "r": "0.01", "E": 5}
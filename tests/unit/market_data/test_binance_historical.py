@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from market_data.adapters.binance.decoder import (
+    decode_agg_trade,
+    decode_kline,
+    decode_open_interest,
+)
+from market_data.adapters.binance.historical import (
+    BinanceDumpKind,
+    BinanceDumpLoader,
+    SimulatedClock,
+    parse_dump_name,
+)
+from market_data.config import BackpressureConfig
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.pipeline import IngestionPipeline
+
+AGG_TRADES_CSV = (
+    "agg_trade_id,price,quantity,first_trade_id,last_trade_id,transact_time,is_buyer_maker\n"
+    "100,42000.5,0.010,1,1,1704067200000,true\n"
+    "101,42001.0,0.250,2,3,1704067200005,false\r\n"
+    "102,not-a-price,0.1,4,4,1704067200007,true\n"
+    "103,42002.0,1.5,5,5,1704067200009,false"
+)
+KLINES_CSV = (
+    "1704067200000,42000,42100,41900,42050,12.5,1704067379999,0,10,0,0,0\n"
+    "1704067380000,42050,42060,42000,42010,3.25,1704067559999,0,4,0,0,0\n"
+)
+METRICS_CSV = (
+    "create_time,symbol,sum_open_interest,sum_open_interest_value\n"
+    "2024-01-01 00:05:00,BTCUSDT,75000.5,3150000000\n"
+)
+
+
+class RecordingBatchSink:
+    def __init__(self) -> None:
+        self.events = []
+        self.batches = 0
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.events.append(event)
+
+    def write_batch(self, events, *, block: bool, timeout_ms: int | None) -> None:
+        self.batches += 1
+        self.events.extend(events)
+
+
+class TestBinanceDumpLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sink = RecordingBatchSink()
+        self.clock = SimulatedClock()
+        self.pipeline = IngestionPipeline(
+            sink=self.sink,
+            backpressure=BackpressureConfig(policy="block", max_pending=10, max_block_ms=50),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            clock_ms=self.clock,
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _zip(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmp.name, f"{name}.zip")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(f"{name}.csv", content)
+        return path
+
+    def _loader(self, **kwargs) -> BinanceDumpLoader:
+        return BinanceDumpLoader(pipeline=self.pipeline, clock=self.clock, **kwargs)
+
+    def test_agg_trades_match_live_decoder_shapes(self) -> None:
+        path = self._zip("BTCUSDT-aggTrades-2024-01-01", AGG_TRADES_CSV)
+
+        result = self._loader(batch_size=2, chunk_bytes=16, recv_lag_ms=3).load_file(path)
+
+        self.assertEqual((result.rows, result.events, result.decode_failures), (4, 3, 1))
+        self.assertEqual(self.sink.batches, 2)
+        trades = [event for event in self.sink.events if event.event_type == "TradeTick"]
+        live = decode_agg_trade(
+            {"a": 101, "p": "42001.0", "q": "0.250", "T": 1704067200005, "m": False}
+        )
+        self.assertEqual(trades[1].normalized, live.normalized)
+        self.assertEqual(trades[1].exchange_ts_ms, live.exchange_ts_ms)
+        self.assertEqual(trades[1].source_event_id, live.source_event_id)
+        self.assertEqual(trades[1].recv_ts_ms, 1704067200008)
+        self.assertEqual(trades[1].raw_payload, b"101,42001.0,0.250,2,3,1704067200005,false")
+        self.assertEqual(trades[1].channel, "trades")
+        self.assertEqual([event.source_event_id for event in trades], ["100", "101", "103"])
+        failure = self.sink.events[2]
+        self.assertEqual(failure.event_type, "DecodeFailure")
+        self.assertEqual(failure.normalized["error_kind"], "schema_mismatch")
+        self.assertEqual(self.clock(), 1704067200012)
+
+    def test_klines_and_metrics(self) -> None:
+        klines = os.path.join(self.tmp.name, "BTCUSDT-3m-2024-01-01.csv")
+        with open(klines, "w") as handle:
+            handle.write(KLINES_CSV)
+        metrics = self._zip("BTCUSDT-metrics-2024-01-01", METRICS_CSV)
+
+        result = self._loader().load_files([klines, metrics])
+
+        self.assertEqual((result.rows, result.events, result.decode_failures), (3, 3, 0))
+        candle, _, open_interest = self.sink.events
+        live_candle = decode_kline(
+            {
+                "E": 1,
+                "k": {
+                    "i": "3m", "T": 1704067379999, "o": "42000", "h": "42100",
+                    "l": "41900", "c": "42050", "v": "12.5", "x": True,
+                },
+            }
+        )
+        self.assertEqual(candle.normalized, live_candle.normalized)
+        self.assertEqual(candle.exchange_ts_ms, live_candle.exchange_ts_ms)
+        live_oi = decode_open_interest({"openInterest": "75000.5", "time": 1704067500000})
+        self.assertEqual(open_interest.normalized, live_oi.normalized)
+        self.assertEqual(open_interest.exchange_ts_ms, live_oi.exchange_ts_ms)
+        self.assertEqual(open_interest.channel, "open_interest")
+
+    def test_parse_dump_name(self) -> None:
+        self.assertEqual(
+            parse_dump_name("/data/ETHUSDT-aggTrades-2024-01.zip"),
+            ("ETHUSDT", BinanceDumpKind.AGG_TRADES),
+        )
+        self.assertEqual(
+            parse_dump_name("BTCUSDT-3m-2024-01-01.zip"), ("BTCUSDT", BinanceDumpKind.KLINES)
+        )
+        with self.assertRaises(ValueError):
+            parse_dump_name("BTCUSDT-1m-2024-01-01.zip")
+        with self.assertRaises(ValueError):
+            parse_dump_name("trades.csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import math
+import unittest
+
+from market_data.columnar import MISSING_TS, SIDE_BUY, SIDE_SELL, ColumnarEventStore
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+
+
+def _event(event_type: str, normalized, *, exchange_ts_ms, symbol: str = "BTCUSDT"):
+    return RawMarketEvent(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type=event_type,
+        source_id="binance",
+        symbol=symbol,
+        exchange_ts_ms=exchange_ts_ms,
+        recv_ts_ms=(exchange_ts_ms or 0) + 1,
+        raw_payload=b"{}",
+        normalized=normalized,
+    )
+
+
+def _trade(price, quantity, side, *, exchange_ts_ms, symbol: str = "BTCUSDT"):
+    return _event(
+        "TradeTick",
+        {"price": price, "quantity": quantity, "side": side},
+        exchange_ts_ms=exchange_ts_ms,
+        symbol=symbol,
+    )
+
+
+class TestColumnarEventStore(unittest.TestCase):
+    def test_trades_are_stored_as_typed_columns(self) -> None:
+        store = ColumnarEventStore()
+        store.append(1, _trade(100.0, 1.5, "buy", exchange_ts_ms=10))
+        store.append(2, _trade(101.0, 2.0, "sell", exchange_ts_ms=None))
+        store.append(3, _trade(float("inf"), None, "other", exchange_ts_ms=30))
+
+        trades = store.range_by_seq("TradeTick", symbol="BTCUSDT", start_seq=1, end_seq=3)
+
+        self.assertEqual(len(trades), 3)
+        self.assertEqual(trades["seq"].tolist(), [1, 2, 3])
+        self.assertEqual(trades["ts"].tolist(), [10, MISSING_TS, 30])
+        self.assertEqual(trades["recv_ts"].tolist(), [11, 1, 31])
+        self.assertEqual(trades["side"].tolist(), [SIDE_BUY, SIDE_SELL, 0])
+        self.assertEqual(trades["price"][:2].tolist(), [100.0, 101.0])
+        self.assertTrue(math.isnan(trades["price"][2]))
+        self.assertTrue(math.isnan(trades["quantity"][2]))
+
+    def test_range_by_seq_is_per_symbol_and_inclusive(self) -> None:
+        store = ColumnarEventStore()
+        for seq in range(1, 11):
+            symbol = "BTCUSDT" if seq % 2 else "ETHUSDT"
+            store.append(seq, _trade(float(seq), 1.0, "buy", exchange_ts_ms=seq, symbol=symbol))
+        store.append(11, _event("BookTop", {}, exchange_ts_ms=11))
+
+        trades = store.range_by_seq("TradeTick", symbol="BTCUSDT", start_seq=3, end_seq=7)
+        empty = store.range_by_seq("TradeTick", symbol="SOLUSDT", start_seq=1, end_seq=10)
+
+        self.assertEqual(trades["seq"].tolist(), [3, 5, 7])
+        self.assertEqual(len(empty), 0)
+        with self.assertRaises(ValueError):
+            store.range_by_seq("BookTop", symbol="BTCUSDT", start_seq=1, end_seq=11)
+        with self.assertRaises(ValueError):
+            store.range_by_seq("TradeTick", symbol="BTCUSDT", start_seq=5, end_seq=1)
+
+    def test_counts_and_seqs_cover_every_event_type(self) -> None:
+        store = ColumnarEventStore()
+        store.append(1, _event("BookTop", {}, exchange_ts_ms=1))
+        store.append(2, _trade(1.0, 1.0, "buy", exchange_ts_ms=2))
+        store.append(3, _event("BookTop", {}, exchange_ts_ms=3))
+        store.append(4, _trade(2.0, 1.0, "sell", exchange_ts_ms=4, symbol="ETHUSDT"))
+
+        counts = store.counts_by_event_type(symbol="BTCUSDT", start_seq=1, end_seq=4)
+        self.assertEqual(list(counts.items()), [("BookTop", 2), ("TradeTick", 1)])
+        self.assertEqual(
+            store.seqs("BookTop", symbol="BTCUSDT", start_seq=2, end_seq=4).tolist(), [3]
+        )
+        self.assertEqual(
+            store.seqs("TradeTick", symbol="BTCUSDT", start_seq=1, end_seq=4).tolist(), [2]
+        )
+        store.evict_through(3)
+        self.assertEqual(store.counts_by_event_type(symbol="BTCUSDT", start_seq=1, end_seq=4), {})
+
+    def test_range_by_time_handles_out_of_order_timestamps(self) -> None:
+        store = ColumnarEventStore()
+        for seq, ts in enumerate((100, 200, 300, 400), start=1):
+            store.append(seq, _trade(1.0, 1.0, "buy", exchange_ts_ms=ts))
+        sorted_slice = store.range_by_time("TradeTick", symbol="BTCUSDT", start_ms=200, end_ms=300)
+        store.append(5, _trade(1.0, 1.0, "buy", exchange_ts_ms=250))
+        unsorted_slice = store.range_by_time(
+            "TradeTick", symbol="BTCUSDT", start_ms=200, end_ms=300
+        )
+
+        self.assertEqual(sorted_slice["seq"].tolist(), [2, 3])
+        self.assertEqual(unsorted_slice["seq"].tolist(), [2, 3, 5])
+        self.assertEqual(unsorted_slice["ts"].tolist(), [200, 300, 250])
+
+    def test_slices_survive_later_appends(self) -> None:
+        store = ColumnarEventStore()
+        store.append(1, _trade(1.0, 1.0, "buy", exchange_ts_ms=1))
+        trades = store.range_by_seq("TradeTick", symbol="BTCUSDT", start_seq=1, end_seq=10)
+        store.append(2, _trade(2.0, 1.0, "buy", exchange_ts_ms=2))
+
+        self.assertEqual(trades["price"].tolist(), [1.0])
+
+    def test_evict_through_drops_leading_rows(self) -> None:
+        store = ColumnarEventStore()
+        for seq in range(1, 7):
+            symbol = "BTCUSDT" if seq % 2 else "ETHUSDT"
+            store.append(seq, _trade(float(seq), 1.0, "buy", exchange_ts_ms=seq, symbol=symbol))
+
+        store.evict_through(4)
+
+        btc = store.range_by_seq("TradeTick", symbol="BTCUSDT", start_seq=1, end_seq=6)
+        self.assertEqual(btc["seq"].tolist(), [5])
+        self.assertEqual(btc["price"].tolist(), [5.0])
+        store.evict_through(6)
+        self.assertEqual(
+            len(store.range_by_seq("TradeTick", symbol="ETHUSDT", start_seq=1, end_seq=6)), 0
+        )
+
+    def test_seq_must_increase(self) -> None:
+        store = ColumnarEventStore()
+        store.append(2, _trade(1.0, 1.0, "buy", exchange_ts_ms=1))
+        with self.assertRaises(ValueError):
+            store.append(2, _trade(1.0, 1.0, "buy", exchange_ts_ms=1))
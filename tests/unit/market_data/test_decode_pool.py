@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+import unittest
+from dataclasses import replace
+
+from market_data.adapters.binance.adapter import BinanceAggTradeAdapter
+from market_data.adapters.binance.config import BinanceAggTradeConfig
+from market_data.config import BackpressureConfig
+from market_data.decode_pool import DecodeWorkerPool
+from market_data.observability import NullLogger, Observability
+from market_data.pipeline import IngestionPipeline
+from market_data.runtime import build_market_data_runtime
+from market_data.runtime_config import MarketDataRuntimeConfig
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+        self._lock = threading.Lock()
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        with self._lock:
+            self.events.append(event)
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.observed = []
+        self.gauges = []
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1, tags=None) -> None:
+        return None
+
+    def observe(self, name, value, tags=None) -> None:
+        with self._lock:
+            self.observed.append((name, value, dict(tags or {})))
+
+    def gauge(self, name, value, tags=None) -> None:
+        with self._lock:
+            self.gauges.append((name, value, dict(tags or {})))
+
+
+def _wait_for(predicate, timeout_s: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestDecodeWorkerPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.metrics = RecordingMetrics()
+        self.observability = Observability(logger=NullLogger(), metrics=self.metrics)
+
+    def test_preserves_order_per_stream(self) -> None:
+        pool = DecodeWorkerPool(workers=2, queue_size=4, observability=self.observability)
+        handled: dict[int, list[int]] = {0: [], 1: [], 2: []}
+        streams = {stream: pool.register() for stream in handled}
+        pool.start()
+
+        def handler_for(stream: int):
+            def handle(frame, recv_ts_ms: int) -> None:
+                handled[stream].append(recv_ts_ms)
+
+            return handle
+
+        async def scenario() -> None:
+            for index in range(50):
+                for stream, worker in streams.items():
+                    await pool.submit(
+                        worker,
+                        handler=handler_for(stream),
+                        on_error=lambda exc: None,
+                        recv_ts_ms=index,
+                        frame="{}",
+                        timeout_ms=1_000,
+                    )
+
+        asyncio.run(scenario())
+        pool.stop()
+
+        self.assertEqual(streams, {0: 0, 1: 1, 2: 0})
+        for values in handled.values():
+            self.assertEqual(values, list(range(50)))
+        lags = [
+            entry for entry in self.metrics.observed
+            if entry[0] == "market_data.decode_queue.lag_ms"
+        ]
+        self.assertEqual(len(lags), 150)
+        self.assertEqual({entry[2]["worker"] for entry in lags}, {"0", "1"})
+
+    def test_worker_errors_reach_on_error(self) -> None:
+        pool = DecodeWorkerPool(workers=1, queue_size=4, observability=self.observability)
+        errors = []
+        pool.start()
+
+        def fail(frame, recv_ts_ms: int) -> None:
+            raise RuntimeError("boom")
+
+        asyncio.run(
+            pool.submit(
+                0, handler=fail, on_error=errors.append, recv_ts_ms=1, frame="{}", timeout_ms=100
+            )
+        )
+        _wait_for(lambda: bool(errors))
+        pool.stop()
+
+        self.assertEqual([str(exc) for exc in errors], ["boom"])
+
+    def test_adapter_keeps_receive_timestamp(self) -> None:
+        sink = RecordingSink()
+        pipeline = IngestionPipeline(
+            sink=sink,
+            backpressure=BackpressureConfig(policy="block", max_pending=1, max_block_ms=50),
+            observability=self.observability,
+            clock_ms=lambda: 999,
+        )
+        adapter = BinanceAggTradeAdapter(
+            config=BinanceAggTradeConfig.default(symbol="BTCUSDT"),
+            pipeline=pipeline,
+        )
+        pool = DecodeWorkerPool(workers=1, queue_size=4, observability=self.observability)
+        adapter.attach_decode_pool(pool)
+        pool.start()
+        message = '{"e":"aggTrade","E":1,"a":1,"p":"100.0","q":"0.5","T":2,"m":true}'
+
+        asyncio.run(
+            pool.submit(
+                0,
+                handler=adapter._handle_message,
+                on_error=adapter._record_worker_error,
+                recv_ts_ms=42,
+                frame=message,
+                timeout_ms=100,
+            )
+        )
+        _wait_for(lambda: bool(sink.events))
+        pool.stop()
+
+        self.assertEqual([event.recv_ts_ms for event in sink.events], [42])
+        self.assertEqual(sink.events[0].raw_payload, message)
+
+    def test_runtime_attaches_pool_when_configured(self) -> None:
+        config = replace(MarketDataRuntimeConfig.default(), decode_workers=2)
+        runtime = build_market_data_runtime(
+            sink=RecordingSink(), observability=self.observability, config=config
+        )
+
+        pool = runtime._decode_pool
+        self.assertIsNotNone(pool)
+        self.assertEqual(pool.workers, 2)
+        attached = [
+            adapter for adapter in runtime._adapters
+            if getattr(adapter, "_decode_pool", None) is pool
+        ]
+        self.assertTrue(attached)
+
+
+if __name__ == "__main__":
+    unittest.main()
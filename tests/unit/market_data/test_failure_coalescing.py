@@ -0,0 +1,195 @@
+import threading
+import unittest
+
+from market_data.config import BackpressureConfig, DecodeFailureCoalescingConfig
+from market_data.failure_coalescing import DecodeFailureCoalescer
+from market_data.observability import NullLogger, Observability
+from market_data.pipeline import IngestionPipeline, IngestItem
+from market_data.runtime import FailureSummaryFlusher
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.events.append(event)
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.increments = []
+
+    def increment(self, name, value=1, tags=None) -> None:
+        self.increments.append((name, value, dict(tags or {})))
+
+    def observe(self, name, value, tags=None) -> None:
+        return None
+
+    def gauge(self, name, value, tags=None) -> None:
+        return None
+
+
+class TestDecodeFailureCoalescing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now_ms = 1_000
+        self.sink = RecordingSink()
+        self.metrics = RecordingMetrics()
+        self.pipeline = IngestionPipeline(
+            sink=self.sink,
+            backpressure=BackpressureConfig(policy="fail", max_pending=10),
+            observability=Observability(logger=NullLogger(), metrics=self.metrics),
+            clock_ms=lambda: self.now_ms,
+            failure_coalescer=DecodeFailureCoalescer(
+                DecodeFailureCoalescingConfig(window_ms=1_000, max_per_window=2, max_samples=2)
+            ),
+        )
+
+    def _failure(
+        self, payload: bytes, *, detail: str = "missing p", symbol: str = "BTCUSDT"
+    ) -> None:
+        self.pipeline.ingest(
+            event_type="DecodeFailure",
+            source_id="binance",
+            symbol=symbol,
+            exchange_ts_ms=None,
+            raw_payload=payload,
+            normalized={"error_kind": "schema_mismatch", "error_detail": detail},
+            channel="trades",
+        )
+
+    def _trade(self) -> None:
+        self.pipeline.ingest(
+            event_type="TradeTick",
+            source_id="binance",
+            symbol="BTCUSDT",
+            exchange_ts_ms=1,
+            raw_payload=b"{}",
+            normalized={"price": 1.0, "quantity": 1.0, "side": None},
+            channel="trades",
+        )
+
+    def test_storm_collapses_into_summary(self) -> None:
+        for index in range(10):
+            self._failure(f"bad-{index}".encode())
+        self._failure(b"other", detail="missing q")
+        self.now_ms = 1_500
+        self._trade()
+
+        self.assertEqual(
+            [event.normalized["error_detail"] for event in self.sink.events[:3]],
+            ["missing p", "missing p", "missing q"],
+        )
+        self.assertEqual(len(self.sink.events), 4)
+
+        self.now_ms = 2_000
+        self._trade()
+
+        summary = self.sink.events[4]
+        self.assertEqual(summary.event_type, "DecodeFailure")
+        self.assertEqual(summary.recv_ts_ms, 2_000)
+        self.assertEqual(summary.channel, "trades")
+        self.assertEqual(summary.raw_payload, b"bad-2")
+        self.assertEqual(summary.normalized["coalesced_count"], 8)
+        self.assertEqual(summary.normalized["sample_payloads"], ["bad-2", "bad-3"])
+        self.assertEqual(
+            (summary.normalized["window_start_ms"], summary.normalized["window_end_ms"]),
+            (1_000, 2_000),
+        )
+        self.assertEqual(self.sink.events[5].event_type, "TradeTick")
+        failures = sum(
+            value for name, value, _ in self.metrics.increments
+            if name == "market_data.decode_failures.count"
+        )
+        self.assertEqual(failures, 12)
+
+        self._failure(b"new-window")
+        self.assertEqual(self.sink.events[-1].raw_payload, b"new-window")
+
+    def test_summaries_are_kept_per_symbol(self) -> None:
+        for index in range(4):
+            self._failure(f"btc-{index}".encode())
+            self._failure(f"eth-{index}".encode(), symbol="ETHUSDT")
+        self.now_ms = 2_000
+        self._trade()
+
+        summaries = {
+            event.symbol: event
+            for event in self.sink.events
+            if event.event_type == "DecodeFailure" and "coalesced_count" in event.normalized
+        }
+        self.assertEqual(sorted(summaries), ["BTCUSDT", "ETHUSDT"])
+        self.assertEqual(summaries["ETHUSDT"].normalized["coalesced_count"], 2)
+        self.assertEqual(
+            summaries["ETHUSDT"].normalized["sample_payloads"], ["eth-2", "eth-3"]
+        )
+
+    def test_flush_emits_ended_windows_without_new_ingest(self) -> None:
+        for index in range(4):
+            self._failure(f"bad-{index}".encode())
+        self.pipeline.flush_failure_summaries()
+        self.assertEqual(len(self.sink.events), 2)
+
+        self.now_ms = 2_000
+        self.pipeline.flush_failure_summaries()
+        self.assertEqual(len(self.sink.events), 3)
+        self.assertEqual(self.sink.events[-1].normalized["coalesced_count"], 2)
+
+    def test_forced_flush_closes_the_open_window(self) -> None:
+        for index in range(3):
+            self._failure(f"bad-{index}".encode())
+        self.now_ms = 1_200
+        self.pipeline.flush_failure_summaries(force=True)
+
+        summary = self.sink.events[-1]
+        self.assertEqual(summary.normalized["coalesced_count"], 1)
+        self.assertEqual(summary.normalized["window_end_ms"], 1_200)
+        self.pipeline.flush_failure_summaries(force=True)
+        self.assertEqual(len(self.sink.events), 3)
+
+    def test_flusher_drains_on_a_timer_and_on_stop(self) -> None:
+        flushed = threading.Event()
+        sink_write = self.sink.write
+
+        def write(event, *, block: bool, timeout_ms: int | None) -> None:
+            sink_write(event, block=block, timeout_ms=timeout_ms)
+            if "coalesced_count" in event.normalized:
+                flushed.set()
+
+        self.sink.write = write  # type: ignore[method-assign]
+        flusher = FailureSummaryFlusher(self.pipeline, interval_ms=10)
+        flusher.start()
+        for index in range(3):
+            self._failure(f"bad-{index}".encode())
+        self.now_ms = 2_000
+        self.assertTrue(flushed.wait(timeout=5))
+
+        flushed.clear()
+        for index in range(3):
+            self._failure(f"late-{index}".encode(), detail="missing q")
+        flusher.stop()
+        self.assertTrue(flushed.is_set())
+        self.assertEqual(self.sink.events[-1].raw_payload, b"late-2")
+
+    def test_batch_failures_are_coalesced(self) -> None:
+        items = [
+            IngestItem(
+                event_type="DecodeFailure",
+                source_id="binance",
+                symbol="BTCUSDT",
+                exchange_ts_ms=None,
+                raw_payload=b"bad",
+                normalized={"error_kind": "decode_error", "error_detail": "boom"},
+                channel="trades",
+            )
+            for _ in range(5)
+        ]
+
+        events = self.pipeline.ingest_batch(items)
+
+        self.assertEqual(len(events), 5)
+        self.assertEqual(len(self.sink.events), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
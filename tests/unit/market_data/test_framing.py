@@ -0,0 +1,42 @@
+import struct
+import unittest
+
+from market_data.framing import JournalFormatError, decode_normalized, encode_normalized
+
+
+class TestNormalizedCodec(unittest.TestCase):
+    def test_round_trips_nested_values(self) -> None:
+        mapping = {
+            "price": 1.5,
+            "quantity": -3,
+            "big": 2**80,
+            "side": None,
+            "maker": True,
+            "closed": False,
+            "symbol": "BTCUSDT",
+            "blob": b"\x00\xff",
+            "bids": [[1.0, 2.0], [0.5, 4.0]],
+            "pair": (1, "a"),
+            "meta": {"nested": {"x": [None]}},
+        }
+        decoded = decode_normalized(memoryview(encode_normalized(mapping)))
+        self.assertEqual(decoded, mapping)
+        self.assertIsInstance(decoded["pair"], tuple)
+        self.assertIsInstance(decoded["bids"], list)
+        self.assertIs(decoded["maker"], True)
+
+    def test_rejects_unknown_tag(self) -> None:
+        data = encode_normalized({"a": 1.0})
+        # Corrupt the tag of the single value, which follows the map header and key.
+        corrupted = bytearray(data)
+        corrupted[struct.calcsize("<BI") + struct.calcsize("<BI") + 1] = 0xEE
+        with self.assertRaises(JournalFormatError):
+            decode_normalized(memoryview(bytes(corrupted)))
+
+    def test_rejects_unsupported_types(self) -> None:
+        with self.assertRaises(TypeError):
+            encode_normalized({"a": object()})
+
+
+if __name__ == "__main__":
+    unittest.main()
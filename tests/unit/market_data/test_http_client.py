@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from market_data.adapters.binance.adapter import BinanceOpenInterestPoller
+from market_data.adapters.binance.config import BinanceOpenInterestConfig
+from market_data.config import BackpressureConfig
+from market_data.http_client import HttpStatusError, PooledHttpClient
+from market_data.observability import NullLogger, Observability
+from market_data.pipeline import IngestionPipeline
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    lock = threading.Lock()
+    slow_entered = threading.Event()
+    slow_gate = threading.Event()
+
+    def do_GET(self) -> None:  # noqa: N802
+        with self.lock:
+            self.connections.add(id(self.connection))
+        symbol = parse_qs(urlsplit(self.path).query).get("symbol", [""])[0]
+        if symbol == "SLOWUSDT":
+            self.slow_entered.set()
+            self.slow_gate.wait(timeout=5)
+        if symbol == "BADUSDT":
+            body = b'{"code":-1121}'
+            self.send_response(400)
+        else:
+            body = b'{"openInterest":"12.5","time":1000}'
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        return None
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+        self._lock = threading.Lock()
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        with self._lock:
+            self.events.append(event)
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.observed = []
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1, tags=None) -> None:
+        return None
+
+    def observe(self, name, value, tags=None) -> None:
+        with self._lock:
+            self.observed.append((name, value, dict(tags or {})))
+
+    def gauge(self, name, value, tags=None) -> None:
+        return None
+
+
+class TestPooledHttpClient(unittest.TestCase):
+    def setUp(self) -> None:
+        _Handler.connections = set()
+        _Handler.slow_entered = threading.Event()
+        _Handler.slow_gate = threading.Event()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_keep_alive_connection(self) -> None:
+        client = PooledHttpClient(self.base_url, max_connections=2)
+        for _ in range(5):
+            response = client.get("/fapi/v1/openInterest?symbol=BTCUSDT")
+            self.assertEqual(response.status, 200)
+            self.assertGreaterEqual(response.latency_ms, 0.0)
+        client.close()
+
+        self.assertEqual(client.connections_opened, 1)
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_non_success_status_raises(self) -> None:
+        client = PooledHttpClient(self.base_url)
+        with self.assertRaises(HttpStatusError) as ctx:
+            client.get("/fapi/v1/openInterest?symbol=BADUSDT")
+        self.assertEqual(ctx.exception.status, 400)
+        client.get("/fapi/v1/openInterest?symbol=BTCUSDT")
+        self.assertEqual(client.connections_opened, 1)
+        client.close()
+
+    def test_close_rejects_requests_and_drops_in_flight_connections(self) -> None:
+        client = PooledHttpClient(self.base_url)
+        thread = threading.Thread(
+            target=client.get, args=("/fapi/v1/openInterest?symbol=SLOWUSDT",)
+        )
+        thread.start()
+        self.assertTrue(_Handler.slow_entered.wait(timeout=5))
+        client.close()
+        _Handler.slow_gate.set()
+        thread.join(timeout=5)
+
+        self.assertEqual(client._idle, [])
+        with self.assertRaises(RuntimeError):
+            client.get("/fapi/v1/openInterest?symbol=BTCUSDT")
+
+    def test_cancelled_poller_waits_for_in_flight_poll(self) -> None:
+        sink = RecordingSink()
+        poller = self._poller(("SLOWUSDT",), sink, RecordingMetrics())
+
+        async def scenario() -> None:
+            poller.start()
+            task = asyncio.create_task(poller.run_async())
+            self.assertTrue(await asyncio.to_thread(_Handler.slow_entered.wait, 5))
+            task.cancel()
+            threading.Timer(0.05, _Handler.slow_gate.set).start()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The poll had finished by the time the task was done.
+            self.assertEqual([event.symbol for event in sink.events], ["SLOWUSDT"])
+
+        asyncio.run(scenario())
+        self.assertEqual(poller._client._idle, [])
+        with self.assertRaises(RuntimeError):
+            poller._client.get("/fapi/v1/openInterest?symbol=BTCUSDT")
+
+    def test_poller_polls_all_symbols_through_capped_pool(self) -> None:
+        symbols = tuple(f"SYM{index}USDT" for index in range(12)) + ("BADUSDT",)
+        sink = RecordingSink()
+        metrics = RecordingMetrics()
+        poller = self._poller(symbols, sink, metrics)
+
+        poller._poll_once()
+        poller._poll_once()
+        poller._close()
+
+        polled = sorted(event.symbol for event in sink.events)
+        self.assertEqual(polled, sorted(symbols[:-1] * 2))
+        self.assertLessEqual(len(_Handler.connections), 3)
+        latencies = [
+            entry for entry in metrics.observed
+            if entry[0] == "market_data.http.request_latency_ms"
+        ]
+        self.assertEqual(len(latencies), 2 * len(symbols))
+        self.assertEqual(latencies[0][2]["host"], "127.0.0.1")
+
+    def _poller(self, symbols, sink, metrics) -> BinanceOpenInterestPoller:
+        observability = Observability(logger=NullLogger(), metrics=metrics)
+        config = BinanceOpenInterestConfig.default()
+        config = BinanceOpenInterestConfig(
+            source_id=config.source_id,
+            symbol=symbols[0],
+            rest_url=self.base_url,
+            channel=config.channel,
+            retry=config.retry,
+            request_timeout_ms=2_000,
+            poll_interval_ms=1_000,
+            max_connections_per_host=3,
+        )
+        return BinanceOpenInterestPoller(
+            config=config,
+            pipeline=IngestionPipeline(
+                sink=sink,
+                backpressure=BackpressureConfig(policy="fail", max_pending=100),
+                observability=observability,
+            ),
+            observability=observability,
+            symbols=symbols,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
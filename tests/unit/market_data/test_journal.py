@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+from market_data.journal import JournalReader, RawEventJournal, segment_paths
+
+
+def _event(recv_ts_ms: int, **overrides) -> RawMarketEvent:
+    fields = dict(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type="TradeTick",
+        source_id="binance",
+        symbol="BTCUSDT",
+        exchange_ts_ms=recv_ts_ms - 5,
+        recv_ts_ms=recv_ts_ms,
+        raw_payload=b'{"p":"1.0"}',
+        normalized={"price": 1.0, "quantity": 2.0, "side": "buy"},
+        source_event_id=str(recv_ts_ms),
+        source_seq=recv_ts_ms,
+        channel="aggTrade",
+        payload_content_type="application/json",
+    )
+    fields.update(overrides)
+    return RawMarketEvent(**fields)
+
+
+class TestRawEventJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trip_preserves_events(self) -> None:
+        events = [
+            _event(1),
+            _event(2, raw_payload='{"text": "é"}', exchange_ts_ms=None, source_seq=None),
+            _event(
+                3,
+                event_type="BookDelta",
+                symbol="ETHUSDT",
+                normalized={"bids": ((1.0, 2.0),), "asks": ()},
+                channel=None,
+                source_event_id="",
+                payload_hash="abc",
+            ),
+        ]
+        journal = RawEventJournal(self.directory)
+        for event in events:
+            journal.append(event)
+        journal.close()
+
+        self.assertEqual(list(JournalReader(self.directory).events()), events)
+
+    def test_rotates_segments_and_filters_by_recv_ts(self) -> None:
+        journal = RawEventJournal(self.directory, max_segment_bytes=2048, index_interval=4)
+        events = [_event(ts) for ts in range(100, 400)]
+        journal.write_batch(events, block=True, timeout_ms=None)
+        journal.close()
+
+        segments = segment_paths(self.directory)
+        self.assertGreater(len(segments), 1)
+        for segment in segments:
+            self.assertTrue(os.path.exists(segment[: -len(".journal")] + ".index"))
+        reader = JournalReader(self.directory)
+        self.assertEqual(list(reader.events()), events)
+        selected = list(reader.events(start_recv_ts_ms=250, end_recv_ts_ms=260))
+        self.assertEqual([event.recv_ts_ms for event in selected], list(range(250, 260)))
+
+    def test_index_seek_tolerates_out_of_order_recv_ts(self) -> None:
+        journal = RawEventJournal(self.directory, index_interval=2)
+        order = [10, 50, 20, 30, 40, 15, 60, 70]
+        for ts in order:
+            journal.append(_event(ts))
+        journal.close()
+
+        selected = JournalReader(self.directory).events(start_recv_ts_ms=15)
+        self.assertEqual([event.recv_ts_ms for event in selected], [50, 20, 30, 40, 15, 60, 70])
+
+    def test_frames_expose_payload_views(self) -> None:
+        journal = RawEventJournal(self.directory)
+        journal.append(_event(1, raw_payload=b"\x00\x01raw"))
+        journal.close()
+
+        frames = list(JournalReader(self.directory).frames())
+        self.assertIsInstance(frames[0].raw_payload, memoryview)
+        self.assertEqual(frames[0].raw_payload.tobytes(), b"\x00\x01raw")
+        self.assertEqual(frames[0].symbol, "BTCUSDT")
+
+    def test_unsealed_segment_is_readable_and_new_writer_appends_new_segment(self) -> None:
+        journal = RawEventJournal(self.directory)
+        journal.append(_event(1))
+        journal.flush()
+        self.assertEqual([e.recv_ts_ms for e in JournalReader(self.directory).events()], [1])
+        journal.close()
+
+        second = RawEventJournal(self.directory)
+        second.append(_event(2))
+        second.close()
+        self.assertEqual(len(segment_paths(self.directory)), 2)
+        self.assertEqual([e.recv_ts_ms for e in JournalReader(self.directory).events()], [1, 2])
+
+    def test_truncated_tail_frame_is_ignored(self) -> None:
+        journal = RawEventJournal(self.directory)
+        journal.append(_event(1))
+        journal.append(_event(2))
+        journal.flush()
+        path = segment_paths(self.directory)[0]
+        with open(path, "r+b") as handle:
+            handle.truncate(os.path.getsize(path) - 3)
+
+        self.assertEqual([e.recv_ts_ms for e in JournalReader(self.directory).events()], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import importlib.util
+import unittest
+
+from market_data.config import BackpressureConfig
+from market_data.decoder import decode_and_ingest
+from market_data.json_backend import (
+    JsonBackend,
+    JsonDecodeError,
+    get_json_backend,
+    select_json_backend,
+    set_json_backend,
+)
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.pipeline import IngestionPipeline
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.events.append(event)
+
+
+def _installed(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+class TestJsonBackends(unittest.TestCase):
+    def _assert_backend(self, name: str) -> None:
+        backend = select_json_backend(name)
+        self.assertEqual(backend.name, name)
+        self.assertEqual(backend.loads(b'{"p":"1.5","n":[1,2]}'), {"p": "1.5", "n": [1, 2]})
+        self.assertEqual(backend.loads('{"p":"1.5"}'), {"p": "1.5"})
+        with self.assertRaises(JsonDecodeError):
+            backend.loads(b"{bad-json}")
+        with self.assertRaises(JsonDecodeError):
+            backend.loads(b'{"p":"\xff"}')
+
+    def test_stdlib_backend(self) -> None:
+        self._assert_backend("stdlib")
+
+    @unittest.skipUnless(_installed("orjson"), "orjson not installed")
+    def test_orjson_backend(self) -> None:
+        self._assert_backend("orjson")
+
+    @unittest.skipUnless(_installed("msgspec"), "msgspec not installed")
+    def test_msgspec_backend(self) -> None:
+        self._assert_backend("msgspec")
+
+    def test_unknown_backend_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            select_json_backend("simdjson")
+
+    def test_decoder_uses_selected_backend_and_preserves_raw_payload(self) -> None:
+        calls = []
+        stdlib = select_json_backend("stdlib")
+
+        def loads(data):
+            calls.append(data)
+            return stdlib.loads(data)
+
+        previous = get_json_backend()
+        set_json_backend(JsonBackend(name="recording", loads=loads))
+        try:
+            pipeline = IngestionPipeline(
+                sink=RecordingSink(),
+                backpressure=BackpressureConfig(policy="fail", max_pending=1),
+                observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+                clock_ms=lambda: 1,
+            )
+            raw_payload = b'{"price": 1.0, "quantity": 2.0, "side": "buy"}'
+            event = decode_and_ingest(
+                pipeline=pipeline,
+                event_type="TradeTick",
+                source_id="source",
+                symbol="TEST",
+                exchange_ts_ms=None,
+                raw_payload=raw_payload,
+                payload_content_type="application/json",
+            )
+        finally:
+            set_json_backend(previous)
+
+        self.assertEqual(calls, [raw_payload])
+        self.assertIs(event.raw_payload, raw_payload)
+        self.assertEqual(event.normalized["price"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
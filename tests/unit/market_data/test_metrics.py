@@ -0,0 +1,121 @@
+import threading
+import unittest
+
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+from market_data.metrics import (
+    HistogramMetrics,
+    MetricsReporter,
+    bucket_index,
+    bucket_upper_bound,
+)
+from market_data.observability import NullLogger, Observability
+
+LATENCY = "market_data.exchange_to_recv.latency_ms"
+
+
+class RecordingLogger:
+    def __init__(self) -> None:
+        self.entries = []
+
+    def log(self, level, message, fields) -> None:
+        self.entries.append((message, dict(fields)))
+
+
+def _event(event_type: str, *, exchange_ts_ms: int, recv_ts_ms: int) -> RawMarketEvent:
+    return RawMarketEvent(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type=event_type,
+        source_id="binance",
+        symbol="BTCUSDT",
+        exchange_ts_ms=exchange_ts_ms,
+        recv_ts_ms=recv_ts_ms,
+        raw_payload=b"{}",
+        normalized={},
+    )
+
+
+class TestHistogramMetrics(unittest.TestCase):
+    def test_bucket_bounds_stay_within_relative_error(self) -> None:
+        for value in (0.01, 0.75, 1.0, 3.0, 17.0, 250.0, 12_345.0):
+            upper = bucket_upper_bound(bucket_index(value))
+            self.assertGreater(upper, value)
+            self.assertLessEqual((upper - value) / value, 1 / 16)
+
+    def test_percentiles_per_series_and_interval_reset(self) -> None:
+        metrics = HistogramMetrics()
+        tags = {"source_id": "binance", "event_type": "TradeTick"}
+        for value in range(1, 1001):
+            metrics.observe(LATENCY, float(value), tags=tags)
+        metrics.observe(LATENCY, 5.0, tags={"event_type": "BookTop", "source_id": "binance"})
+
+        snapshot = metrics.snapshot()
+        trades = snapshot.histograms[
+            (LATENCY, (("event_type", "TradeTick"), ("source_id", "binance")))
+        ]
+        self.assertEqual(trades.count, 1000)
+        self.assertAlmostEqual(trades.mean, 500.5)
+        for percentile, expected in ((50.0, 500), (99.0, 990)):
+            self.assertAlmostEqual(trades.percentiles[percentile], expected, delta=expected / 16)
+        self.assertEqual(len(snapshot.histograms), 2)
+
+        metrics.observe(LATENCY, 2.0, tags=tags)
+        second = metrics.snapshot()
+        self.assertEqual(list(second.histograms.values())[0].count, 1)
+        self.assertEqual(len(second.histograms), 1)
+
+    def test_merges_thread_shards(self) -> None:
+        metrics = HistogramMetrics()
+
+        def record() -> None:
+            for _ in range(500):
+                metrics.observe("lag", 1.0, tags={"worker": "0"})
+                metrics.increment("events", tags={"worker": "0"})
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        metrics.gauge("depth", 3.0)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot.histograms[("lag", (("worker", "0"),))].count, 2000)
+        self.assertEqual(snapshot.counters[("events", (("worker", "0"),))], 2000)
+        self.assertEqual(snapshot.gauges[("depth", ())], 3.0)
+        self.assertEqual(metrics.snapshot().counters, {})
+
+    def test_observability_reports_latency_summary(self) -> None:
+        metrics = HistogramMetrics(percentiles=(50.0,))
+        logger = RecordingLogger()
+        observability = Observability(logger=logger, metrics=metrics)
+        for offset in (10, 20, 30):
+            observability.record_latency_metrics(
+                _event("TradeTick", exchange_ts_ms=1_000, recv_ts_ms=1_000 + offset)
+            )
+
+        reporter = MetricsReporter(
+            metrics, interval_ms=60_000, on_snapshot=observability.log_metrics_snapshot
+        )
+        reporter.start()
+        reporter.stop()
+
+        message, fields = logger.entries[0]
+        self.assertEqual(message, "market_data.histogram_summary")
+        self.assertEqual(fields["metric"], LATENCY)
+        self.assertEqual(fields["event_type"], "TradeTick")
+        self.assertEqual(fields["count"], 3)
+        self.assertAlmostEqual(fields["p50"], 20.0, delta=20.0 / 16)
+
+    def test_negative_latency_lands_in_first_bucket(self) -> None:
+        metrics = HistogramMetrics()
+        observability = Observability(logger=NullLogger(), metrics=metrics)
+        observability.record_latency_metrics(_event("TradeTick", exchange_ts_ms=5, recv_ts_ms=1))
+
+        summary = list(metrics.snapshot().histograms.values())[0]
+        self.assertEqual(summary.count, 1)
+        self.assertEqual(summary.max, bucket_upper_bound(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
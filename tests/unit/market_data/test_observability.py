@@ -1,8 +1,10 @@
+import logging
+import threading
 import unittest
 
 from market_data.adapter import StreamKey
 from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
-from market_data.observability import Observability
+from market_data.observability import MarketDataHealthTracker, Observability, StdlibLogger
 
 
 class RecordingLogger:
@@ -13,6 +15,29 @@ class RecordingLogger:
         self.entries.append((level, message, dict(fields)))
 
 
+class LevelLogger(RecordingLogger):
+    def __init__(self, level: int) -> None:
+        super().__init__()
+        self.level = level
+
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= self.level
+
+
+def _trade(index: int, event_type: str = "TradeTick") -> RawMarketEvent:
+    return RawMarketEvent(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type=event_type,
+        source_id="test-source",
+        symbol="TEST",
+        exchange_ts_ms=index,
+        recv_ts_ms=index,
+        raw_payload=b"payload",
+        normalized={},
+    )
+
+
 class RecordingMetrics:
     def __init__(self) -> None:
         self.increments = []
@@ -97,6 +122,83 @@ class TestObservability(unittest.TestCase):
         self.assertEqual(metrics.increments[0][0], "market_data.transport.reconnects")
         self.assertEqual(metrics.gauges[0][0], "market_data.transport.state")
 
+    def test_disabled_debug_skips_event_logs_but_keeps_metrics(self) -> None:
+        logger = LevelLogger(logging.INFO)
+        metrics = RecordingMetrics()
+        obs = Observability(logger=logger, metrics=metrics)
+
+        obs.record_event(_trade(1))
+        obs.record_events([_trade(2), _trade(3)])
+
+        self.assertEqual(logger.entries, [])
+        self.assertEqual(len(metrics.observations), 3)
+        self.assertEqual(sum(entry[1] for entry in metrics.increments), 3)
+
+    def test_stdlib_logger_follows_logger_level(self) -> None:
+        stdlib = logging.getLogger("market_data.test_observability")
+        stdlib.setLevel(logging.INFO)
+        logger = StdlibLogger(stdlib)
+        self.assertFalse(logger.is_enabled_for(logging.DEBUG))
+        stdlib.setLevel(logging.DEBUG)
+        self.assertTrue(logger.is_enabled_for(logging.DEBUG))
+
+    def test_debug_logs_are_sampled_per_event_type(self) -> None:
+        logger = LevelLogger(logging.DEBUG)
+        obs = Observability(logger=logger, metrics=RecordingMetrics(), debug_sample_every=3)
+
+        obs.record_events([_trade(index) for index in range(7)])
+        obs.record_event(_trade(7, event_type="BookTop"))
+
+        logged = [(fields["event_type"], fields["recv_ts_ms"]) for _, _, fields in logger.entries]
+        self.assertEqual(
+            logged,
+            [("TradeTick", 0), ("TradeTick", 3), ("TradeTick", 6), ("BookTop", 7)],
+        )
+        with self.assertRaises(ValueError):
+            Observability(logger=logger, metrics=RecordingMetrics(), debug_sample_every=0)
+
+
+class TestMarketDataHealthTracker(unittest.TestCase):
+    def test_merges_thread_counters_on_snapshot(self) -> None:
+        tracker = MarketDataHealthTracker()
+
+        def record(offset: int) -> None:
+            tracker.record_event(_trade(offset, event_type="DecodeFailure"))
+            for index in range(1_000):
+                tracker.record_event(_trade(offset + index))
+
+        threads = [threading.Thread(target=record, args=(offset,)) for offset in (10, 5_000)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = tracker.snapshot_and_reset("TEST")
+        self.assertEqual(snapshot["raw_events_ingested"], 2_000)
+        self.assertEqual(snapshot["decode_failures"], 2)
+        self.assertEqual(snapshot["first_event_timestamp_ms"], 10)
+        self.assertEqual(snapshot["last_event_timestamp_ms"], 5_999)
+
+        tracker.record_event(_trade(7_000))
+        second = tracker.snapshot_and_reset("TEST")
+        self.assertEqual(second["raw_events_ingested"], 1)
+        self.assertEqual(second["first_event_timestamp_ms"], 7_000)
+        self.assertEqual(tracker.snapshot_and_reset("TEST")["raw_events_ingested"], 0)
+
+    def test_adapter_status_tracks_streams_per_symbol(self) -> None:
+        tracker = MarketDataHealthTracker()
+        trades = StreamKey(source_id="binance", channel="trades", symbol="TEST")
+        depth = StreamKey(source_id="binance", channel="depth", symbol="TEST")
+
+        self.assertEqual(tracker.snapshot_and_reset("TEST")["adapter_status"], "disconnected")
+        tracker.record_transport_state(stream_key=trades, state="connected")
+        tracker.record_transport_state(stream_key=depth, state="connected")
+        tracker.record_transport_state(stream_key=trades, state="disconnected")
+        self.assertEqual(tracker.snapshot_and_reset("TEST")["adapter_status"], "connected")
+        self.assertEqual(tracker.snapshot_and_reset("OTEST")["adapter_status"], "disconnected")
+        tracker.record_transport_state(stream_key=depth, state="disconnected")
+        self.assertEqual(tracker.snapshot_and_reset("TEST")["adapter_status"], "disconnected")
+
 
 if __name__ == "__main__":
     unittest.main()
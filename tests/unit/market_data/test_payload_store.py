@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+from market_data.payload_store import PayloadStore
+
+
+def _event(raw_payload: bytes | str, **overrides) -> RawMarketEvent:
+    fields = dict(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type="TradeTick",
+        source_id="binance",
+        symbol="BTCUSDT",
+        exchange_ts_ms=5,
+        recv_ts_ms=10,
+        raw_payload=raw_payload,
+        normalized={"price": 1.0, "quantity": 2.0, "side": "buy"},
+        channel="aggTrade",
+    )
+    fields.update(overrides)
+    return RawMarketEvent(**fields)
+
+
+class TestPayloadStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_round_trips_bytes_and_text(self) -> None:
+        store = PayloadStore(self.tmp.name, flush_bytes=8)
+        text = _event('{"s":"BTCUSDT","p":"1.0","x":"é"}')
+        binary = _event(b"\x00\x01raw", exchange_ts_ms=None, channel=None)
+        text_offset, text_length = store.put(text)
+        binary_offset, binary_length = store.put(binary)
+
+        self.assertEqual(store.frame(text_offset, text_length).to_event(), text)
+        self.assertEqual(store.frame(binary_offset, binary_length).to_event(), binary)
+        self.assertEqual(binary_offset, text_length)
+        store.close()
+
+    def test_reads_unflushed_events(self) -> None:
+        store = PayloadStore(self.tmp.name, flush_bytes=1 << 20)
+        offset, length = store.put(_event(b"pending"))
+        (segment,) = os.listdir(store.directory)
+        path = os.path.join(store.directory, segment)
+        self.assertEqual(os.path.getsize(path), 0)
+        self.assertEqual(store.frame(offset, length).to_event().raw_payload, b"pending")
+        self.assertEqual(os.path.getsize(path), length)
+        store.close()
+
+    def test_discards_whole_segments_only(self) -> None:
+        store = PayloadStore(self.tmp.name, segment_bytes=1)
+        refs = [store.put(_event(f"payload-{index}")) for index in range(4)]
+        self.assertEqual(store.segment_count, 4)
+
+        self.assertEqual(store.discard_before(refs[2][0] + 1), 2)
+        self.assertEqual(store.segment_count, 2)
+        with self.assertRaises(ValueError):
+            store.read(*refs[1])
+        self.assertEqual(store.frame(*refs[2]).to_event().raw_payload, "payload-2")
+        # The active segment stays even when everything is discarded.
+        self.assertEqual(store.discard_before(store.size), 1)
+        self.assertEqual(store.frame(*refs[3]).to_event().raw_payload, "payload-3")
+        store.close()
+
+    def test_each_store_uses_a_fresh_directory(self) -> None:
+        first = PayloadStore(self.tmp.name)
+        first.put(_event(b"first"))
+        first.close()
+        self.assertFalse(os.path.exists(first.directory))
+
+        second = PayloadStore(self.tmp.name)
+        offset, _ = second.put(_event(b"second"))
+        self.assertEqual(offset, 0)
+        self.assertNotEqual(second.directory, first.directory)
+        second.close()
+        with self.assertRaises(ValueError):
+            second.put(_event(b"late"))
+
+
+if __name__ == "__main__":
+    unittest.main()
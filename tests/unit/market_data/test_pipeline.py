@@ -2,7 +2,7 @@ import unittest
 
 from market_data.config import BackpressureConfig
 from market_data.observability import NullLogger, NullMetrics, Observability
-from market_data.pipeline import IngestionPipeline
+from market_data.pipeline import IngestionPipeline, IngestItem
 from market_data.sink import BackpressureError
 
 
@@ -21,6 +21,49 @@ class RecordingSink:
         self.events.append(event)
 
 
+class BatchRecordingSink(RecordingSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def write_batch(self, events, *, block: bool, timeout_ms: int | None) -> None:
+        self.batches.append(tuple(events))
+        self.events.extend(events)
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.increments = []
+
+    def increment(self, name, value=1, tags=None) -> None:
+        self.increments.append((name, value, dict(tags or {})))
+
+    def observe(self, name, value, tags=None) -> None:
+        return None
+
+    def gauge(self, name, value, tags=None) -> None:
+        return None
+
+
+def _mark_price_items():
+    return [
+        IngestItem(
+            event_type=event_type,
+            source_id="test-source",
+            symbol="TEST",
+            exchange_ts_ms=100,
+            raw_payload=b"frame",
+            normalized={key: 1.0},
+            channel="markPrice",
+        )
+        for event_type, key in (
+            ("MarkPrice", "mark_price"),
+            ("IndexPrice", "index_price"),
+            ("FundingRate", "funding_rate"),
+        )
+    ]
+
+
 class TestIngestionPipeline(unittest.TestCase):
     def test_ingest_assigns_recv_ts_ms_and_emits(self) -> None:
         sink = RecordingSink()
@@ -87,6 +130,89 @@ class TestIngestionPipeline(unittest.TestCase):
         self.assertEqual(sink.last_block, False)
         self.assertEqual(sink.last_timeout_ms, 0)
 
+    def test_ingest_batch_matches_single_ingest_envelopes(self) -> None:
+        clock = iter([5, 6, 7, 8])
+        items = _mark_price_items()
+        single_sink = RecordingSink()
+        single = IngestionPipeline(
+            sink=single_sink,
+            backpressure=BackpressureConfig(policy="fail", max_pending=1),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            clock_ms=lambda: 7,
+        )
+        expected = [
+            single.ingest(
+                event_type=item.event_type,
+                source_id=item.source_id,
+                symbol=item.symbol,
+                exchange_ts_ms=item.exchange_ts_ms,
+                raw_payload=item.raw_payload,
+                normalized=item.normalized,
+                channel=item.channel,
+            )
+            for item in items
+        ]
+        batch_sink = BatchRecordingSink()
+        metrics = RecordingMetrics()
+        batched = IngestionPipeline(
+            sink=batch_sink,
+            backpressure=BackpressureConfig(policy="fail", max_pending=1),
+            observability=Observability(logger=NullLogger(), metrics=metrics),
+            clock_ms=lambda: next(clock) + 2,
+        )
+
+        events = batched.ingest_batch(items)
+
+        self.assertEqual(list(events), expected)
+        self.assertEqual(len(batch_sink.batches), 1)
+        self.assertEqual({event.recv_ts_ms for event in events}, {7})
+        self.assertEqual(
+            sorted(
+                (tags["event_type"], value)
+                for name, value, tags in metrics.increments
+                if name == "market_data.events.count"
+            ),
+            [("FundingRate", 1), ("IndexPrice", 1), ("MarkPrice", 1)],
+        )
+
+    def test_ingest_batch_falls_back_to_per_event_writes(self) -> None:
+        sink = RecordingSink()
+        pipeline = IngestionPipeline(
+            sink=sink,
+            backpressure=BackpressureConfig(policy="fail", max_pending=1),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            clock_ms=lambda: 9,
+        )
+
+        events = pipeline.ingest_batch(_mark_price_items())
+
+        self.assertEqual(sink.events, list(events))
+
+    def test_ingest_batch_validates_before_writing(self) -> None:
+        sink = BatchRecordingSink()
+        pipeline = IngestionPipeline(
+            sink=sink,
+            backpressure=BackpressureConfig(policy="fail", max_pending=1),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            clock_ms=lambda: 9,
+        )
+        items = _mark_price_items()
+        items.append(
+            IngestItem(
+                event_type="TradeTick",
+                source_id="test-source",
+                symbol="TEST",
+                exchange_ts_ms=None,
+                raw_payload=b"frame",
+                normalized={"price": 1.0},
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            pipeline.ingest_batch(items)
+        self.assertEqual(sink.events, [])
+        self.assertEqual(pipeline.ingest_batch([]), ())
+
 
 if __name__ == "__main__":
     unittest.main()
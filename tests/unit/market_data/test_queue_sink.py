@@ -0,0 +1,205 @@
+import threading
+import time
+import unittest
+
+from market_data.config import BackpressureConfig
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+from market_data.observability import NullLogger, Observability
+from market_data.pipeline import IngestionPipeline
+from market_data.queue_sink import QueueRawEventSink
+from market_data.sink import BackpressureError
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def increment(self, name, value=1, tags=None) -> None:
+        self.calls.append(("increment", name, value))
+
+    def observe(self, name, value, tags=None) -> None:
+        self.calls.append(("observe", name, value))
+
+    def gauge(self, name, value, tags=None) -> None:
+        self.calls.append(("gauge", name, value))
+
+
+class GatedSink:
+    def __init__(self) -> None:
+        self.events = []
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.started.set()
+        self.gate.wait(timeout=5)
+        self.events.append(event)
+
+
+class FailingSink:
+    def __init__(self) -> None:
+        self.events = []
+        self.failed = threading.Event()
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        if event.source_seq == 0:
+            self.failed.set()
+            raise RuntimeError("consumer failed")
+        self.events.append(event)
+
+
+def _event(seq: int) -> RawMarketEvent:
+    return RawMarketEvent(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type="TradeTick",
+        source_id="test-source",
+        symbol="TEST",
+        exchange_ts_ms=None,
+        recv_ts_ms=seq,
+        raw_payload=b"{}",
+        normalized={"price": 1.0, "quantity": 1.0, "side": None},
+        source_seq=seq,
+    )
+
+
+class TestQueueRawEventSink(unittest.TestCase):
+    def _sink(self, policy: str, max_pending: int = 2, metrics=None):
+        downstream = GatedSink()
+        observability = Observability(logger=NullLogger(), metrics=metrics or RecordingMetrics())
+        sink = QueueRawEventSink(
+            downstream,
+            backpressure=BackpressureConfig(policy=policy, max_pending=max_pending),
+            observability=observability,
+        )
+        return sink, downstream, observability
+
+    def test_drains_in_order_on_background_thread(self) -> None:
+        sink, downstream, _ = self._sink("block", max_pending=10)
+        downstream.gate.set()
+        sink.start()
+        for seq in range(5):
+            sink.write(_event(seq), block=True, timeout_ms=100)
+        sink.stop()
+        self.assertEqual([event.source_seq for event in downstream.events], [0, 1, 2, 3, 4])
+        self.assertEqual(sink.pending, 0)
+
+    def test_fail_policy_raises_when_full(self) -> None:
+        sink, _, _ = self._sink("fail")
+        sink.write(_event(0), block=False, timeout_ms=0)
+        sink.write(_event(1), block=False, timeout_ms=0)
+        with self.assertRaises(BackpressureError):
+            sink.write(_event(2), block=False, timeout_ms=0)
+        self.assertEqual(sink.pending, 2)
+
+    def test_block_policy_times_out(self) -> None:
+        sink, downstream, _ = self._sink("block", max_pending=1)
+        sink.start()
+        sink.write(_event(0), block=True, timeout_ms=50)
+        self.assertTrue(downstream.started.wait(timeout=1))
+        start = time.monotonic()
+        with self.assertRaises(BackpressureError):
+            sink.write(_event(1), block=True, timeout_ms=30)
+        self.assertGreaterEqual(time.monotonic() - start, 0.025)
+        downstream.gate.set()
+        sink.stop()
+
+    def test_block_policy_resumes_when_drained(self) -> None:
+        sink, downstream, _ = self._sink("block", max_pending=1)
+        sink.start()
+        sink.write(_event(0), block=True, timeout_ms=None)
+        self.assertTrue(downstream.started.wait(timeout=1))
+        threading.Timer(0.02, downstream.gate.set).start()
+        sink.write(_event(1), block=True, timeout_ms=2000)
+        sink.stop()
+        self.assertEqual([event.source_seq for event in downstream.events], [0, 1])
+
+    def test_drop_oldest_policy_discards_and_reports(self) -> None:
+        metrics = RecordingMetrics()
+        sink, downstream, _ = self._sink("drop_oldest", max_pending=2, metrics=metrics)
+        for seq in range(4):
+            sink.write(_event(seq), block=False, timeout_ms=0)
+        downstream.gate.set()
+        sink.start()
+        sink.stop()
+        self.assertEqual([event.source_seq for event in downstream.events], [2, 3])
+        self.assertIn(("increment", "market_data.backpressure.dropped", 1), metrics.calls)
+        self.assertIn(("gauge", "market_data.backpressure.queue_depth", 2.0), metrics.calls)
+
+    def test_drop_oldest_never_raises_while_drain_is_stuck(self) -> None:
+        sink, downstream, _ = self._sink("drop_oldest", max_pending=4)
+        sink.write_batch([_event(seq) for seq in range(4)], block=False, timeout_ms=0)
+        sink.start()
+        self.assertTrue(downstream.started.wait(timeout=1))
+        for seq in range(4, 20):
+            sink.write(_event(seq), block=False, timeout_ms=0)
+            self.assertLessEqual(sink.pending, 4)
+        downstream.gate.set()
+        sink.stop()
+        self.assertEqual([event.source_seq for event in downstream.events], [0, 1, 2, 19])
+
+    def test_pipeline_reports_queue_depth_on_failure(self) -> None:
+        metrics = RecordingMetrics()
+        sink, _, observability = self._sink("fail", max_pending=1, metrics=metrics)
+        pipeline = IngestionPipeline(
+            sink=sink,
+            backpressure=BackpressureConfig(policy="fail", max_pending=1),
+            observability=observability,
+            clock_ms=lambda: 1,
+        )
+        normalized = {"price": 1.0, "quantity": 1.0, "side": None}
+        kwargs = dict(
+            event_type="TradeTick",
+            source_id="test-source",
+            symbol="TEST",
+            exchange_ts_ms=None,
+            raw_payload=b"{}",
+            normalized=normalized,
+        )
+        pipeline.ingest(**kwargs)
+        with self.assertRaises(BackpressureError):
+            pipeline.ingest(**kwargs)
+        self.assertIn(("gauge", "market_data.backpressure.queue_depth", 1.0), metrics.calls)
+
+    def test_write_batch_enqueues_whole_batch_or_nothing(self) -> None:
+        sink, downstream, _ = self._sink("fail", max_pending=3)
+        sink.write_batch([_event(0), _event(1)], block=False, timeout_ms=0)
+        with self.assertRaises(BackpressureError):
+            sink.write_batch([_event(2), _event(3)], block=False, timeout_ms=0)
+        self.assertEqual(sink.pending, 2)
+        downstream.gate.set()
+        sink.start()
+        sink.stop()
+        self.assertEqual([event.source_seq for event in downstream.events], [0, 1])
+
+    def test_block_timeout_enqueues_nothing_from_the_batch(self) -> None:
+        sink, downstream, _ = self._sink("block", max_pending=3)
+        sink.write_batch([_event(0), _event(1)], block=True, timeout_ms=0)
+        with self.assertRaises(BackpressureError):
+            sink.write_batch([_event(2), _event(3)], block=True, timeout_ms=10)
+        self.assertEqual(sink.pending, 2)
+        downstream.gate.set()
+
+    def test_downstream_error_is_raised_on_next_write(self) -> None:
+        sink, _, _ = self._sink("block", max_pending=10)
+        failing = FailingSink()
+        sink._downstream = failing
+        sink.start()
+        sink.write(_event(0), block=True, timeout_ms=100)
+        self.assertTrue(failing.failed.wait(timeout=1))
+        deadline = time.monotonic() + 1
+        while sink.pending and time.monotonic() < deadline:
+            time.sleep(0.001)
+        with self.assertRaises(RuntimeError):
+            sink.write(_event(1), block=True, timeout_ms=100)
+        sink.write(_event(2), block=True, timeout_ms=100)
+        sink.stop()
+        self.assertEqual([event.source_seq for event in failing.events], [2])
+
+    def test_rejects_unknown_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            self._sink("spill")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+import unittest
+from dataclasses import replace
+
+import websockets
+
+from market_data.adapters.binance.adapter import (
+    BinanceAggTradeAdapter,
+    BinanceDepthAdapter,
+    BinanceKlineAdapter,
+    BinanceMarkPriceAdapter,
+)
+from market_data.adapters.binance.config import (
+    BinanceAggTradeConfig,
+    BinanceDepthConfig,
+    BinanceKlineConfig,
+    BinanceMarkPriceConfig,
+)
+from market_data.config import BackpressureConfig
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.pipeline import IngestionPipeline
+from market_data.replay_server import SYNTHETIC_STREAMS, ReplayServer, synthetic_frames
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.events.append(event)
+
+
+class TestSyntheticFrames(unittest.TestCase):
+    def test_frames_decode_without_failures(self) -> None:
+        adapters = {
+            "aggTrade": (BinanceAggTradeAdapter, BinanceAggTradeConfig),
+            "depth": (BinanceDepthAdapter, BinanceDepthConfig),
+            "markPrice": (BinanceMarkPriceAdapter, BinanceMarkPriceConfig),
+            "kline": (BinanceKlineAdapter, BinanceKlineConfig),
+        }
+        for stream in SYNTHETIC_STREAMS:
+            adapter_cls, config_cls = adapters[stream]
+            sink = RecordingSink()
+            adapter = adapter_cls(
+                config=config_cls.default(symbol="BTCUSDT"),
+                pipeline=IngestionPipeline(
+                    sink=sink,
+                    backpressure=BackpressureConfig(policy="block", max_pending=1),
+                    observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+                    clock_ms=lambda: 100,
+                ),
+            )
+            for frame in synthetic_frames(stream, count=5):
+                adapter._handle_message(frame)
+
+            self.assertTrue(sink.events, stream)
+            self.assertNotIn(
+                "DecodeFailure", {event.event_type for event in sink.events}, stream
+            )
+
+    def test_frames_are_deterministic_per_seed(self) -> None:
+        self.assertEqual(synthetic_frames("depth", seed=3), synthetic_frames("depth", seed=3))
+        self.assertNotEqual(synthetic_frames("depth", seed=3), synthetic_frames("depth", seed=4))
+
+    def test_unknown_stream_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            synthetic_frames("bookTicker")
+
+
+class TestReplayServer(unittest.TestCase):
+    def test_adapter_consumes_replayed_frames(self) -> None:
+        frames = synthetic_frames("aggTrade", count=10)
+        sink = RecordingSink()
+        received_ns: list[int] = []
+
+        async def scenario() -> ReplayServer:
+            async with ReplayServer(frames, rate_per_s=0, duration_s=0.05) as server:
+                config = replace(BinanceAggTradeConfig.default(), ws_url=server.url)
+                adapter = BinanceAggTradeAdapter(
+                    config=config,
+                    pipeline=IngestionPipeline(
+                        sink=sink,
+                        backpressure=BackpressureConfig(policy="block", max_pending=1),
+                        observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+                    ),
+                )
+                adapter.attach_frame_observer(received_ns.append)
+                adapter.start()
+                task = asyncio.create_task(adapter.run_async())
+                await asyncio.wait_for(server.wait_finished(), timeout=5)
+                for _ in range(500):
+                    if len(sink.events) >= server.sent:
+                        break
+                    await asyncio.sleep(0.01)
+                adapter.stop()
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                return server
+
+        server = asyncio.run(scenario())
+
+        self.assertGreater(server.sent, len(frames))
+        self.assertEqual(len(sink.events), server.sent)
+        self.assertEqual(sink.events[0].raw_payload, frames[0])
+        self.assertEqual(sink.events[len(frames)].raw_payload, frames[0])
+        self.assertEqual(len(received_ns), server.sent)
+        self.assertEqual(received_ns, sorted(received_ns))
+
+    def test_early_disconnect_still_finishes(self) -> None:
+        async def scenario() -> ReplayServer:
+            async with ReplayServer(["{}"], rate_per_s=0, duration_s=30) as server:
+                async with websockets.connect(server.url) as websocket:
+                    await websocket.recv()
+                await asyncio.wait_for(server.wait_finished(), timeout=5)
+                return server
+
+        server = asyncio.run(scenario())
+
+        self.assertGreater(server.sent, 0)
+
+    def test_paced_rate_limits_frames_sent(self) -> None:
+        async def scenario() -> int:
+            async with ReplayServer(["{}"], rate_per_s=100, duration_s=0.2) as server:
+                async with websockets.connect(server.url) as websocket:
+                    received = 0
+                    async for _ in websocket:
+                        received += 1
+                return received
+
+        received = asyncio.run(scenario())
+
+        self.assertGreater(received, 0)
+        self.assertLessEqual(received, 21)
+
+    def test_rejects_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            ReplayServer([], rate_per_s=1, duration_s=1)
+        with self.assertRaises(ValueError):
+            ReplayServer(["{}"], rate_per_s=-1, duration_s=1)
+        with self.assertRaises(ValueError):
+            ReplayServer(["{}"], rate_per_s=1, duration_s=0)
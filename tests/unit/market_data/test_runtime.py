@@ -0,0 +1,256 @@
+import asyncio
+import threading
+import unittest
+
+from market_data.adapter import StreamKey
+from market_data.config import BackpressureConfig
+from market_data.config.loader import _parse_runtime_config
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.runtime import (
+    MarketDataRuntime,
+    MarketDataRuntimeInfo,
+    SharedLoopRunner,
+    build_market_data_runtime,
+)
+from market_data.runtime_config import (
+    AdapterType,
+    DeploymentMode,
+    MarketDataRuntimeConfig,
+    RuntimeMode,
+    TransportMode,
+)
+
+
+class RecordingSink:
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        return None
+
+
+class BlockingAsyncAdapter:
+    def __init__(self, channel: str) -> None:
+        self.stream_key = StreamKey(source_id="test", channel=channel, symbol="TEST")
+        self.started = threading.Event()
+        self.cancelled = False
+        self.thread_id: int | None = None
+        self.running = False
+
+    def start(self) -> None:
+        self.running = True
+
+    def run(self) -> None:
+        asyncio.run(self.run_async())
+
+    def stop(self) -> None:
+        self.running = False
+
+    async def run_async(self) -> None:
+        self.thread_id = threading.get_ident()
+        self.started.set()
+        try:
+            while self.running:
+                await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class TestSharedLoopRuntime(unittest.TestCase):
+    def test_adapters_share_one_loop_thread_and_stop_cancels_tasks(self) -> None:
+        adapters = [BlockingAsyncAdapter("trades"), BlockingAsyncAdapter("candle_3m")]
+        runner = SharedLoopRunner(adapters, name="test-shared-loop")
+        runtime = MarketDataRuntime(
+            adapters=adapters,
+            threads=[runner.thread],
+            info=MarketDataRuntimeInfo(
+                symbols=("TEST",), adapter_count=2, optional_enabled=False
+            ),
+            loop_runner=runner,
+        )
+
+        runtime.start()
+        for adapter in adapters:
+            self.assertTrue(adapter.started.wait(timeout=1))
+        runtime.stop()
+
+        self.assertFalse(runner.thread.is_alive())
+        self.assertEqual(adapters[0].thread_id, adapters[1].thread_id)
+        self.assertNotEqual(adapters[0].thread_id, threading.get_ident())
+        self.assertTrue(all(adapter.cancelled for adapter in adapters))
+
+    def test_cancel_before_loop_starts_is_not_lost(self) -> None:
+        adapters = [BlockingAsyncAdapter("trades")]
+        runner = SharedLoopRunner(adapters, name="test-shared-loop")
+        adapters[0].start()
+
+        runner.cancel()
+        runner.thread.start()
+        runner.thread.join(timeout=1)
+
+        self.assertFalse(runner.thread.is_alive())
+
+    def test_build_shared_loop_runtime_uses_single_thread(self) -> None:
+        config = MarketDataRuntimeConfig(
+            symbols=("BTCUSDT",),
+            enabled_adapters=frozenset({AdapterType.AGG_TRADE, AdapterType.KLINE}),
+            backpressure=BackpressureConfig(policy="fail", max_pending=10),
+            runtime_mode=RuntimeMode.SHARED_LOOP,
+        )
+        runtime = build_market_data_runtime(
+            sink=RecordingSink(),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            config=config,
+        )
+
+        self.assertEqual(runtime.info.adapter_count, 2)
+        self.assertEqual(len(runtime._threads), 1)
+
+    def test_combined_transport_multiplexes_websocket_channels(self) -> None:
+        config = MarketDataRuntimeConfig(
+            symbols=("BTCUSDT",),
+            enabled_adapters=frozenset(
+                {AdapterType.AGG_TRADE, AdapterType.KLINE, AdapterType.OPEN_INTEREST}
+            ),
+            backpressure=BackpressureConfig(policy="fail", max_pending=10),
+            transport=TransportMode.COMBINED,
+        )
+        runtime = build_market_data_runtime(
+            sink=RecordingSink(),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            config=config,
+        )
+
+        channels = [adapter.stream_key.channel for adapter in runtime._adapters]
+        self.assertEqual(channels, ["combined-0", "open_interest"])
+
+    def test_combined_transport_shards_symbols_under_stream_cap(self) -> None:
+        symbols = tuple(f"SYM{index:03d}USDT" for index in range(120))
+        config = MarketDataRuntimeConfig(
+            symbols=symbols,
+            enabled_adapters=frozenset(
+                {AdapterType.AGG_TRADE, AdapterType.KLINE, AdapterType.OPEN_INTEREST}
+            ),
+            backpressure=BackpressureConfig(policy="fail", max_pending=10),
+            transport=TransportMode.COMBINED,
+            max_streams_per_connection=50,
+        )
+        runtime = build_market_data_runtime(
+            sink=RecordingSink(),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            config=config,
+        )
+
+        connections = runtime._adapters[: runtime.info.connection_count]
+        self.assertEqual(runtime.info.connection_count, 5)
+        self.assertEqual(len(runtime._adapters), 5 + 1)
+        self.assertEqual(runtime._adapters[-1].symbols, symbols)
+        routed = [key.symbol for connection in connections for key in connection.channels]
+        self.assertEqual(sorted(set(routed)), sorted(symbols))
+        self.assertEqual(len(routed), 2 * len(symbols))
+        for connection in connections:
+            self.assertLessEqual(len(connection.channels), 50)
+
+    def test_per_stream_transport_builds_adapters_per_symbol(self) -> None:
+        config = MarketDataRuntimeConfig(
+            symbols=("BTCUSDT", "ETHUSDT"),
+            enabled_adapters=frozenset({AdapterType.AGG_TRADE, AdapterType.OPEN_INTEREST}),
+            backpressure=BackpressureConfig(policy="fail", max_pending=10),
+        )
+        runtime = build_market_data_runtime(
+            sink=RecordingSink(),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            config=config,
+        )
+
+        keys = [(a.stream_key.symbol, a.stream_key.channel) for a in runtime._adapters]
+        self.assertEqual(
+            keys,
+            [
+                ("BTCUSDT", "trades"),
+                ("ETHUSDT", "trades"),
+                (None, "open_interest"),
+            ],
+        )
+        with self.assertRaises(ValueError):
+            runtime.rebalance(["BTCUSDT"])
+
+
+class TestRuntimeModeConfig(unittest.TestCase):
+    def _payload(self, **overrides):
+        payload = {
+            "symbol": "BTCUSDT",
+            "backpressure": {"policy": "fail", "max_pending": 10},
+            "adapters": {
+                "agg_trade": True,
+                "kline": True,
+                "open_interest": True,
+                "book_ticker": False,
+                "depth": False,
+                "mark_price": False,
+                "force_order": False,
+            },
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_runtime_mode_defaults_to_threaded(self) -> None:
+        config = _parse_runtime_config(self._payload())
+        self.assertEqual(config.runtime_mode, RuntimeMode.THREADED)
+
+    def test_runtime_mode_shared_loop(self) -> None:
+        config = _parse_runtime_config(self._payload(runtime_mode="shared_loop"))
+        self.assertEqual(config.runtime_mode, RuntimeMode.SHARED_LOOP)
+
+    def test_runtime_mode_rejects_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(self._payload(runtime_mode="fibers"))
+
+    def test_deployment_defaults_to_in_process(self) -> None:
+        config = _parse_runtime_config(self._payload())
+        self.assertEqual(config.deployment, DeploymentMode.IN_PROCESS)
+        config = _parse_runtime_config(self._payload(deployment="subprocess", shm_ring_bytes=4096))
+        self.assertEqual(config.deployment, DeploymentMode.SUBPROCESS)
+        self.assertEqual(config.shm_ring_bytes, 4096)
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(self._payload(deployment="cluster"))
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(self._payload(shm_ring_bytes=0))
+
+    def test_symbols_list_and_legacy_symbol(self) -> None:
+        config = _parse_runtime_config(self._payload())
+        self.assertEqual(config.symbols, ("BTCUSDT",))
+        payload = self._payload(symbols=["BTCUSDT", "ETHUSDT"])
+        del payload["symbol"]
+        config = _parse_runtime_config(payload)
+        self.assertEqual(config.symbols, ("BTCUSDT", "ETHUSDT"))
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(self._payload(symbols=["ETHUSDT"]))
+        payload["symbols"] = ["BTCUSDT", "BTCUSDT"]
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(payload)
+
+    def test_transport_defaults_to_per_stream(self) -> None:
+        config = _parse_runtime_config(self._payload())
+        self.assertEqual(config.transport, TransportMode.PER_STREAM)
+        config = _parse_runtime_config(self._payload(transport="combined"))
+        self.assertEqual(config.transport, TransportMode.COMBINED)
+
+    def test_decode_failure_coalescing(self) -> None:
+        config = _parse_runtime_config(self._payload())
+        self.assertEqual(config.decode_failure_coalescing.max_per_window, 20)
+        config = _parse_runtime_config(
+            self._payload(decode_failure_coalescing={"window_ms": 500, "max_samples": 0})
+        )
+        self.assertEqual(config.decode_failure_coalescing.window_ms, 500)
+        self.assertEqual(config.decode_failure_coalescing.max_samples, 0)
+        config = _parse_runtime_config(self._payload(decode_failure_coalescing=None))
+        self.assertIsNone(config.decode_failure_coalescing)
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(
+                self._payload(decode_failure_coalescing={"max_per_window": 0})
+            )
+        with self.assertRaises(ValueError):
+            _parse_runtime_config(self._payload(decode_failure_coalescing={"rate": 1}))
+
+
+if __name__ == "__main__":
+    unittest.main()
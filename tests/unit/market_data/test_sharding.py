@@ -0,0 +1,125 @@
+import unittest
+
+from market_data.adapters.binance.adapter import (
+    BinanceAggTradeAdapter,
+    BinanceCombinedStreamAdapter,
+    BinanceKlineAdapter,
+    BinanceStreamShards,
+)
+from market_data.adapters.binance.config import (
+    BinanceAggTradeConfig,
+    BinanceCombinedStreamConfig,
+    BinanceKlineConfig,
+)
+from market_data.config import BackpressureConfig
+from market_data.observability import NullLogger, NullMetrics, Observability
+from market_data.pipeline import IngestionPipeline
+from market_data.sharding import assign_shards, required_shard_count
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.events.append(event)
+
+
+class TestAssignShards(unittest.TestCase):
+    def test_symbols_stay_whole_and_respect_cap(self) -> None:
+        counts = {"AAA": 3, "BBB": 3, "CCC": 2, "DDD": 2, "EEE": 1}
+        shard_count = required_shard_count(counts, max_streams_per_shard=5)
+        shards = assign_shards(counts, shard_count=shard_count, max_streams_per_shard=5)
+
+        self.assertEqual(shard_count, 3)
+        self.assertEqual(sorted(symbol for shard in shards for symbol in shard), sorted(counts))
+        for shard in shards:
+            self.assertLessEqual(sum(counts[symbol] for symbol in shard), 5)
+
+    def test_assignment_is_order_independent(self) -> None:
+        counts = {f"S{index}": 1 + index % 3 for index in range(20)}
+        reversed_counts = dict(reversed(list(counts.items())))
+        first = assign_shards(counts, shard_count=4, max_streams_per_shard=20)
+        second = assign_shards(reversed_counts, shard_count=4, max_streams_per_shard=20)
+        self.assertEqual(first, second)
+
+    def test_rejects_symbol_above_cap_and_overflow(self) -> None:
+        with self.assertRaises(ValueError):
+            required_shard_count({"AAA": 6}, max_streams_per_shard=5)
+        with self.assertRaises(ValueError):
+            assign_shards({"AAA": 3, "BBB": 3}, shard_count=1, max_streams_per_shard=5)
+
+
+class TestBinanceStreamShards(unittest.TestCase):
+    def _pipeline(self) -> IngestionPipeline:
+        return IngestionPipeline(
+            sink=RecordingSink(),
+            backpressure=BackpressureConfig(policy="fail", max_pending=1),
+            observability=Observability(logger=NullLogger(), metrics=NullMetrics()),
+            clock_ms=lambda: 100,
+        )
+
+    def _shards(self, symbols, *, shard_count=None) -> BinanceStreamShards:
+        pipeline = self._pipeline()
+
+        def channels_for_symbol(symbol: str):
+            return [
+                BinanceAggTradeAdapter(
+                    config=BinanceAggTradeConfig.default(symbol=symbol), pipeline=pipeline
+                ),
+                BinanceKlineAdapter(
+                    config=BinanceKlineConfig.default(symbol=symbol), pipeline=pipeline
+                ),
+            ]
+
+        return BinanceStreamShards(
+            symbols=symbols,
+            channels_for_symbol=channels_for_symbol,
+            max_streams_per_connection=4,
+            shard_count=shard_count,
+        )
+
+    def test_rebalance_applies_on_reconnect(self) -> None:
+        shards = self._shards(["AAAUSDT", "BBBUSDT"], shard_count=2)
+        connection = BinanceCombinedStreamAdapter(
+            config=BinanceCombinedStreamConfig.default(),
+            pipeline=self._pipeline(),
+            shards=shards,
+            shard_index=0,
+        )
+        before = connection._url()
+        self.assertFalse(connection._routes_stale())
+
+        shards.set_symbols(["AAAUSDT", "BBBUSDT", "CCCUSDT", "DDDUSDT"])
+        self.assertTrue(connection._routes_stale())
+        connection._refresh_routes()
+
+        self.assertFalse(connection._routes_stale())
+        self.assertEqual(len(connection.channels), 4)
+        self.assertNotEqual(before, connection._url())
+        routed = {key.symbol for key in connection.channels}
+        self.assertEqual(routed, set(shards.symbols_for(0)))
+
+    def test_set_symbols_rejects_overflow(self) -> None:
+        shards = self._shards(["AAAUSDT"])
+        self.assertEqual(shards.shard_count, 1)
+        with self.assertRaises(ValueError):
+            shards.set_symbols(["AAAUSDT", "BBBUSDT", "CCCUSDT"])
+
+    def test_growing_symbol_set_uses_headroom_then_rejects(self) -> None:
+        shards = self._shards(["AAAUSDT"], shard_count=2)
+        grown = ["AAAUSDT", "BBBUSDT", "CCCUSDT", "DDDUSDT"]
+
+        shards.set_symbols(grown)
+        self.assertEqual(shards.shard_count, 2)
+        self.assertEqual(sorted(shards.symbols_for(0) + shards.symbols_for(1)), grown)
+        version = shards.version
+
+        with self.assertRaisesRegex(ValueError, "need 3 connections .* only 2 are open"):
+            shards.set_symbols([*grown, "EEEUSDT"])
+        self.assertEqual(shards.version, version)
+        self.assertEqual(sorted(shards.symbols_for(0) + shards.symbols_for(1)), grown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import multiprocessing
+import unittest
+
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+from market_data.shm_ring import (
+    SharedMemoryEventReader,
+    SharedMemoryRawEventSink,
+    SharedMemoryRing,
+)
+from market_data.sink import BackpressureError
+
+
+def _event(recv_ts_ms: int, **overrides) -> RawMarketEvent:
+    fields = dict(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type="TradeTick",
+        source_id="binance",
+        symbol="BTCUSDT",
+        exchange_ts_ms=recv_ts_ms - 5,
+        recv_ts_ms=recv_ts_ms,
+        raw_payload='{"p":"1.0"}',
+        normalized={"price": 1.0, "quantity": 2.0, "side": "buy"},
+        source_event_id=str(recv_ts_ms),
+        source_seq=recv_ts_ms,
+        channel="trades",
+    )
+    fields.update(overrides)
+    return RawMarketEvent(**fields)
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events = []
+
+    def write(self, event, *, block: bool, timeout_ms: int | None) -> None:
+        self.events.append(event)
+
+
+class TestSharedMemoryRing(unittest.TestCase):
+    def _ring(self, capacity: int) -> SharedMemoryRing:
+        ring = SharedMemoryRing(ready=multiprocessing.Event(), capacity=capacity)
+        self.addCleanup(ring.unlink)
+        self.addCleanup(ring.close)
+        return ring
+
+    def test_records_round_trip_across_wrap(self) -> None:
+        ring = self._ring(64)
+        written = []
+        for index in range(40):
+            record = bytes([index]) * (index % 13 + 1)
+            ring.write(record, block=False, timeout_ms=None)
+            written.append(record)
+            if index % 3 == 2:
+                self.assertEqual(ring.read(), written)
+                written = []
+        self.assertEqual(ring.read(), written)
+        self.assertEqual(ring.pending_bytes, 0)
+
+    def test_full_ring_applies_backpressure(self) -> None:
+        ring = self._ring(32)
+        ring.write(b"x" * 20, block=False, timeout_ms=None)
+        with self.assertRaises(BackpressureError):
+            ring.write(b"y" * 20, block=False, timeout_ms=None)
+        with self.assertRaises(BackpressureError):
+            ring.write(b"y" * 20, block=True, timeout_ms=1)
+        with self.assertRaises(ValueError):
+            ring.write(b"z" * 40, block=False, timeout_ms=None)
+        self.assertEqual(ring.read(), [b"x" * 20])
+
+    def test_attached_ring_shares_positions(self) -> None:
+        ring = self._ring(128)
+        attached = SharedMemoryRing(ready=ring.ready, name=ring.name)
+        self.addCleanup(attached.close)
+        attached.write(b"hello", block=False, timeout_ms=None)
+        self.assertTrue(ring.ready.is_set())
+        self.assertEqual(ring.read(), [b"hello"])
+        self.assertEqual(attached.pending_bytes, 0)
+
+
+class TestSharedMemoryEventTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ring = SharedMemoryRing(ready=multiprocessing.Event(), capacity=4096)
+        self.addCleanup(self.ring.unlink)
+        self.addCleanup(self.ring.close)
+        self.sink = SharedMemoryRawEventSink(self.ring)
+        self.downstream = RecordingSink()
+        self.reader = SharedMemoryEventReader(self.ring, self.downstream)
+
+    def test_events_are_rebuilt_in_order(self) -> None:
+        events = [
+            _event(1),
+            _event(2, raw_payload=b"\x00\x01", exchange_ts_ms=None, source_seq=None),
+            _event(3, symbol="ETHUSDT", channel=None, payload_content_type="text/csv"),
+        ]
+        self.sink.write(events[0], block=False, timeout_ms=None)
+        self.sink.write_batch(events[1:], block=False, timeout_ms=None)
+
+        self.reader.start()
+        self.reader.stop()
+
+        self.assertEqual(self.downstream.events, events)
+
+    def test_frames_are_decoded_on_demand(self) -> None:
+        self.sink.write(_event(7), block=False, timeout_ms=None)
+
+        frames = list(self.reader.frames())
+
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(frames[0].recv_ts_ms, 7)
+        self.assertEqual(frames[0].to_event(), _event(7))
+        self.assertEqual(list(self.reader.frames()), [])
+
+    def test_rejected_write_does_not_leak_interned_strings(self) -> None:
+        self.sink.write(_event(1, raw_payload="x" * 3500), block=False, timeout_ms=None)
+        with self.assertRaises(BackpressureError):
+            self.sink.write(
+                _event(2, symbol="ETHUSDT", raw_payload="x" * 1000), block=False, timeout_ms=None
+            )
+        list(self.reader.frames())
+        self.sink.write(_event(3, symbol="ETHUSDT"), block=False, timeout_ms=None)
+
+        frames = list(self.reader.frames())
+
+        self.assertEqual(frames[0].symbol, "ETHUSDT")
@@ -1,7 +1,16 @@
+import hashlib
+import os
+import sys
+import tempfile
+import threading
 import unittest
+from dataclasses import replace
 
+from market_data.columnar import ColumnarEventStore
 from market_data.contracts import RawMarketEvent
+from market_data.payload_store import PayloadStore
 from orchestrator.buffer import BufferFullError, RawInputBuffer
+from orchestrator.config import BufferRetentionConfig, BufferSpillConfig
 
 
 class TestRawInputBuffer(unittest.TestCase):
@@ -39,6 +48,18 @@ class TestRawInputBuffer(unittest.TestCase):
         with self.assertRaises(BufferFullError):
             buffer.append(self._event("BBB"), ingest_ts_ms=20)
 
+    def test_columnar_store_receives_ingest_seq(self) -> None:
+        buffer = RawInputBuffer(max_records=10, columnar=ColumnarEventStore())
+        buffer.append(self._event("AAA"), ingest_ts_ms=10)
+        buffer.append(self._event("BBB"), ingest_ts_ms=11)
+        buffer.append(self._event("AAA"), ingest_ts_ms=12)
+
+        self.assertIsNotNone(buffer.columnar)
+        trades = buffer.columnar.range_by_seq(  # type: ignore[union-attr]
+            "TradeTick", symbol="AAA", start_seq=1, end_seq=3
+        )
+        self.assertEqual(trades["seq"].tolist(), [1, 3])
+
     def test_range_by_symbol_filters(self) -> None:
         buffer = RawInputBuffer(max_records=10)
         buffer.append(self._event("AAA"), ingest_ts_ms=10)
@@ -48,6 +69,237 @@ class TestRawInputBuffer(unittest.TestCase):
         records = buffer.range_by_symbol(symbol="AAA", start_seq=1, end_seq=3)
         self.assertEqual([record.event.symbol for record in records], ["AAA", "AAA"])
 
+    def test_indexed_ranges_match_full_scan(self) -> None:
+        buffer = RawInputBuffer(max_records=200)
+        symbols = ("AAA", "BBB", "CCC")
+        for index in range(120):
+            buffer.append(self._event(symbols[(index * 7) % 5 % 3]), ingest_ts_ms=index)
+
+        for start_seq in (-5, 1, 17, 60, 120, 130):
+            for end_seq in (start_seq, start_seq + 9, 119, 500):
+                if end_seq < start_seq:
+                    continue
+                expected = [
+                    record for record in buffer.records if start_seq <= record.ingest_seq <= end_seq
+                ]
+                self.assertEqual(
+                    buffer.range_by_seq(start_seq=start_seq, end_seq=end_seq), expected
+                )
+                for symbol in (*symbols, "DDD"):
+                    self.assertEqual(
+                        buffer.range_by_symbol(symbol=symbol, start_seq=start_seq, end_seq=end_seq),
+                        [record for record in expected if record.symbol == symbol],
+                    )
+
+    def test_first_seq_for_symbol(self) -> None:
+        buffer = RawInputBuffer(max_records=10)
+        buffer.append(self._event("AAA"), ingest_ts_ms=10)
+        buffer.append(self._event("BBB"), ingest_ts_ms=11)
+
+        self.assertEqual(buffer.first_seq_for_symbol("BBB", end_seq=2), 2)
+        self.assertIsNone(buffer.first_seq_for_symbol("BBB", end_seq=1))
+        self.assertIsNone(buffer.first_seq_for_symbol("CCC", end_seq=2))
+
+    def test_release_evicts_in_chunks_below_watermark(self) -> None:
+        buffer = RawInputBuffer(
+            max_records=5_000,
+            retention=BufferRetentionConfig(max_records=100),
+            columnar=ColumnarEventStore(),
+        )
+        for index in range(3_000):
+            buffer.append(self._event("AAA" if index % 3 else "BBB"), ingest_ts_ms=index)
+
+        self.assertEqual(buffer.release(500), 0)
+        self.assertEqual(buffer.release(2_000), 2_000)
+        self.assertEqual(buffer.evicted_through_seq, 2_000)
+        self.assertEqual(buffer.records[0].ingest_seq, 2_001)
+        self.assertEqual(buffer.range_by_seq(start_seq=1, end_seq=2_002)[0].ingest_seq, 2_001)
+        bbb = buffer.range_by_symbol(symbol="BBB", start_seq=1, end_seq=2_010)
+        self.assertEqual([record.ingest_seq for record in bbb], [2_002, 2_005, 2_008])
+        self.assertEqual(buffer.first_seq_for_symbol("AAA", end_seq=3_000), 2_001)
+        trades = buffer.columnar.range_by_seq(  # type: ignore[union-attr]
+            "TradeTick", symbol="AAA", start_seq=1, end_seq=2_003
+        )
+        self.assertEqual(trades["seq"].tolist(), [2_001, 2_003])
+
+    def test_watermark_respects_pins_and_windows(self) -> None:
+        buffer = RawInputBuffer(
+            max_records=100, retention=BufferRetentionConfig(max_records=10, max_age_ms=50)
+        )
+        for index in range(60):
+            buffer.append(self._event("AAA"), ingest_ts_ms=index * 10)
+        buffer.release(60)
+
+        # Count window keeps seqs 51..60; age window keeps ingest_ts >= 540 (seq 55+).
+        self.assertEqual(buffer.low_watermark(now_ms=590), 50)
+        self.assertEqual(buffer.low_watermark(now_ms=400), 35)
+        with buffer.pinned(21):
+            self.assertEqual(buffer.low_watermark(now_ms=590), 20)
+        self.assertEqual(buffer.low_watermark(now_ms=590), 50)
+        buffer.release(30, now_ms=590)
+        self.assertEqual(buffer.low_watermark(now_ms=590), 50)
+
+    def test_full_buffer_evicts_instead_of_raising(self) -> None:
+        buffer = RawInputBuffer(max_records=20, retention=BufferRetentionConfig(max_records=5))
+        for index in range(20):
+            buffer.append(self._event("AAA"), ingest_ts_ms=index)
+        buffer.release(12)
+
+        record = buffer.append(self._event("AAA"), ingest_ts_ms=20)
+
+        self.assertEqual(record.ingest_seq, 21)
+        self.assertEqual(buffer.evicted_through_seq, 12)
+        self.assertEqual(len(buffer.records), 9)
+        with self.assertRaises(ValueError):
+            buffer.pin(12)
+
+    def test_full_buffer_raises_when_nothing_is_released(self) -> None:
+        buffer = RawInputBuffer(max_records=3, retention=BufferRetentionConfig(max_records=1))
+        for index in range(3):
+            buffer.append(self._event("AAA"), ingest_ts_ms=index)
+        with self.assertRaises(BufferFullError):
+            buffer.append(self._event("AAA"), ingest_ts_ms=3)
+
+    def test_retention_must_fit_capacity(self) -> None:
+        with self.assertRaises(ValueError):
+            RawInputBuffer(max_records=10, retention=BufferRetentionConfig(max_records=10))
+        with self.assertRaises(ValueError):
+            RawInputBuffer(max_records=10, retention=BufferRetentionConfig(max_records=0))
+
+    def test_payload_store_keeps_events_out_of_line(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PayloadStore(tmp)
+            buffer = RawInputBuffer(max_records=10, payload_store=store)
+            frame = '{"e":"markPriceUpdate","p":"1.1","note":"\u00e9"}'
+            events = [
+                replace(self._event("AAA"), raw_payload=frame),
+                replace(self._event("AAA"), raw_payload=frame),
+                replace(self._event("BBB"), raw_payload=b"\x00\xffbinary"),
+            ]
+            records = [buffer.append(event, ingest_ts_ms=10) for event in events]
+
+            self.assertFalse(hasattr(records[0], "__dict__"))
+            digest = hashlib.sha256(frame.encode("utf-8")).hexdigest()
+            self.assertEqual(records[0].event, replace(events[0], payload_hash=digest))
+            self.assertEqual(records[0].compact_event, events[0])
+            self.assertEqual(records[0].symbol, "AAA")
+            selected = buffer.range_by_symbol(symbol="BBB", start_seq=1, end_seq=3)
+            self.assertEqual(selected[0].event.raw_payload, b"\x00\xffbinary")
+            store.close()
+            self.assertFalse(os.path.exists(store.directory))
+
+    def test_eviction_discards_payload_store_segments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PayloadStore(tmp, segment_bytes=1)
+            buffer = RawInputBuffer(
+                max_records=10,
+                payload_store=store,
+                retention=BufferRetentionConfig(max_records=2),
+            )
+            buffer.release(1_000)
+            first = buffer.append(self._event("AAA"), ingest_ts_ms=1)
+            for _ in range(30):
+                buffer.append(self._event("AAA"), ingest_ts_ms=1)
+
+            self.assertLessEqual(store.segment_count, 10)
+            self.assertEqual(store.segment_count, len(buffer.records))
+            with self.assertRaises(ValueError):
+                store.read(first.offset, first.length)
+            self.assertEqual(buffer.records[-1].event.symbol, "AAA")
+            store.close()
+
+
+class TestRawInputBufferConcurrency(unittest.TestCase):
+    PRODUCERS = 12
+    EVENTS_PER_PRODUCER = 5_000
+
+    def setUp(self) -> None:
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    def _event(self, producer: int, index: int) -> RawMarketEvent:
+        return RawMarketEvent(
+            schema="raw_market_event",
+            schema_version="1",
+            event_type="TradeTick",
+            source_id=f"producer-{producer}",
+            symbol=f"SYM{producer % 4}",
+            exchange_ts_ms=index,
+            recv_ts_ms=index,
+            raw_payload=b"{}",
+            normalized={"price": 1.0, "quantity": 1.0, "side": "buy"},
+        )
+
+    def _stress(self, buffer: RawInputBuffer) -> None:
+        start = threading.Barrier(self.PRODUCERS + 1)
+        done = threading.Event()
+        reader_errors: list[str] = []
+
+        def produce(producer: int) -> None:
+            start.wait()
+            for index in range(self.EVENTS_PER_PRODUCER):
+                buffer.append(self._event(producer, index), ingest_ts_ms=index)
+
+        def read() -> None:
+            start.wait()
+            while not done.is_set():
+                last_seq = buffer.last_ingest_seq()
+                if last_seq is None:
+                    continue
+                records = buffer.range_by_seq(start_seq=1, end_seq=last_seq)
+                seqs = [record.ingest_seq for record in records]
+                if seqs != list(range(1, last_seq + 1)):
+                    reader_errors.append(f"gap in prefix ending at {last_seq}")
+                    return
+                symbol_records = buffer.range_by_symbol(
+                    symbol="SYM1", start_seq=1, end_seq=last_seq
+                )
+                symbol_seqs = [record.ingest_seq for record in symbol_records]
+                if symbol_seqs != sorted(symbol_seqs) or any(
+                    seq > last_seq for seq in symbol_seqs
+                ):
+                    reader_errors.append(f"symbol range beyond prefix {last_seq}")
+                    return
+
+        producers = [
+            threading.Thread(target=produce, args=(producer,)) for producer in range(self.PRODUCERS)
+        ]
+        reader = threading.Thread(target=read)
+        for thread in (*producers, reader):
+            thread.start()
+        for thread in producers:
+            thread.join()
+        done.set()
+        reader.join()
+
+        total = self.PRODUCERS * self.EVENTS_PER_PRODUCER
+        records = list(buffer.all_records())
+        self.assertEqual(reader_errors, [])
+        self.assertEqual(buffer.last_ingest_seq(), total)
+        self.assertEqual([record.ingest_seq for record in records], list(range(1, total + 1)))
+        by_producer: dict[str, list[int]] = {}
+        for record in records:
+            by_producer.setdefault(record.event.source_id, []).append(record.ingest_ts_ms)
+        self.assertEqual(len(by_producer), self.PRODUCERS)
+        for indexes in by_producer.values():
+            self.assertEqual(indexes, list(range(self.EVENTS_PER_PRODUCER)))
+
+    def test_concurrent_appends_keep_seq_dense_and_ordered(self) -> None:
+        self._stress(RawInputBuffer(max_records=100_000))
+
+    def test_concurrent_appends_while_spilling(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            buffer = RawInputBuffer(
+                max_records=100_000,
+                spill=BufferSpillConfig(directory=tmp, max_hot_records=2_000, segment_records=512),
+            )
+            try:
+                self._stress(buffer)
+                self.assertGreater(buffer.spilled_records, 0)
+            finally:
+                buffer.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -45,6 +45,20 @@ class TestCutSelector(unittest.TestCase):
         self.assertEqual(cut.cut_start_ingest_seq, 3)
         self.assertEqual(cut.cut_end_ingest_seq, 3)
 
+    def test_low_watermark_waits_for_uncut_symbols(self) -> None:
+        buffer = RawInputBuffer(max_records=10)
+        buffer.append(_event("AAA"), ingest_ts_ms=1)
+        buffer.append(_event("AAA"), ingest_ts_ms=2)
+        buffer.append(_event("BBB"), ingest_ts_ms=3)
+        buffer.append(_event("AAA"), ingest_ts_ms=4)
+
+        selector = CutSelector()
+        selector.next_cut(buffer=buffer, symbol="AAA", cut_end_ingest_seq=4, cut_kind="timer")
+        self.assertEqual(selector.low_watermark(buffer), 2)
+
+        selector.next_cut(buffer=buffer, symbol="BBB", cut_end_ingest_seq=3, cut_kind="timer")
+        self.assertEqual(selector.low_watermark(buffer), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 import unittest
+from dataclasses import replace
 
 from market_data.contracts import RawMarketEvent
 from orchestrator.buffer import RawInputBuffer
+from orchestrator.config import BufferRetentionConfig
 from orchestrator.contracts import EngineRunCompletedPayload, EngineRunRecord
 from orchestrator.replay import replay_events
 from regime_engine.engine import run
@@ -121,6 +123,36 @@ class TestReplay(unittest.TestCase):
             {"TradeTick": 1, "OpenInterest": 1},
         )
 
+    def test_replay_rejects_evicted_cut(self) -> None:
+        buffer = RawInputBuffer(max_records=4, retention=BufferRetentionConfig(max_records=2))
+        for seq in range(1, 5):
+            buffer.append(_trade_event("AAA", seq), ingest_ts_ms=seq)
+        buffer.release(2)
+        buffer.append(_trade_event("AAA", 5), ingest_ts_ms=5)
+        run_record = EngineRunRecord(
+            run_id="run-1",
+            symbol="AAA",
+            engine_timestamp_ms=100,
+            engine_mode="truth",
+            cut_kind="timer",
+            cut_start_ingest_seq=2,
+            cut_end_ingest_seq=3,
+            planned_ts_ms=90,
+            started_ts_ms=91,
+            completed_ts_ms=92,
+            status="completed",
+            attempts=1,
+        )
+
+        with self.assertRaises(ValueError):
+            replay_events(buffer=buffer, run_records=[run_record], engine_runner=run)
+        replayed = replay_events(
+            buffer=buffer,
+            run_records=[replace(run_record, cut_start_ingest_seq=3)],
+            engine_runner=run,
+        )
+        self.assertEqual(replayed.events[-1].cut_start_ingest_seq, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+from market_data.contracts import RawMarketEvent
+from orchestrator.buffer import RawInputBuffer
+from orchestrator.config import BufferRetentionConfig, BufferSpillConfig
+from orchestrator.spill import SpilledRecord, write_spill_segment
+
+
+def _event(symbol: str, index: int) -> RawMarketEvent:
+    return RawMarketEvent(
+        schema="raw_market_event",
+        schema_version="1",
+        event_type="TradeTick" if index % 4 else "OpenInterest",
+        source_id="source",
+        symbol=symbol,
+        exchange_ts_ms=index if index % 5 else None,
+        recv_ts_ms=index,
+        raw_payload=f'{{"i":{index}}}' if index % 2 else bytes([index % 256]) * 3,
+        normalized={"price": float(index), "quantity": 1.0, "side": "buy"},
+        channel="trades" if index % 3 else None,
+    )
+
+
+def _fill(buffer: RawInputBuffer, count: int) -> None:
+    symbols = ("AAA", "BBB", "CCC")
+    for index in range(count):
+        buffer.append(_event(symbols[index * 7 % 3], index), ingest_ts_ms=1_000 + index)
+
+
+def _flatten(records) -> list[tuple[int, int, RawMarketEvent]]:
+    return [(record.ingest_seq, record.ingest_ts_ms, record.event) for record in records]
+
+
+class TestSpillSegment(unittest.TestCase):
+    def test_segment_round_trips_records(self) -> None:
+        reference = RawInputBuffer(max_records=100)
+        _fill(reference, 20)
+        with tempfile.TemporaryDirectory() as tmp:
+            segment = write_spill_segment(os.path.join(tmp, "segment"), reference.records)
+
+            self.assertEqual((segment.first_seq, segment.last_seq), (1, 20))
+            records = segment.range_by_seq(5, 30)
+            self.assertTrue(all(isinstance(record, SpilledRecord) for record in records))
+            self.assertEqual(_flatten(records), _flatten(reference.records[4:]))
+            self.assertEqual(
+                _flatten(segment.range_by_symbol("BBB", 1, 20)),
+                _flatten(reference.range_by_symbol(symbol="BBB", start_seq=1, end_seq=20)),
+            )
+            self.assertIsInstance(records[0].frame.raw_payload, memoryview)
+
+
+class TestSpillingBuffer(unittest.TestCase):
+    def test_ranges_span_both_tiers(self) -> None:
+        reference = RawInputBuffer(max_records=2_000)
+        _fill(reference, 1_000)
+        with tempfile.TemporaryDirectory() as tmp:
+            buffer = RawInputBuffer(
+                max_records=1_000,
+                spill=BufferSpillConfig(directory=tmp, max_hot_records=100, segment_records=64),
+            )
+            _fill(buffer, 1_000)
+            buffer.flush_spill()
+
+            self.assertGreaterEqual(buffer.spilled_records, 832)
+            self.assertLess(len(buffer.records), 164)
+            for start_seq, end_seq in ((1, 1_000), (60, 70), (63, 66), (830, 990), (999, 1_200)):
+                self.assertEqual(
+                    _flatten(buffer.range_by_seq(start_seq=start_seq, end_seq=end_seq)),
+                    _flatten(reference.range_by_seq(start_seq=start_seq, end_seq=end_seq)),
+                )
+                for symbol in ("AAA", "BBB", "CCC", "DDD"):
+                    self.assertEqual(
+                        _flatten(
+                            buffer.range_by_symbol(
+                                symbol=symbol, start_seq=start_seq, end_seq=end_seq
+                            )
+                        ),
+                        _flatten(
+                            reference.range_by_symbol(
+                                symbol=symbol, start_seq=start_seq, end_seq=end_seq
+                            )
+                        ),
+                    )
+            self.assertEqual(buffer.first_seq_for_symbol("BBB", end_seq=1_000), 2)
+            self.assertEqual(buffer.symbols(), ("AAA", "BBB", "CCC"))
+            buffer.close()
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_eviction_drops_spilled_segments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            buffer = RawInputBuffer(
+                max_records=5_000,
+                retention=BufferRetentionConfig(max_records=50),
+                spill=BufferSpillConfig(directory=tmp, max_hot_records=100, segment_records=64),
+            )
+            _fill(buffer, 3_000)
+            buffer.flush_spill()
+            (spill_dir,) = os.listdir(tmp)
+            segments_before = len(os.listdir(os.path.join(tmp, spill_dir)))
+
+            self.assertEqual(buffer.release(2_000), 2_000)
+            buffer.flush_spill()
+
+            self.assertLess(len(os.listdir(os.path.join(tmp, spill_dir))), segments_before)
+            records = buffer.range_by_seq(start_seq=1, end_seq=2_010)
+            self.assertEqual([record.ingest_seq for record in records], list(range(2_001, 2_011)))
+            self.assertEqual(buffer.first_seq_for_symbol("AAA", end_seq=3_000), 2_002)
+            with self.assertRaises(ValueError):
+                buffer.pin(2_000)
+            buffer.close()
+
+    def test_spill_budget_must_fit_capacity(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                RawInputBuffer(
+                    max_records=100,
+                    spill=BufferSpillConfig(directory=tmp, max_hot_records=50, segment_records=50),
+                )
+            with self.assertRaises(ValueError):
+                RawInputBuffer(
+                    max_records=100,
+                    spill=BufferSpillConfig(directory=tmp, max_hot_records=0),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Executor, Future
+
+from market_data.contracts import SCHEMA_NAME, SCHEMA_VERSION, RawMarketEvent
+from order_book import (
+    OrderBook,
+    OrderBookEngine,
+    OrderBookSnapshot,
+    parse_binance_snapshot,
+)
+
+
+class StaticSnapshotProvider:
+    def __init__(self, *snapshots: OrderBookSnapshot) -> None:
+        self._snapshots = list(snapshots)
+        self.calls = []
+
+    def fetch(self, symbol: str) -> OrderBookSnapshot:
+        self.calls.append(symbol)
+        if not self._snapshots:
+            raise RuntimeError("no snapshot")
+        if len(self._snapshots) > 1:
+            return self._snapshots.pop(0)
+        return self._snapshots[0]
+
+
+class BlockingSnapshotProvider(StaticSnapshotProvider):
+    def __init__(self, *snapshots: OrderBookSnapshot) -> None:
+        super().__init__(*snapshots)
+        self.fetching = threading.Event()
+        self.release = threading.Event()
+
+    def fetch(self, symbol: str) -> OrderBookSnapshot:
+        self.fetching.set()
+        self.release.wait(timeout=5)
+        return super().fetch(symbol)
+
+
+class InlineExecutor(Executor):
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _engine(provider) -> OrderBookEngine:
+    return OrderBookEngine(provider, resync_executor=InlineExecutor())
+
+
+def _snapshot(last_seq: int) -> OrderBookSnapshot:
+    return OrderBookSnapshot(
+        symbol="BTCUSDT",
+        last_seq=last_seq,
+        bids=((100.0, 1.0), (99.0, 2.0)),
+        asks=((101.0, 1.5), (102.0, 3.0)),
+    )
+
+
+def _delta(seq: int, *, first_seq: int, prev_seq: int, bids=(), asks=()) -> RawMarketEvent:
+    return RawMarketEvent(
+        schema=SCHEMA_NAME,
+        schema_version=SCHEMA_VERSION,
+        event_type="BookDelta",
+        source_id="binance",
+        symbol="BTCUSDT",
+        exchange_ts_ms=None,
+        recv_ts_ms=seq,
+        raw_payload=b"{}",
+        normalized={
+            "bids": [list(level) for level in bids],
+            "asks": [list(level) for level in asks],
+            "first_seq": first_seq,
+            "prev_seq": prev_seq,
+        },
+        source_seq=seq,
+    )
+
+
+class TestOrderBook(unittest.TestCase):
+    def test_levels_stay_sorted_and_zero_removes(self) -> None:
+        book = OrderBook("BTCUSDT")
+        book.apply(
+            bids=[[100.0, 1.0], [98.0, 1.0], [99.0, 2.0]],
+            asks=[[103.0, 1.0], [101.0, 1.0], [102.0, 2.0]],
+        )
+        book.apply(bids=[[100.0, 0.0], [99.0, 5.0]], asks=[[101.0, 0.0]])
+
+        self.assertEqual(book.top_bids(5), [(99.0, 5.0), (98.0, 1.0)])
+        self.assertEqual(book.top_asks(1), [(102.0, 2.0)])
+        self.assertEqual(book.best_bid(), (99.0, 5.0))
+        self.assertEqual(book.mid_price(), 100.5)
+        self.assertAlmostEqual(book.imbalance(2), (6.0 - 3.0) / 9.0)
+        self.assertIsNone(OrderBook("EMPTY").imbalance(5))
+
+
+class TestOrderBookEngine(unittest.TestCase):
+    def test_syncs_from_snapshot_and_drops_stale_deltas(self) -> None:
+        provider = StaticSnapshotProvider(_snapshot(10))
+        engine = _engine(provider)
+
+        engine.on_event(_delta(8, first_seq=5, prev_seq=4, bids=[(100.0, 9.0)]))
+        engine.on_event(_delta(12, first_seq=9, prev_seq=8, bids=[(100.0, 4.0)]))
+        engine.on_event(_delta(15, first_seq=13, prev_seq=12, asks=[(101.0, 0.0)]))
+
+        status = engine.status("BTCUSDT")
+        self.assertTrue(status.synced)
+        self.assertEqual(status.last_seq, 15)
+        self.assertEqual(status.gap_count, 0)
+        self.assertEqual(provider.calls, ["BTCUSDT"])
+        self.assertEqual(engine.top("BTCUSDT", 1), ([(100.0, 4.0)], [(102.0, 3.0)]))
+
+    def test_book_returns_a_detached_copy(self) -> None:
+        engine = _engine(StaticSnapshotProvider(_snapshot(10)))
+        self.assertIsNone(engine.book("BTCUSDT"))
+        engine.on_event(_delta(12, first_seq=9, prev_seq=8))
+
+        book = engine.book("BTCUSDT")
+        assert book is not None
+        book.apply(bids=[[100.0, 0.0]], asks=[], seq=99)
+        self.assertEqual(book.best_bid(), (99.0, 2.0))
+        self.assertEqual(engine.top("BTCUSDT", 1)[0], [(100.0, 1.0)])
+        self.assertEqual(engine.status("BTCUSDT").last_seq, 12)
+
+    def test_gap_triggers_resync(self) -> None:
+        provider = StaticSnapshotProvider(_snapshot(10), _snapshot(30))
+        engine = _engine(provider)
+        engine.on_event(_delta(12, first_seq=9, prev_seq=8))
+
+        engine.on_event(_delta(20, first_seq=18, prev_seq=17))
+        engine.on_event(_delta(32, first_seq=29, prev_seq=28, bids=[(99.5, 1.0)]))
+
+        status = engine.status("BTCUSDT")
+        self.assertEqual(status.gap_count, 1)
+        self.assertEqual(status.resync_count, 2)
+        self.assertEqual(status.last_seq, 32)
+        self.assertEqual(engine.top("BTCUSDT", 2)[0], [(100.0, 1.0), (99.5, 1.0)])
+
+    def test_unbridged_snapshot_leaves_book_unsynced(self) -> None:
+        provider = StaticSnapshotProvider(_snapshot(10))
+        engine = _engine(provider)
+
+        self.assertFalse(engine.apply_delta("BTCUSDT", bids=[], asks=[], seq=40, first_seq=35))
+        self.assertFalse(engine.status("BTCUSDT").synced)
+        self.assertIsNone(engine.imbalance("BTCUSDT", 5))
+
+    def test_snapshot_failure_is_counted(self) -> None:
+        engine = _engine(StaticSnapshotProvider())
+
+        self.assertFalse(engine.apply_delta("BTCUSDT", bids=[], asks=[], seq=1))
+        self.assertEqual(engine.status("BTCUSDT").resync_failures, 1)
+
+    def test_resync_fetches_outside_the_lock_and_replays_buffered_deltas(self) -> None:
+        provider = BlockingSnapshotProvider(_snapshot(10))
+        engine = OrderBookEngine(provider)
+        self.addCleanup(engine.close)
+
+        engine.on_event(_delta(8, first_seq=5, prev_seq=4))
+        self.assertTrue(provider.fetching.wait(timeout=1))
+        engine.on_event(_delta(12, first_seq=9, prev_seq=8, bids=[(100.0, 4.0)]))
+        engine.on_event(_delta(15, first_seq=13, prev_seq=12, asks=[(101.0, 0.0)]))
+        self.assertFalse(engine.status("BTCUSDT").synced)
+        provider.release.set()
+
+        deadline = time.monotonic() + 5
+        while not engine.status("BTCUSDT").synced and time.monotonic() < deadline:
+            time.sleep(0.001)
+        status = engine.status("BTCUSDT")
+        self.assertTrue(status.synced)
+        self.assertEqual(status.last_seq, 15)
+        self.assertEqual(provider.calls, ["BTCUSDT"])
+        self.assertEqual(engine.top("BTCUSDT", 1), ([(100.0, 4.0)], [(102.0, 3.0)]))
+
+    def test_parse_binance_snapshot(self) -> None:
+        snapshot = parse_binance_snapshot(
+            "BTCUSDT",
+            {"lastUpdateId": 7, "bids": [["1.5", "2"]], "asks": [["2.5", "3"]]},
+        )
+        self.assertEqual(snapshot.last_seq, 7)
+        self.assertEqual(snapshot.bids, ((1.5, 2.0),))
+        with self.assertRaises(ValueError):
+            parse_binance_snapshot("BTCUSDT", {"bids": [], "asks": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from market_data.contracts import RawMarketEvent
+from orchestrator.config import SchedulerConfig
+from orchestrator.contracts import ENGINE_MODE_HYSTERESIS, OrchestratorEvent
+from orchestrator.engine_runner import HysteresisPersistenceError
+from runtime.bus import EventBus
+from runtime.wiring import OrchestratorRuntime
+
+_SYMBOLS = ("ETHUSDT", "BTCUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT")
+
+
+def _trade(symbol: str, index: int) -> RawMarketEvent:
+    return RawMarketEvent(
+        schema="raw_market_event",
+        schema_version="1",
+        event_type="TradeTick",
+        source_id="source",
+        symbol=symbol,
+        exchange_ts_ms=index,
+        recv_ts_ms=index,
+        raw_payload=b"{}",
+        normalized={"price": 100.0 + index % 7, "quantity": 1.0, "side": "buy"},
+        channel="trades",
+    )
+
+
+def _open_interest(symbol: str, index: int) -> RawMarketEvent:
+    return RawMarketEvent(
+        schema="raw_market_event",
+        schema_version="1",
+        event_type="OpenInterest",
+        source_id="source",
+        symbol=symbol,
+        exchange_ts_ms=index,
+        recv_ts_ms=index,
+        raw_payload=b"{}",
+        normalized={"open_interest": 1000.0 + index},
+        channel="open_interest",
+    )
+
+
+def _runtime(
+    engine_workers: int, **kwargs: object
+) -> tuple[OrchestratorRuntime, list[OrchestratorEvent]]:
+    bus = EventBus()
+    published: list[OrchestratorEvent] = []
+    bus.subscribe(OrchestratorEvent, published.append)
+    runtime = OrchestratorRuntime(
+        bus=bus,
+        scheduler_config=SchedulerConfig(mode="timer", timer_interval_ms=1_000),
+        engine_workers=engine_workers,
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return runtime, published
+
+
+def _run_ticks(runtime: OrchestratorRuntime) -> None:
+    for tick in range(3):
+        for index in range(20):
+            for symbol in _SYMBOLS:
+                runtime.handle_raw_event(_trade(symbol, tick * 100 + index))
+        runtime.handle_raw_event(_open_interest(_SYMBOLS[tick], tick * 100))
+        runtime._run_due(planned_ts_ms=(tick + 1) * 180_000)
+
+
+class TestParallelEngineRuns(unittest.TestCase):
+    def test_pool_publishes_the_same_sequence_as_serial(self) -> None:
+        serial, serial_events = _runtime(engine_workers=1)
+        parallel, parallel_events = _runtime(engine_workers=4)
+        self.addCleanup(parallel.stop)
+
+        _run_ticks(serial)
+        _run_ticks(parallel)
+
+        self.assertEqual(len(serial_events), 3 * len(_SYMBOLS) * 2)
+        self.assertEqual(parallel_events, serial_events)
+        self.assertEqual(
+            [event.symbol for event in parallel_events[: 2 * len(_SYMBOLS) : 2]],
+            sorted(_SYMBOLS),
+        )
+
+    def test_pool_runs_symbols_concurrently(self) -> None:
+        runtime, published = _runtime(engine_workers=len(_SYMBOLS))
+        self.addCleanup(runtime.stop)
+        barrier = threading.Barrier(len(_SYMBOLS), timeout=5)
+        run_engine = runtime._engine_runner.run_engine
+
+        def gated_run_engine(snapshot):
+            # Each run waits for every other symbol's run to start.
+            barrier.wait()
+            return run_engine(snapshot)
+
+        runtime._engine_runner.run_engine = gated_run_engine  # type: ignore[method-assign]
+        for symbol in _SYMBOLS:
+            runtime.handle_raw_event(_trade(symbol, 1))
+        runtime._run_due(planned_ts_ms=180_000)
+
+        completed = [event for event in published if event.event_type == "EngineRunCompleted"]
+        self.assertEqual([event.symbol for event in completed], sorted(_SYMBOLS))
+
+    def test_halting_run_stops_later_hysteresis_commits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            runtime, published = _runtime(
+                engine_workers=len(_SYMBOLS),
+                engine_mode=ENGINE_MODE_HYSTERESIS,
+                hysteresis_state_path=os.path.join(tmp, "hysteresis.jsonl"),
+            )
+            self.addCleanup(runtime.stop)
+            halting_symbol = sorted(_SYMBOLS)[2]
+            engine_symbols: list[str] = []
+            run_engine = runtime._engine_runner.run_engine
+
+            def halting_run_engine(snapshot):
+                engine_symbols.append(snapshot.symbol)
+                if snapshot.symbol == halting_symbol:
+                    raise HysteresisPersistenceError("disk full")
+                return run_engine(snapshot)
+
+            runtime._engine_runner.run_engine = halting_run_engine  # type: ignore[method-assign]
+            for symbol in _SYMBOLS:
+                runtime.handle_raw_event(_trade(symbol, 1))
+            runtime._scheduler_running = True
+            runtime._run_due(planned_ts_ms=180_000)
+
+            self.assertEqual(engine_symbols, sorted(_SYMBOLS)[:3])
+            self.assertEqual(
+                sorted(runtime._engine_runner.hysteresis_store.store.states),
+                sorted(_SYMBOLS)[:2],
+            )
+            self.assertFalse(runtime._scheduler_running)
+            completed = [
+                event.symbol for event in published if event.event_type == "EngineRunCompleted"
+            ]
+            self.assertEqual(completed, sorted(_SYMBOLS)[:2])
+
+    def test_columnar_runs_report_the_same_counts(self) -> None:
+        rows, row_events = _runtime(engine_workers=1)
+        columnar, columnar_events = _runtime(engine_workers=1, columnar_features=True)
+
+        _run_ticks(rows)
+        _run_ticks(columnar)
+
+        self.assertEqual(len(columnar_events), len(row_events))
+        self.assertEqual(
+            [list((event.counts_by_event_type or {}).items()) for event in columnar_events],
+            [list((event.counts_by_event_type or {}).items()) for event in row_events],
+        )
+        self.assertIn({"TradeTick": 20, "OpenInterest": 1}, [
+            event.counts_by_event_type for event in columnar_events
+        ])
+
+    def test_engine_workers_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            OrchestratorRuntime(bus=EventBus(), engine_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()